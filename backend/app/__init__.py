@@ -0,0 +1,4 @@
+import time
+
+# Reference point for the import/startup timings reported on /metrics
+IMPORT_STARTED_AT = time.perf_counter()
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from typing import List
-from ..core.database import get_db
+from ..core.database import get_async_db_session, get_db
 from ..models.company_model import Company
 from ..schemas.company_schema import CompanyCreate, CompanyResponse
 
@@ -23,9 +25,12 @@ def read_company(company_id: int, db: Session = Depends(get_db)):
     return company
 
 @router.get("/", response_model=List[CompanyResponse])
-def read_companies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    companies = db.query(Company).offset(skip).limit(limit).all()
-    return companies
+async def read_companies(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db_session)):
+    # AsyncSession can't lazy-load, so fetch each page's jobs up front
+    result = await db.execute(
+        select(Company).options(selectinload(Company.jobs)).offset(skip).limit(limit)
+    )
+    return result.scalars().all()
 
 @router.put("/{company_id}", response_model=CompanyResponse)
 def update_company(company_id: int, company: CompanyCreate, db: Session = Depends(get_db)):
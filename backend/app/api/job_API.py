@@ -1,23 +1,44 @@
 # backend/app/api/job_API.py
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..core.database import get_db_session
-from ..models.job_model import Job
-from ..schemas.job_schema import JobCreate, JobResponse, PaginatedJobResponse
-from ..services.theirstack_api import sync_jobs
-from ..utils.location_utils import get_coordinates_from_zip as get_coordinates, calculate_distance
-import markdown
-import bleach
+from starlette.concurrency import run_in_threadpool
+from typing import List, Literal, Optional
+from datetime import datetime, timezone
+from ..core.config import settings
+from ..core.database import get_async_db_session, get_db_session, SessionLocal
+from ..models.job_model import Job, JobFunction
+from ..schemas.job_schema import JobCreate, JobResponse, JobSummary, PaginatedJobSummaryResponse
+from ..services.task_runner import task_runner, TaskConflictError
+from ..utils.location_utils import get_coordinates_from_zip as get_coordinates, bounding_box, haversine_distances
+from ..utils.geocode_cache import geocode_cache
+from ..utils.zip_centroids import zip_centroids
+from ..utils.http_cache import ConditionalGet
+from ..utils.response_cache import listing_cache
+from ..utils.table_versions import bump_table_version, get_table_version, on_table_change
+from ..services.job_export import EXPORT_FORMATS, parse_columns, stream_jobs
+from ..services.job_search import search_jobs
+from ..services.job_summary import SUMMARY_COLUMNS, dumps, summaries, summary_dict
+from ..utils.pagination import encode_cursor, decode_cursor, encode_rank_cursor, decode_rank_cursor
+import numpy as np
+import time
 
 router = APIRouter()
 
+# GET /jobs order, the same on every database (PostgreSQL would otherwise
+# put NULL posted_dates first)
+LISTING_ORDER = (Job.posted_date.desc().nulls_last(), Job.id.desc())
+
 @router.post("/", response_model=JobResponse)
 def create_job(job: JobCreate, db: Session = Depends(get_db_session)):
     """Create a new job listing"""
     try:
         # Convert the job model to a dictionary
-        job_data = job.dict()
+        # Leave unset fields out so column defaults (posted_date) apply
+        job_data = {field: value for field, value in job.dict().items() if value is not None}
         
         # Get coordinates from postal code if provided
         if job_data.get('postal_code'):
@@ -28,9 +49,14 @@ def create_job(job: JobCreate, db: Session = Depends(get_db_session)):
             else:
                 print(f"Could not get coordinates for ZIP {job_data['postal_code']}")
         
+        # Plain-text preview for list views
+        from ..utils.html_utils import description_snippet
+        job_data['snippet'] = description_snippet(job_data.get('description'))
+        
         # Create the job
         db_job = Job(**job_data)
         db.add(db_job)
+        bump_table_version(db, "jobs")
         db.commit()
         db.refresh(db_job)
         return db_job
@@ -38,159 +64,401 @@ def create_job(job: JobCreate, db: Session = Depends(get_db_session)):
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{job_id}", response_model=JobResponse)
-def read_job(job_id: int, db: Session = Depends(get_db_session)):
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if job is None:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job
+class JobFilters:
+    """Query filters shared by the listing endpoints; each is backed by an index on Job"""
 
-@router.get("/", response_model=PaginatedJobResponse)
-def read_jobs(
-    skip: int = Query(0, description="Number of jobs to skip"),
-    limit: int = Query(25, description="Number of jobs to return"),
-    db: Session = Depends(get_db_session)
+    def __init__(
+        self,
+        job_function: Optional[JobFunction] = Query(None, description="Only jobs with this function"),
+        state: Optional[str] = Query(None, min_length=2, max_length=2, description="Two-letter state code"),
+        city: Optional[str] = Query(None, description="City name (use together with state)"),
+        employment_type: Optional[str] = Query(None, description="e.g. full_time"),
+        remote_type: Optional[str] = Query(None, description="e.g. onsite"),
+        is_active: bool = Query(True, description="Active (true) or retired (false) postings"),
+        posted_since: Optional[datetime] = Query(None, description="Only jobs posted at or after this date/time")
+    ):
+        self.job_function = job_function
+        self.state = state.upper() if state else None
+        self.city = city
+        self.employment_type = employment_type
+        self.remote_type = remote_type
+        self.is_active = is_active
+        if posted_since is not None and posted_since.tzinfo is None:
+            posted_since = posted_since.replace(tzinfo=timezone.utc)
+        self.posted_since = posted_since
+
+    def apply(self, query):
+        query = query.filter(Job.is_active.is_(self.is_active))
+        if self.job_function:
+            query = query.filter(Job.job_function == self.job_function)
+        if self.state:
+            query = query.filter(Job.state == self.state)
+        if self.city:
+            query = query.filter(Job.city == self.city)
+        if self.employment_type:
+            query = query.filter(Job.employment_type == self.employment_type)
+        if self.remote_type:
+            query = query.filter(Job.remote_type == self.remote_type)
+        if self.posted_since:
+            query = query.filter(Job.posted_date >= self.posted_since)
+        return query
+
+    def cache_key(self) -> tuple:
+        return (
+            self.job_function.value if self.job_function else None, self.state, self.city,
+            self.employment_type, self.remote_type, self.is_active,
+            self.posted_since.isoformat() if self.posted_since else None
+        )
+
+# Cached counts for GET /jobs keyed by filters: {key: (count, expires_at)}
+_job_count_cache = {}
+JOB_COUNT_CACHE_MAX_KEYS = 256
+on_table_change("jobs", _job_count_cache.clear)
+
+async def get_cached_job_count(db: AsyncSession, filters: JobFilters) -> int:
+    """Matching job count, recomputed at most every JOB_COUNT_CACHE_SECONDS"""
+    now = time.monotonic()
+    key = filters.cache_key()
+    cached = _job_count_cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    
+    count = await db.scalar(filters.apply(select(func.count(Job.id))))
+    if len(_job_count_cache) >= JOB_COUNT_CACHE_MAX_KEYS:
+        _job_count_cache.clear()
+    _job_count_cache[key] = (count, now + settings.JOB_COUNT_CACHE_SECONDS)
+    return count
+
+@router.get("/", response_model=PaginatedJobSummaryResponse)
+async def read_jobs(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Number of jobs to skip (offset mode)"),
+    limit: int = Query(25, ge=1, le=100, description="Number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset mode)"),
+    include_total: bool = Query(True, description="Include the (cached) total job count"),
+    filters: JobFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
-    try:
-        print("\nAttempting to fetch jobs from database...")
-        
-        # Get total count for pagination
-        total_count = db.query(Job).count()
-        print(f"Total count: {total_count}")
+    """
+    Jobs newest first, optionally filtered. Pass `cursor` to page by
+    (posted_date, id), which costs the same at any depth; without it
+    `skip` is used as an offset. Both modes return a next_cursor.
+    Conditional requests (If-None-Match / If-Modified-Since) get a 304
+    without querying while the jobs table is unchanged, and serialized
+    pages are reused from the listing cache until it changes.
+    """
+    conditional = ConditionalGet(request, "jobs", await get_table_version("jobs"))
+    not_modified = conditional.not_modified()
+    if not_modified:
+        return not_modified
+    
+    async def build_page() -> bytes:
+        query = filters.apply(select(*SUMMARY_COLUMNS))
+        cursor_date = None
+        if cursor:
+            try:
+                cursor_date, cursor_id = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            if cursor_date is None:
+                query = query.filter(Job.posted_date.is_(None), Job.id < cursor_id)
+            else:
+                query = query.filter(tuple_(Job.posted_date, Job.id) < (cursor_date, cursor_id))
         
-        # Simplified query - just order by id
-        jobs = db.query(Job).order_by(Job.id.desc()).offset(skip).limit(limit).all()
+        query = query.order_by(*LISTING_ORDER)
+        if not cursor and skip:
+            query = query.offset(skip)
+        jobs = (await db.execute(query.limit(limit))).all()
         
-        print(f"Found {len(jobs)} jobs")
+        # Undated jobs sort last. The tuple comparison never matches them,
+        # so a dated cursor continues into them with a separate query
+        # rather than an OR that would keep the index from serving the page
+        if cursor_date is not None and len(jobs) < limit:
+            undated = filters.apply(select(*SUMMARY_COLUMNS)).filter(Job.posted_date.is_(None))
+            jobs += (await db.execute(undated.order_by(Job.id.desc()).limit(limit - len(jobs)))).all()
         
-        # Debug information about jobs
-        for job in jobs:
-            print(f"Job ID: {job.id}")
-            print(f"Title: {job.job_title}")
-            print(f"Function: {job.job_function}")
-            print("---")
+        next_cursor = None
+        if len(jobs) == limit:
+            next_cursor = encode_cursor(jobs[-1].posted_date, jobs[-1].id)
         
-        return {
-            "items": jobs,
-            "total": total_count,
+        return dumps({
+            "items": summaries(jobs),
+            "total": await get_cached_job_count(db, filters) if include_total else None,
             "skip": skip,
-            "limit": limit
-        }
+            "limit": limit,
+            "next_cursor": next_cursor
+        })
+    
+    try:
+        key = ("jobs", skip, limit, cursor, include_total, filters.cache_key())
+        body = await listing_cache.get_or_compute(key, conditional.version, build_page)
+        return Response(content=body, media_type="application/json", headers=conditional.headers)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"\nDetailed error in read_jobs:")
         print(f"Error type: {type(e).__name__}")
         print(f"Error message: {str(e)}")
         import traceback
         print(f"Traceback:\n{traceback.format_exc()}")
-        
-        # Try to get more information about the jobs that might be causing issues
-        try:
-            all_jobs = db.query(Job).all()
-            print(f"\nTotal jobs in database: {len(all_jobs)}")
-            for job in all_jobs:
-                print(f"Job {job.id}: {job.job_title} (function: {job.job_function})")
-        except Exception as inner_e:
-            print(f"Error while trying to debug: {str(inner_e)}")
-        
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
-@router.post("/sync")
-async def sync_theirstack_jobs():
+@router.get("/search", response_model=PaginatedJobSummaryResponse)
+def search_jobs_by_keyword(
+    q: str = Query(..., min_length=1, description="Keywords to match against job titles and descriptions"),
+    zip_code: Optional[str] = Query(None, description="Only jobs near this ZIP code"),
+    radius: float = Query(25, gt=0, description="Search radius in miles (with zip_code)"),
+    limit: int = Query(25, ge=1, le=100, description="Number of jobs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    filters: JobFilters = Depends(),
+    db: Session = Depends(get_db_session)
+):
+    """
+    Full-text job search, best match first. Combines with the listing
+    filters and, given a zip_code, a radius search in the same query.
+    """
     try:
-        jobs_synced = sync_jobs()
-        return {"message": f"Successfully synced {jobs_synced} jobs from TheirStack"}
+        after = None
+        if cursor:
+            try:
+                after = decode_rank_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        
+        origin = None
+        if zip_code:
+            origin = get_coordinates(zip_code)
+            if not origin:
+                raise HTTPException(status_code=400, detail="Invalid ZIP code")
+        
+        results = search_jobs(db, q, filters=filters, origin=origin, radius=radius, limit=limit, after=after)
+        
+        jobs = []
+        for job, rank, distance in results:
+            if distance is not None:
+                job["distance"] = round(distance, 2)
+            jobs.append(job)
+        
+        next_cursor = None
+        if len(results) == limit:
+            last_job, last_rank, _ = results[-1]
+            next_cursor = encode_rank_cursor(last_rank, last_job["id"])
+        
+        return Response(content=dumps({
+            "items": jobs,
+            "total": None,
+            "skip": 0,
+            "limit": limit,
+            "next_cursor": next_cursor
+        }), media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
+        print(f"Error searching jobs: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/cleanup-theirstack")
-async def cleanup_and_resync_theirstack(db: Session = Depends(get_db_session)):
+@router.get("/export")
+async def export_jobs(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    columns: Optional[str] = Query(None, description="Comma-separated columns to include (default: all)"),
+    filters: JobFilters = Depends()
+):
+    """Stream every job matching the listing filters, ordered by id"""
+    try:
+        names = parse_columns(columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(
+        stream_jobs(format, names, filters),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'}
+    )
+
+# Defined after the other single-segment GET routes, which it would otherwise shadow
+@router.get("/{job_id}", response_model=JobResponse)
+async def read_job(job_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_async_db_session)):
+    conditional = ConditionalGet(request, "jobs", await get_table_version("jobs"))
+    not_modified = conditional.not_modified()
+    if not_modified:
+        return not_modified
+    
+    job = await db.get(Job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    conditional.apply(response)
+    return job
+
+def submit_task(kind: str, func, *args, exclusive: str = None, **kwargs):
+    """Hand a long operation to the background runner and return its task id"""
+    try:
+        task = task_runner.submit(kind, func, *args, exclusive=exclusive, **kwargs)
+    except TaskConflictError as e:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(e), "task_id": e.task["id"]}
+        )
+    return {
+        "task_id": task["id"],
+        "status": task["status"],
+        "status_url": f"{settings.API_V1_STR}/jobs/tasks/{task['id']}"
+    }
+
+def run_cleanup_theirstack(report):
+    """Delete TheirStack jobs and re-ingest them (background task)"""
+    from ..services.theirstack_api import sync_jobs
+    db = SessionLocal()
     try:
         # Only delete jobs that have an external_id (TheirStack jobs)
         print("\nDeleting existing TheirStack jobs...")
         deleted_count = db.query(Job).filter(Job.external_id.isnot(None)).delete()
+        bump_table_version(db, "jobs")
         db.commit()
         print(f"Deleted {deleted_count} TheirStack jobs")
+        report(deleted=deleted_count)
         
         # Re-sync with TheirStack
         print("\nStarting sync...")
-        jobs_synced = sync_jobs()
+        jobs_synced = sync_jobs(mode="full", report=report)
         
-        # Verify jobs were added and are still there
-        theirstack_count = db.query(Job).filter(Job.external_id.isnot(None)).count()
         manual_count = db.query(Job).filter(Job.external_id.is_(None)).count()
-        
-        print(f"\nVerification after sync:")
-        print(f"TheirStack jobs: {theirstack_count}")
-        print(f"Manually posted jobs: {manual_count}")
-        print(f"Total jobs: {theirstack_count + manual_count}")
-        
         return {
             "message": f"Successfully cleaned up TheirStack jobs and re-synced {jobs_synced} jobs",
             "theirstack_jobs_deleted": deleted_count,
             "theirstack_jobs_synced": jobs_synced,
             "manual_jobs_preserved": manual_count
         }
-    except Exception as e:
-        print(f"\nError during cleanup/sync: {str(e)}")
+    except Exception:
         db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+        raise
+    finally:
+        db.close()
 
-# Keep the original cleanup endpoint for full database wipes if needed
-@router.post("/cleanup")
-async def cleanup_and_resync(db: Session = Depends(get_db_session)):
+def run_cleanup_all(report):
+    """Delete every job and re-ingest from TheirStack (background task)"""
+    from ..services.theirstack_api import sync_jobs
+    db = SessionLocal()
     try:
         print("\nDeleting ALL jobs...")
         deleted_count = db.query(Job).delete()
+        bump_table_version(db, "jobs")
         db.commit()
         print(f"Deleted {deleted_count} jobs")
+        report(deleted=deleted_count)
         
         print("\nStarting sync...")
-        jobs_synced = sync_jobs()
-        
-        final_count = db.query(Job).count()
-        print(f"\nVerification after sync:")
-        print(f"Jobs synced: {jobs_synced}")
-        print(f"Final job count: {final_count}")
-        
+        jobs_synced = sync_jobs(mode="full", report=report)
         return {
             "message": f"Successfully cleaned up ALL jobs and re-synced {jobs_synced} jobs from TheirStack",
             "jobs_deleted": deleted_count,
             "jobs_synced": jobs_synced
         }
-    except Exception as e:
-        print(f"\nError during cleanup/sync: {str(e)}")
+    except Exception:
         db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+        raise
+    finally:
+        db.close()
+
+@router.post("/sync", status_code=202)
+async def sync_theirstack_jobs(
+    mode: Literal["incremental", "full"] = Query("incremental", description="incremental: postings since the last sync; full: whole window, retiring vanished postings")
+):
+    """Start a TheirStack sync in the background; poll status_url for progress"""
+    # The ingest stack (markdown, bleach, OpenAI) is imported on first use
+    # to keep it off the cold-start path
+    from ..services.theirstack_api import sync_jobs
+    return submit_task(f"sync:{mode}", sync_jobs, mode=mode, exclusive="sync")
+
+@router.post("/cleanup-theirstack", status_code=202)
+async def cleanup_and_resync_theirstack():
+    """Start a delete-and-resync of TheirStack jobs in the background"""
+    return submit_task("cleanup-theirstack", run_cleanup_theirstack, exclusive="sync")
+
+# Keep the original cleanup endpoint for full database wipes if needed
+@router.post("/cleanup", status_code=202)
+async def cleanup_and_resync():
+    """Start a delete-everything-and-resync in the background"""
+    return submit_task("cleanup", run_cleanup_all, exclusive="sync")
 
-@router.get("/search/location")
-def search_jobs_by_location(
+@router.get("/tasks/{task_id}")
+def read_task(task_id: str):
+    """Status, progress counts, result and error of a background task"""
+    task = task_runner.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+async def find_jobs_near(db: AsyncSession, zip_code: str, radius: float, skip: int, limit: int) -> List[dict]:
+    """Summaries of jobs within radius miles of zip_code, nearest first, for one page"""
+    # Get coordinates for the search ZIP code from the offline table; only
+    # ZIPs it lacks are geocoded, which blocks, so that runs in the threadpool
+    search_coords = zip_centroids.lookup(zip_code) or await run_in_threadpool(get_coordinates, zip_code)
+    if not search_coords:
+        raise HTTPException(status_code=400, detail="Invalid ZIP code")
+    
+    search_lat, search_lon = search_coords
+    
+    # Prefilter on the indexed lat/lon columns so only nearby candidates
+    # leave the database, and only their coordinates at that. Retired
+    # postings are left out, as in the other listings
+    min_lat, max_lat, min_lon, max_lon = bounding_box(search_lat, search_lon, radius)
+    candidates = (await db.execute(
+        select(Job.id, Job.latitude, Job.longitude).where(
+            Job.is_active.is_(True),
+            Job.latitude.between(min_lat, max_lat),
+            Job.longitude.between(min_lon, max_lon)
+        )
+    )).all()
+    if not candidates:
+        return []
+    
+    # Exact distance for every candidate in one pass, then sort and page
+    ids = np.array([c.id for c in candidates], dtype=np.int64)
+    distances = haversine_distances(
+        search_lat, search_lon,
+        [c.latitude for c in candidates],
+        [c.longitude for c in candidates]
+    )
+    within = distances <= radius
+    ids, distances = ids[within], distances[within]
+    order = np.argsort(distances, kind="stable")[skip:skip + limit]
+    if order.size == 0:
+        return []
+    
+    # Load summary columns only for the requested page
+    page_ids = ids[order].tolist()
+    jobs_by_id = {
+        row.id: summary_dict(row)
+        for row in (await db.execute(select(*SUMMARY_COLUMNS).where(Job.id.in_(page_ids)))).all()
+    }
+    
+    results = []
+    for job_id, distance in zip(page_ids, distances[order].tolist()):
+        job = jobs_by_id.get(job_id)
+        if job is not None:
+            job["distance"] = round(distance, 2)
+            results.append(job)
+    return results
+
+@router.get("/search/location", response_model=List[JobSummary])
+async def search_jobs_by_location(
     zip_code: str = Query(..., description="ZIP code to search around"),
-    radius: float = Query(25, description="Search radius in miles"),
-    db: Session = Depends(get_db_session)
+    radius: float = Query(25, gt=0, description="Search radius in miles"),
+    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    limit: int = Query(100, ge=1, le=500, description="Number of jobs to return"),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
+    """Jobs within `radius` miles of `zip_code`, nearest first"""
+    async def build_results() -> bytes:
+        return dumps(await find_jobs_near(db, zip_code, radius, skip, limit))
+    
     try:
-        # Get coordinates for the search ZIP code
-        search_coords = get_coordinates(zip_code)
-        if not search_coords:
-            raise HTTPException(status_code=400, detail="Invalid ZIP code")
-        
-        search_lat, search_lon = search_coords
-        
-        # Get all jobs
-        jobs = db.query(Job).all()
-        
-        # Filter jobs by distance
-        jobs_with_distance = []
-        for job in jobs:
-            if job.latitude and job.longitude:
-                distance = calculate_distance(
-                    search_lat, search_lon,
-                    job.latitude, job.longitude
-                )
-                if distance <= radius:
-                    jobs_with_distance.append(job)
-        
-        return jobs_with_distance
+        version = await get_table_version("jobs")
+        key = ("location", zip_code.strip(), radius, skip, limit)
+        body = await listing_cache.get_or_compute(key, version[0] if version else None, build_results)
+        return Response(content=body, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error searching jobs by location: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -209,34 +477,22 @@ def debug_job_coordinates(db: Session = Depends(get_db_session)):
         })
     return {"jobs": job_info}
 
-@router.post("/reclassify-all")
-def reclassify_all_jobs(db: Session = Depends(get_db_session)):
-    """Reclassify all jobs in the database using the OpenAI classifier"""
-    try:
-        print("\nStarting job reclassification...")
-        jobs = db.query(Job).all()
-        total_jobs = len(jobs)
-        reclassified_count = 0
-        
-        for job in jobs:
-            try:
-                from ..utils.job_classifier import classify_job_function
-                new_classification = classify_job_function(job.job_title)
-                if new_classification:
-                    job.job_function = new_classification
-                    reclassified_count += 1
-                    print(f"Reclassified job {job.id} ({job.job_title}) as {new_classification}")
-            except Exception as e:
-                print(f"Error classifying job {job.id}: {str(e)}")
-                continue
-        
-        db.commit()
-        return {
-            "message": f"Successfully reclassified {reclassified_count} out of {total_jobs} jobs",
-            "total_jobs": total_jobs,
-            "reclassified_count": reclassified_count
-        }
-    except Exception as e:
-        db.rollback()
-        print(f"Error during reclassification: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+@router.get("/debug/geocode-cache")
+def debug_geocode_cache():
+    """Hit/miss counters for the geocoding cache and the offline ZIP table"""
+    return {**geocode_cache.stats(), "zip_centroids": zip_centroids.stats()}
+
+@router.get("/debug/response-cache")
+def debug_response_cache():
+    """Hit/miss counters for the listing response cache"""
+    return listing_cache.stats()
+
+@router.post("/reclassify-all", status_code=202)
+def reclassify_all_jobs(
+    scope: Literal["stale", "unclassified", "all"] = Query("stale", description="stale: unclassified or classified by an older model"),
+    restart: bool = Query(False, description="Start over instead of resuming an interrupted run")
+):
+    """Start (or resume) reclassifying jobs in the background; poll status_url for progress"""
+    # The classifier (OpenAI client) is imported on first use
+    from ..services.reclassify import reclassify_jobs
+    return submit_task(f"reclassify:{scope}", reclassify_jobs, scope=scope, restart=restart, exclusive="reclassify")
@@ -1,13 +1,18 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import stripe
 import os
 from dotenv import load_dotenv
+from ..core.metrics import track_external
 
 load_dotenv()
 
-# Initialize Stripe with your secret key
-stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+def get_stripe():
+    """Import and configure stripe on first use; the import alone is ~0.3s of cold start"""
+    import stripe
+    if not stripe.api_key:
+        # Initialize Stripe with your secret key
+        stripe.api_key = os.getenv('STRIPE_SECRET_KEY')
+    return stripe
 
 router = APIRouter()
 
@@ -17,16 +22,18 @@ class PaymentIntentRequest(BaseModel):
 
 @router.post("/create-intent")
 async def create_payment_intent(request: PaymentIntentRequest):
+    stripe = get_stripe()
     try:
         # Create a PaymentIntent with the order amount and currency
-        intent = stripe.PaymentIntent.create(
-            amount=request.amount,
-            currency='usd',
-            payment_method=request.payment_method_id,
-            confirmation_method='manual',
-            confirm=True,
-            return_url='http://localhost:3000/post-job/success'
-        )
+        with track_external("stripe"):
+            intent = stripe.PaymentIntent.create(
+                amount=request.amount,
+                currency='usd',
+                payment_method=request.payment_method_id,
+                confirmation_method='manual',
+                confirm=True,
+                return_url='http://localhost:3000/post-job/success'
+            )
         
         return {
             "client_secret": intent.client_secret,
@@ -53,6 +60,7 @@ async def create_payment_intent(request: PaymentIntentRequest):
 
 @router.post("/webhook")
 async def stripe_webhook(request: dict):
+    stripe = get_stripe()
     try:
         event = stripe.Event.construct_from(
             request,
@@ -1,35 +1,54 @@
 # backend/app/api/user_API.py
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..core.database import get_db
-from ..core.security import create_access_token, verify_password
+from ..core.config import settings
+from ..core.database import get_async_db_session, get_db
+from ..core.security import create_access_token, hash_password, verify_and_update_password
 from ..models.user_model import User
 from ..schemas.user_schema import UserCreate, UserResponse, Token
-from passlib.context import CryptContext
 
 router = APIRouter()  # Ensure this line is present
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Sign-ups and logins hashing at once. Each holds a slot while its bcrypt
+# work queues for the hashing pool, so a burst waits here (and is turned
+# away after LOGIN_QUEUE_TIMEOUT_SECONDS) instead of piling up unbounded.
+_login_slots = asyncio.Semaphore(max(1, settings.LOGIN_CONCURRENCY))
+
+@asynccontextmanager
+async def login_slot():
+    try:
+        await asyncio.wait_for(_login_slots.acquire(), timeout=settings.LOGIN_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"}
+        )
+    try:
+        yield
+    finally:
+        _login_slots.release()
 
 # backend/app/api/user_API.py
 
 @router.post("/", response_model=UserResponse)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db_session)):
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    hashed_password = pwd_context.hash(user.password)  # Hash the password
+    async with login_slot():
+        hashed_password = await hash_password(user.password)  # Hash the password
     new_user = User(email=user.email, hashed_password=hashed_password)
 
-    # If the user is associated with a company, set the company_id
-    if user.company_id:  # Assuming UserCreate has a company_id field
-        new_user.company_id = user.company_id
-
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return new_user
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -40,10 +59,20 @@ def read_user(user_id: int, db: Session = Depends(get_db)):
     return user
 
 @router.post("/login", response_model=Token)
-def login(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+async def login(user: UserCreate, db: AsyncSession = Depends(get_async_db_session)):
+    db_user = await db.scalar(select(User).where(User.email == user.email))
+    if not db_user:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     
+    async with login_slot():
+        valid, new_hash = await verify_and_update_password(user.password, db_user.hashed_password)
+    if not valid:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    
+    if new_hash:
+        # Stored with an outdated bcrypt cost; upgrade it now that we have the password
+        db_user.hashed_password = new_hash
+        await db.commit()
+    
     access_token = create_access_token(data={"sub": db_user.email})
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
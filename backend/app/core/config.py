@@ -6,6 +6,11 @@ import os
 class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str
+    DB_ECHO: bool = True  # Log SQL statements (always off with FAST_STARTUP)
+    
+    # Production cold-start mode: create the engine on first use, run
+    # connection diagnostics in the background, skip schema creation
+    FAST_STARTUP: bool = False
     
     # API settings
     THEIRSTACK_API_KEY: str
@@ -14,11 +19,53 @@ class Settings(BaseSettings):
     STRIPE_SECRET_KEY: str
     GOOGLE_MAPS_API_KEY: str
     
+    # TheirStack sync settings
+    SYNC_MAX_JOBS: int = 2000  # Most postings fetched per sync; a full sync that hits it skips reconciliation
+    THEIRSTACK_PAGE_SIZE: int = 100  # Postings per request; pages are fetched until a short one
+    THEIRSTACK_CONCURRENCY: int = 4  # Pages in flight at once
+    THEIRSTACK_RATE_LIMIT_PER_SECOND: float = 2.0  # Request starts per second
+    THEIRSTACK_MAX_RETRIES: int = 3
+    THEIRSTACK_BACKOFF_BASE_SECONDS: float = 1.0
+    DEDUPE_SIMHASH_MAX_DISTANCE: int = 8  # Description SimHash bits (of 64) two copies of a posting may differ by
+    
+    # Geocoding settings
+    GEOCODE_CACHE_SIZE: int = 10000  # In-process LRU entries
+    GEOCODE_NEGATIVE_TTL_SECONDS: int = 86400  # How long "no result" answers are cached
+    GEOCODE_CONCURRENCY: int = 8  # Google lookups in flight at once during a sync
+    GEOCODE_TIMEOUT_SECONDS: float = 10.0  # Per-request timeout for Google lookups
+    ZIP_CENTROIDS_AUTO_BUILD: bool = False  # Build a missing table in the background (downloads GeoNames; the image ships one)
+    
+    # Job title classifier settings
+    OPENAI_CLASSIFIER_MODEL: str = "gpt-3.5-turbo"
+    CLASSIFIER_BATCH_SIZE: int = 50  # Titles per chat completion
+    CLASSIFIER_CONCURRENCY: int = 4  # Chat completions in flight at once
+    CLASSIFIER_RATE_LIMIT_PER_SECOND: float = 2.0  # Chat completion starts per second
+    RECLASSIFY_CHUNK_SIZE: int = 500  # Jobs classified and committed per checkpoint
+    
+    # Seconds a GET /jobs total count is reused before recounting
+    JOB_COUNT_CACHE_SECONDS: int = 60
+    
+    # HTTP caching of job reads (ETag / Last-Modified / Cache-Control)
+    TABLE_VERSION_CACHE_SECONDS: int = 2  # How long a table version is reused before re-reading it
+    HTTP_CACHE_MAX_AGE: int = 0  # Browsers revalidate every time (cheap 304s)
+    HTTP_CACHE_S_MAXAGE: int = 30  # Shared caches (CDN) may serve without revalidating
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = 60
+    
+    # In-process cache of serialized GET /jobs and location search responses
+    RESPONSE_CACHE_SIZE: int = 512  # Entries
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    
     # JWT settings
     SECRET_KEY: str = "your-secret-key-here"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password hashing settings
+    BCRYPT_ROUNDS: int = 12  # Password hashing cost; stored hashes are upgraded on login
+    PASSWORD_HASH_WORKERS: int = 2  # Threads for bcrypt, separate from the request threadpool
+    LOGIN_CONCURRENCY: int = 8  # Logins and sign-ups hashing at once; the rest wait
+    LOGIN_QUEUE_TIMEOUT_SECONDS: float = 5.0  # How long a login waits for a slot before a 429
+    
     # API version
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Roofing Job Board"
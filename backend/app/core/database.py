@@ -1,16 +1,21 @@
 # app/core/database.py
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 import os
+import uuid
 import socket
 import subprocess
 import sys
+import threading
 import time
 from sqlalchemy.exc import OperationalError
-from sqlalchemy import inspect
+from sqlalchemy.pool import StaticPool
+from sqlalchemy import inspect, text
 
 def test_connection(host, port):
     try:
@@ -94,19 +99,35 @@ def diagnose_connection(url):
         print("3. Verify the connection details in your Supabase dashboard")
         print("4. Make sure you're not on a restricted network (some corporate networks block database ports)")
 
-# Debug connection string
 db_url = settings.DATABASE_URL
-print("\nConnection Details:")
-print(f"Database URL: {db_url}")
+if not db_url:
+    raise ValueError("DATABASE_URL not found in environment variables")
+
+# SQLite is supported for local development and tests
+is_sqlite = db_url.startswith("sqlite")
 
-# Run diagnostics before attempting connection
-diagnose_connection(db_url)
+# SQL logging is too slow and noisy for production
+echo_sql = settings.DB_ECHO and not settings.FAST_STARTUP
 
-# Handle connection configuration
-if db_url:
+# Connection pool limits, shared by the sync and async engines
+POOL_SIZE = 3  # Reduced pool size for Render's free tier
+MAX_OVERFLOW = 5  # Reduced max overflow
+
+def create_db_engine():
+    """Build the engine for DATABASE_URL. No connection is opened here."""
+    if is_sqlite:
+        print("\nAttempting to create SQLite engine...")
+        in_memory = db_url in ("sqlite://", "sqlite:///:memory:")
+        return create_engine(
+            db_url,
+            connect_args={"check_same_thread": False},  # Sessions are used from the threadpool
+            poolclass=StaticPool if in_memory else None,  # Share the one in-memory database
+            echo=echo_sql  # Log SQL commands
+        )
+    
     try:
         print("\nAttempting to create database engine...")
-        engine = create_engine(
+        new_engine = create_engine(
             db_url,
             connect_args={
                 "connect_timeout": 60,  # Increased timeout for Render
@@ -117,22 +138,129 @@ if db_url:
                 "keepalives_interval": 10,  # Retry keepalive every 10 seconds
                 "keepalives_count": 5  # Retry 5 times before considering connection dead
             },
-            pool_size=3,  # Reduced pool size for Render's free tier
-            max_overflow=5,  # Reduced max overflow
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
             pool_timeout=60,  # Increased pool timeout
             pool_recycle=1800,  # Recycle connections after 30 minutes
             pool_pre_ping=True,  # Enable connection testing before use
-            echo=True  # Log SQL commands
+            echo=echo_sql  # Log SQL commands
         )
         print("Engine created successfully")
+        return new_engine
     except Exception as e:
         print(f"\nError creating engine: {str(e)}")
         raise
-else:
-    raise ValueError("DATABASE_URL not found in environment variables")
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    """
+    The shared engine, created on first use. With FAST_STARTUP the
+    connection diagnostics run in a background thread at that point
+    instead of blocking import.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if settings.FAST_STARTUP and not is_sqlite:
+                    threading.Thread(target=diagnose_connection, args=(db_url,), daemon=True).start()
+                _engine = create_db_engine()
+    return _engine
+
+def __getattr__(name):
+    # Keep `from app.core.database import engine` working without creating
+    # the engine at import time
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class LazySessionMaker(sessionmaker):
+    """sessionmaker that binds to the engine the first time a session is made"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+if not settings.FAST_STARTUP:
+    # Debug connection string
+    print("\nConnection Details:")
+    print(f"Database URL: {db_url}")
+    
+    # Run diagnostics before attempting connection
+    if not is_sqlite:
+        diagnose_connection(db_url)
+    get_engine()
 
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = LazySessionMaker(autocommit=False, autoflush=False)
+
+def async_db_url(url: str):
+    """DATABASE_URL with the async driver: asyncpg for PostgreSQL, aiosqlite for SQLite"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite")
+    # asyncpg takes ssl through connect_args, not libpq's sslmode
+    return parsed.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode"])
+
+def create_async_db_engine():
+    """
+    Async engine for the read-heavy endpoints. It has its own pool, with the
+    same limits as the sync engine's.
+    """
+    url = async_db_url(db_url)
+    if is_sqlite:
+        # An in-memory database is not shared with the sync engine; use a file
+        return create_async_engine(url, echo=echo_sql)
+    
+    print("\nAttempting to create async database engine...")
+    return create_async_engine(
+        url,
+        connect_args={
+            "timeout": 60,
+            "ssl": "require",
+            "server_settings": {"application_name": "roofing-job-board"},
+            # Prepared statements don't survive a transaction-mode pooler
+            # (Supabase port 6543); disable caching and use unique names
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        },
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=60,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        echo=echo_sql
+    )
+
+_async_engine = None
+
+def get_async_engine():
+    """The shared async engine, created on first use"""
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                _async_engine = create_async_db_engine()
+    return _async_engine
+
+async def dispose_async_engine():
+    if _async_engine is not None:
+        await _async_engine.dispose()
+
+class LazyAsyncSessionMaker(async_sessionmaker):
+    """async_sessionmaker that binds to the async engine the first time a session is made"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_async_engine())
+        return super().__call__(**local_kw)
+
+# Async sessions for the read-only endpoints. Objects stay usable after
+# commit since nothing can lazy-load on an AsyncSession anyway.
+AsyncSessionLocal = LazyAsyncSessionMaker(autoflush=False, expire_on_commit=False)
 
 # Create Base class for database models
 Base = declarative_base()
@@ -153,8 +281,37 @@ def get_db_session():
     finally:
         db.close()
 
+async def get_async_db_session():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def add_missing_columns():
+    """ALTER TABLE ... ADD COLUMN for model columns missing from existing tables"""
+    engine = get_engine()
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                print(f"Adding column {table.name}.{column.name} ({column_type})")
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+
 def init_db():
     """Create database tables"""
+    # Register every model on Base.metadata, including the ones only the
+    # lazily imported ingest stack uses
+    from ..models import (  # noqa: F401
+        company_model, job_model, user_model, geocode_cache_model,
+        job_title_classification_model, sync_state_model, table_version_model,
+        task_checkpoint_model
+    )
+    engine = get_engine()
     try:
         print("\nAttempting to create database tables...")
         # Test the connection first
@@ -164,6 +321,55 @@ def init_db():
         # Create tables
         Base.metadata.create_all(bind=engine)
         print("Database tables created successfully")
+
+        # create_all skips tables that already exist, so add any columns
+        # and indexes that were added to existing models since
+        add_missing_columns()
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+        
+        # Indexes the models no longer define: GET /jobs always filters on
+        # is_active, and PostgreSQL reads listing order off the DESC NULLS
+        # LAST indexes instead of the ascending ones
+        superseded = ["ix_jobs_posted_date_id"]
+        if not is_sqlite:
+            superseded += [
+                "ix_jobs_active_posted_date_id",
+                "ix_jobs_active_function_posted_date_id",
+                "ix_jobs_active_state_city_posted_date_id",
+            ]
+        with engine.begin() as connection:
+            for name in superseded:
+                connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        
+        # Full-text search column/index live outside the models
+        from ..services.job_search import ensure_search_index
+        ensure_search_index(engine)
+        
+        # Snippets for jobs stored before Job.snippet existed
+        from ..services.job_summary import backfill_snippets
+        with SessionLocal() as session:
+            filled = backfill_snippets(session)
+        if filled:
+            print(f"Backfilled snippets for {filled} jobs")
+        
+        # Undated jobs sort after everything in GET /jobs; date the ones
+        # stored without a posted_date so they page with the rest
+        from ..models.job_model import Job
+        from datetime import datetime, timezone
+        from sqlalchemy import update
+        with engine.begin() as connection:
+            dated = connection.execute(
+                update(Job).where(Job.posted_date.is_(None)).values(posted_date=datetime.now(timezone.utc))
+            ).rowcount
+            if is_sqlite:
+                # SQLite compares timestamps as text, and rows dated by its
+                # CURRENT_TIMESTAMP lack the ".ffffff" bound cursors carry, so
+                # rows in the cursor's second would pass the keyset filter again
+                connection.execute(text("UPDATE jobs SET posted_date = posted_date || '.000000' WHERE length(posted_date) = 19"))
+        if dated:
+            print(f"Backfilled posted_date for {dated} jobs")
         
         # Verify tables were created
         inspector = inspect(engine)
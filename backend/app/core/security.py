@@ -1,12 +1,20 @@
 # backend/app/core/security.py
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. Hashes made with a different bcrypt cost are flagged
+# by verify_and_update, so changing BCRYPT_ROUNDS rehashes on next login.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# bcrypt is deliberately CPU-heavy; it runs on its own small pool so a
+# burst of logins can't take over the threadpool that serves everything else
+_hash_executor = ThreadPoolExecutor(max_workers=max(1, settings.PASSWORD_HASH_WORKERS), thread_name_prefix="password-hash")
 
 # JWT settings
 SECRET_KEY = settings.SECRET_KEY
@@ -27,4 +35,21 @@ def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+async def hash_password(password: str) -> str:
+    """get_password_hash on the hashing pool"""
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password on the hashing pool. Returns (valid, new_hash);
+    new_hash is set when the stored hash should be replaced (e.g. it was
+    made with another BCRYPT_ROUNDS).
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_executor, pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+def shutdown_password_hashing():
+    _hash_executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
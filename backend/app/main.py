@@ -1,10 +1,14 @@
 # backend/app/main.py
 
 from fastapi import FastAPI, Depends
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
 from .api import user_API, job_API, company_API, payment_API  # Add payment_API
-from .core.database import init_db, engine, Base
+from .core.database import dispose_async_engine, init_db
+from .core.metrics import MetricsMiddleware, REGISTRY, record_startup_phase
+from .core.security import shutdown_password_hashing
+from .services.task_runner import task_runner
 from contextlib import asynccontextmanager
 
 # Remove these lines that drop and recreate tables
@@ -13,8 +17,16 @@ from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()  # This will create tables if they don't exist
+    if settings.FAST_STARTUP:
+        # Schema changes are applied by a deploy step, not on every wake-up
+        print("FAST_STARTUP: skipping database initialization")
+    else:
+        init_db()  # This will create tables if they don't exist
+    record_startup_phase("startup")
     yield
+    task_runner.shutdown()
+    shutdown_password_hashing()
+    await dispose_async_engine()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -33,13 +45,24 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
+# Request timing, status codes and in-flight gauge; added last so it is
+# the outermost middleware and sees every request
+app.add_middleware(MetricsMiddleware)
+
 # Include the user and job routers
 app.include_router(user_API.router, prefix="/api/v1/users", tags=["users"])
 app.include_router(job_API.router, prefix="/api/v1/jobs", tags=["jobs"])
 app.include_router(company_API.router, prefix="/api/v1/companies", tags=["companies"])
 app.include_router(payment_API.router, prefix="/api/v1/payments", tags=["payments"])
 
+record_startup_phase("import")
+
 # Basic test route
 @app.get("/")
 async def root():
-    return {"message": "Welcome to the Roofing Job Board API"}
\ No newline at end of file
+    return {"message": "Welcome to the Roofing Job Board API"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus text-format metrics"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,17 @@
+# backend/app/models/geocode_cache_model.py
+
+from sqlalchemy import Column, String, Float, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class GeocodeCacheEntry(Base):
+    __tablename__ = "geocode_cache"
+
+    # Normalized lookup key, e.g. "zip:78701" or "address:austin, tx, usa"
+    key = Column(String, primary_key=True)
+    # Both NULL for a cached "no result" answer
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    # NULL means the entry never expires (positive results)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,7 +1,8 @@
 # backend/app/models/job_model.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, Boolean, DateTime, Float, Enum as SQLAlchemyEnum
+from sqlalchemy import Column, Integer, String, ForeignKey, Text, Boolean, DateTime, Float, Index, Enum as SQLAlchemyEnum
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 from sqlalchemy.sql import func
 from ..core.database import Base
 from .company_model import Company  # Add this import
@@ -22,10 +23,13 @@ class Job(Base):
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=True)
     job_title = Column(String, index=True)
     description = Column(Text)  # Make sure this is Text type to preserve HTML
+    snippet = Column(String(255), nullable=True)  # Plain-text start of the description, for list views
     job_category = Column(Text)  # Store as JSON or comma-separated string
     location = Column(String)
     salary_range = Column(String, nullable=True)
-    posted_date = Column(DateTime(timezone=True), server_default=func.now())  # Automatically set to now
+    # Automatically set to now. Set in Python so SQLite stores the same
+    # microsecond format keyset cursors bind (its CURRENT_TIMESTAMP has none)
+    posted_date = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
     is_active = Column(Boolean, default=True)
     application_email = Column(String, nullable=True)
     application_link = Column(String, nullable=True)
@@ -43,5 +47,36 @@ class Job(Base):
     state = Column(String, nullable=True)
 
     job_function = Column(SQLAlchemyEnum(JobFunction), nullable=True)
+    # Classifier model that set job_function, so reclassify can find stale rows
+    classified_by = Column(String, nullable=True)
 
-    company = relationship("Company", back_populates="jobs")
\ No newline at end of file
+    # Hash of the raw TheirStack payload, used by sync to skip unchanged jobs
+    source_hash = Column(String(64), nullable=True)
+    # Hash of the raw markdown description, so unchanged descriptions skip rendering
+    description_hash = Column(String(64), nullable=True)
+    # Normalized title + company + city/state hash and description SimHash,
+    # used by sync to collapse reposted and syndicated copies of a posting
+    fingerprint = Column(String(40), nullable=True, index=True)
+    description_simhash = Column(String(16), nullable=True)
+
+    company = relationship("Company", back_populates="jobs")
+
+    __table_args__ = (
+        # Bounding-box prefilter for /jobs/search/location
+        Index("ix_jobs_latitude_longitude", "latitude", "longitude"),
+        # GET /jobs filters (every listing filters on is_active); each ends
+        # in (posted_date, id) so a filtered page is one index range scan in
+        # listing order. PostgreSQL uses the DESC NULLS LAST ones below.
+        Index("ix_jobs_active_posted_date_id", "is_active", "posted_date", "id").ddl_if(dialect="sqlite"),
+        Index("ix_jobs_active_function_posted_date_id", "is_active", "job_function", "posted_date", "id").ddl_if(dialect="sqlite"),
+        Index("ix_jobs_active_state_city_posted_date_id", "is_active", "state", "city", "posted_date", "id").ddl_if(dialect="sqlite"),
+        Index("ix_jobs_employment_type_posted_date_id", "employment_type", "posted_date", "id"),
+        Index("ix_jobs_remote_type_posted_date_id", "remote_type", "posted_date", "id"),
+    )
+
+# PostgreSQL can only read GET /jobs order (posted_date DESC NULLS LAST,
+# id DESC) straight off an index built in that order. SQLite already puts
+# NULLs last under DESC and walks the indexes above backwards.
+Index("ix_jobs_active_posted_date_desc_id", Job.is_active, Job.posted_date.desc().nulls_last(), Job.id.desc()).ddl_if(dialect="postgresql")
+Index("ix_jobs_active_function_posted_date_desc_id", Job.is_active, Job.job_function, Job.posted_date.desc().nulls_last(), Job.id.desc()).ddl_if(dialect="postgresql")
+Index("ix_jobs_active_state_city_posted_date_desc_id", Job.is_active, Job.state, Job.city, Job.posted_date.desc().nulls_last(), Job.id.desc()).ddl_if(dialect="postgresql")
@@ -0,0 +1,15 @@
+# backend/app/models/job_title_classification_model.py
+
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class JobTitleClassification(Base):
+    __tablename__ = "job_title_classifications"
+
+    # Output of job_classifier.normalize_title, e.g. "roofer"
+    normalized_title = Column(String, primary_key=True)
+    job_function = Column(String, nullable=False)
+    # Model that produced the answer; rows from other models are ignored
+    model = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,18 @@
+# backend/app/models/sync_state_model.py
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class SyncState(Base):
+    __tablename__ = "sync_states"
+
+    # Name of the job source, e.g. "theirstack"
+    source = Column(String, primary_key=True)
+    # Newest posting date ingested; incremental syncs ask only for newer postings
+    watermark = Column(DateTime(timezone=True), nullable=True)
+    last_mode = Column(String, nullable=True)
+    last_synced_count = Column(Integer, nullable=True)
+    last_deactivated_count = Column(Integer, nullable=True)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,14 @@
+# backend/app/models/table_version_model.py
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class TableVersion(Base):
+    __tablename__ = "table_versions"
+
+    # Name of the versioned table, e.g. "jobs"
+    table_name = Column(String, primary_key=True)
+    # Incremented in the same transaction as every write to the table
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
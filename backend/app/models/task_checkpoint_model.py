@@ -0,0 +1,22 @@
+# backend/app/models/task_checkpoint_model.py
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class TaskCheckpoint(Base):
+    __tablename__ = "task_checkpoints"
+
+    # Name of the resumable task, e.g. "reclassify"
+    name = Column(String, primary_key=True)
+    # Parameters the run was started with; a run only resumes with the same ones
+    scope = Column(String, nullable=True)
+    model = Column(String, nullable=True)
+    # Highest job id fully processed and committed
+    last_id = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    updated_count = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    # NULL while the run is unfinished
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -63,11 +63,38 @@ class JobResponse(BaseModel):
         # Allow extra fields in case database has fields not in schema
         extra = "allow"
 
+class JobSummary(BaseModel):
+    """Job card fields returned by the list and search endpoints; GET /jobs/{id} has the full job"""
+    id: int
+    job_title: Optional[str] = None
+    location: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    postal_code: Optional[str] = None
+    salary_range: Optional[str] = None
+    employment_type: Optional[str] = None
+    remote_type: Optional[str] = None
+    job_function: Optional[str] = None
+    posted_date: Optional[Union[datetime, str]] = None
+    is_active: Optional[bool] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    snippet: Optional[str] = None  # Plain-text start of the description
+    distance: Optional[float] = None  # Miles from the search point, location and radius searches only
+
+class PaginatedJobSummaryResponse(BaseModel):
+    items: List[JobSummary]
+    total: Optional[int] = None  # None when the count was not requested
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+
 class PaginatedJobResponse(BaseModel):
     items: List[JobResponse]
-    total: int
+    total: Optional[int] = None  # None when the count was not requested
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
 
     class Config:
         from_attributes = True
\ No newline at end of file
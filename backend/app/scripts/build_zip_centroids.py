@@ -0,0 +1,15 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.utils.zip_centroids import build_table, table_path
+
+if __name__ == "__main__":
+    # Usage: python app/scripts/build_zip_centroids.py [GeoNames US.txt]
+    # Without a file the GeoNames data is downloaded through pgeocode
+    try:
+        count = build_table(source=sys.argv[1] if len(sys.argv) > 1 else None)
+        print(f"Wrote {count} ZIP centroids to {table_path()}")
+    except Exception as e:
+        print(f"Error building ZIP centroid table: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,13 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.core.database import init_db
+
+if __name__ == "__main__":
+    # Run on deploy when the app itself starts with FAST_STARTUP
+    try:
+        init_db()
+    except Exception as e:
+        print(f"Error initializing database: {str(e)}")
+        sys.exit(1)
@@ -6,8 +6,9 @@ from app.services.theirstack_api import sync_jobs
 
 if __name__ == "__main__":
     try:
-        # Modify the fetch_roofing_jobs function to get more jobs
-        synced_count = sync_jobs()
+        # Usage: python sync_jobs.py [incremental|full]
+        mode = sys.argv[1] if len(sys.argv) > 1 else "incremental"
+        synced_count = sync_jobs(mode=mode)
         print(f"\nSuccessfully synced {synced_count} jobs")
     except Exception as e:
         print(f"Error syncing jobs: {str(e)}")
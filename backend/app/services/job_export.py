@@ -0,0 +1,75 @@
+# backend/app/services/job_export.py
+
+import csv
+import enum
+import io
+import orjson
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import select
+from ..core.database import AsyncSessionLocal
+from ..models.job_model import Job
+
+# Rows fetched from the server-side cursor (and encoded) at a time
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Every jobs column can be exported, in table order
+EXPORT_COLUMNS = {column.key: getattr(Job, column.key) for column in Job.__table__.columns}
+
+def parse_columns(columns: Optional[str]) -> List[str]:
+    """Comma-separated column names (default: all). Raises ValueError for unknown names."""
+    if not columns:
+        return list(EXPORT_COLUMNS)
+    names = [name.strip() for name in columns.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    if not names:
+        raise ValueError("No columns selected")
+    # Keep the requested order but drop repeats
+    return list(dict.fromkeys(names))
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _encode_ndjson(names: List[str], rows) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(names, row)), option=orjson.OPT_UTC_Z) + b"\n" for row in rows)
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+async def stream_jobs(format: str, names: List[str], filters=None) -> AsyncIterator[bytes]:
+    """
+    Encoded jobs, one chunk per EXPORT_BATCH_SIZE rows, ordered by id.
+    Rows come from a server-side cursor, so memory stays flat however many
+    rows match. Uses its own session since it outlives the request handler.
+    """
+    statement = select(*(EXPORT_COLUMNS[name] for name in names))
+    if filters is not None:
+        statement = filters.apply(statement)
+    statement = statement.order_by(Job.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    if format == "csv":
+        yield _encode_csv([names])
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(statement)
+        async for rows in result.partitions():
+            if format == "csv":
+                yield _encode_csv(rows)
+            else:
+                yield _encode_ndjson(names, rows)
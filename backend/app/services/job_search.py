@@ -0,0 +1,163 @@
+# backend/app/services/job_search.py
+
+import re
+from math import radians
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, func, literal_column, or_, table, column, text
+from sqlalchemy.orm import Session
+from ..models.job_model import Job
+from .job_summary import SUMMARY_COLUMNS, summary_dict
+from ..utils.location_utils import EARTH_RADIUS_MILES, bounding_box, calculate_distance
+
+# Text search configuration for PostgreSQL
+SEARCH_CONFIG = "english"
+
+# Title matches count for more than description matches
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# PostgreSQL: stored tsvector over the title and the tag-stripped description
+POSTGRES_SEARCH_DDL = [
+    f"""
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(job_title, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', regexp_replace(coalesce(description, ''), '<[^>]+>', ' ', 'g')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)",
+]
+
+# SQLite (local dev and tests): FTS5 index kept in step with jobs by triggers
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE jobs_fts USING fts5(
+        job_title, description, content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, job_title, description) VALUES (new.id, new.job_title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, job_title, description) VALUES ('delete', old.id, old.job_title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER jobs_fts_au AFTER UPDATE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, job_title, description) VALUES ('delete', old.id, old.job_title, old.description);
+        INSERT INTO jobs_fts(rowid, job_title, description) VALUES (new.id, new.job_title, new.description);
+    END
+    """,
+    "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')",
+]
+
+jobs_fts = table("jobs_fts", column("rowid"))
+
+def ensure_search_index(engine):
+    """Create the full-text search column/index (PostgreSQL) or FTS5 table (SQLite) if missing"""
+    dialect = engine.dialect.name
+    with engine.begin() as connection:
+        if dialect == "postgresql":
+            for statement in POSTGRES_SEARCH_DDL:
+                connection.execute(text(statement))
+        elif dialect == "sqlite":
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+            ).first()
+            if not exists:
+                for statement in SQLITE_SEARCH_DDL:
+                    connection.execute(text(statement))
+        else:
+            print(f"Full-text search is not supported on {dialect}")
+
+def sqlite_match_query(q: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, no operators"""
+    words = re.findall(r"\w+", q)
+    return " ".join(f'"{word}"' for word in words)
+
+def _sqlite_haversine(lat1, lon1, lat2, lon2):
+    if None in (lat1, lon1, lat2, lon2):
+        return None
+    return calculate_distance(lat1, lon1, lat2, lon2)
+
+def distance_expression(db: Session, lat: float, lon: float):
+    """SQL expression for the distance in miles from (lat, lon) to each job"""
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite has no reliable trig functions, so register a Python one
+        db.connection().connection.driver_connection.create_function(
+            "haversine_miles", 4, _sqlite_haversine, deterministic=True
+        )
+        return func.haversine_miles(lat, lon, Job.latitude, Job.longitude)
+
+    lat1 = radians(lat)
+    dlat = (func.radians(Job.latitude) - lat1) / 2
+    dlon = (func.radians(Job.longitude) - radians(lon)) / 2
+    a = func.power(func.sin(dlat), 2) + func.cos(lat1) * func.cos(func.radians(Job.latitude)) * func.power(func.sin(dlon), 2)
+    return 2 * EARTH_RADIUS_MILES * func.asin(func.sqrt(func.least(a, 1.0)))
+
+def search_jobs(
+    db: Session,
+    q: str,
+    filters=None,
+    origin: Optional[Tuple[float, float]] = None,
+    radius: Optional[float] = None,
+    limit: int = 25,
+    after: Optional[Tuple[float, int]] = None
+) -> List[Tuple[dict, float, Optional[float]]]:
+    """
+    Ranked full-text search over job titles and descriptions, combined with
+    the listing filters and an optional radius around origin, in a single
+    query. Returns (job summary, rank, distance) best first; `after` is
+    the (rank, id) of the last result of the previous page.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        search_vector = literal_column("jobs.search_vector")
+        rank = func.ts_rank_cd(search_vector, tsquery)
+        match = search_vector.op("@@")(tsquery)
+        join = None
+    elif dialect == "sqlite":
+        match_query = sqlite_match_query(q)
+        if not match_query:
+            return []
+        # bm25 is lower-is-better; negate so both backends rank descending
+        rank = -func.bm25(literal_column("jobs_fts"), TITLE_WEIGHT, DESCRIPTION_WEIGHT)
+        match = literal_column("jobs_fts").op("MATCH")(match_query)
+        join = jobs_fts
+    else:
+        raise ValueError(f"Full-text search is not supported on {dialect}")
+
+    distance = distance_expression(db, *origin) if origin else None
+    columns = [*SUMMARY_COLUMNS, rank.label("search_rank")]
+    if distance is not None:
+        columns.append(distance.label("distance"))
+
+    query = db.query(*columns).select_from(Job)
+    if join is not None:
+        query = query.join(join, join.c.rowid == Job.id)
+    query = query.filter(match)
+    if filters is not None:
+        query = filters.apply(query)
+
+    if origin and radius:
+        # The bounding box lets the lat/lon index do the coarse work
+        min_lat, max_lat, min_lon, max_lon = bounding_box(origin[0], origin[1], radius)
+        query = query.filter(
+            Job.latitude.between(min_lat, max_lat),
+            Job.longitude.between(min_lon, max_lon),
+            distance <= radius
+        )
+
+    if after:
+        after_rank, after_id = after
+        query = query.filter(or_(rank < after_rank, and_(rank == after_rank, Job.id < after_id)))
+
+    rows = query.order_by(rank.desc(), Job.id.desc()).limit(limit).all()
+    return [
+        (summary_dict(row), float(row.search_rank), float(row.distance) if distance is not None and row.distance is not None else None)
+        for row in rows
+    ]
@@ -0,0 +1,46 @@
+# backend/app/services/job_summary.py
+
+import orjson
+from typing import Any, Dict, Iterable, List
+from sqlalchemy import update
+from ..models.job_model import Job
+
+# Columns a job card needs; list and search endpoints load only these, so
+# the description HTML never leaves the database for a listing
+SUMMARY_COLUMNS = (
+    Job.id, Job.job_title, Job.location, Job.city, Job.state, Job.postal_code,
+    Job.salary_range, Job.employment_type, Job.remote_type, Job.job_function,
+    Job.posted_date, Job.is_active, Job.latitude, Job.longitude, Job.snippet,
+)
+SUMMARY_FIELDS = tuple(column.key for column in SUMMARY_COLUMNS)
+
+SNIPPET_BACKFILL_BATCH_SIZE = 500
+
+def summary_dict(row) -> Dict[str, Any]:
+    """Plain dict for a row selected with SUMMARY_COLUMNS (extra columns are ignored)"""
+    return dict(zip(SUMMARY_FIELDS, row))
+
+def summaries(rows: Iterable) -> List[Dict[str, Any]]:
+    return [summary_dict(row) for row in rows]
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize summaries with orjson. Dicts go straight to JSON with no
+    Pydantic models in between; datetimes match Pydantic's output (UTC as Z).
+    """
+    return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+
+def backfill_snippets(session) -> int:
+    """Fill Job.snippet for rows stored before the column existed"""
+    from ..utils.html_utils import description_snippet
+    filled = 0
+    while True:
+        rows = session.query(Job.id, Job.description).filter(Job.snippet.is_(None)).limit(SNIPPET_BACKFILL_BATCH_SIZE).all()
+        if not rows:
+            return filled
+        session.execute(
+            update(Job),
+            [{"id": job_id, "snippet": description_snippet(description)} for job_id, description in rows]
+        )
+        session.commit()
+        filled += len(rows)
@@ -0,0 +1,109 @@
+# backend/app/services/reclassify.py
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+from sqlalchemy import func, or_, true, update
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.job_model import Job
+from ..models.task_checkpoint_model import TaskCheckpoint
+from ..utils.job_classifier import classify_job_titles
+from ..utils.table_versions import bump_table_version
+
+RECLASSIFY_TASK = "reclassify"
+
+# stale: unclassified, or classified by a model other than the current one
+RECLASSIFY_SCOPES = ("stale", "unclassified", "all")
+
+def scope_filter(scope: str, model: str):
+    if scope == "unclassified":
+        return Job.job_function.is_(None)
+    if scope == "stale":
+        return or_(Job.job_function.is_(None), Job.classified_by.is_(None), Job.classified_by != model)
+    return true()
+
+def reclassify_jobs(scope: str = "stale", restart: bool = False, report: Callable[..., None] = None) -> Dict[str, Any]:
+    """
+    Classify the jobs matching scope in chunks of RECLASSIFY_CHUNK_SIZE,
+    in id order. Each chunk's distinct titles go through the classifier
+    (cached, batched and concurrent), and its updates are committed
+    together with a checkpoint. A run interrupted part-way resumes after
+    the last committed chunk when started again with the same scope and
+    model, unless restart is set.
+    """
+    if scope not in RECLASSIFY_SCOPES:
+        raise ValueError(f"Invalid scope: {scope}")
+    report = report or (lambda **progress: None)
+    model = settings.OPENAI_CLASSIFIER_MODEL
+    chunk_size = max(1, settings.RECLASSIFY_CHUNK_SIZE)
+    session = SessionLocal()
+    try:
+        checkpoint = session.get(TaskCheckpoint, RECLASSIFY_TASK)
+        resuming = (
+            not restart and checkpoint is not None and checkpoint.finished_at is None
+            and checkpoint.scope == scope and checkpoint.model == model
+        )
+        if checkpoint is None:
+            checkpoint = TaskCheckpoint(name=RECLASSIFY_TASK)
+            session.add(checkpoint)
+        if resuming:
+            print(f"\nResuming job reclassification after job {checkpoint.last_id}")
+        else:
+            print(f"\nStarting job reclassification (scope: {scope}, model: {model})")
+            checkpoint.scope = scope
+            checkpoint.model = model
+            checkpoint.last_id = 0
+            checkpoint.processed_count = 0
+            checkpoint.updated_count = 0
+            checkpoint.started_at = datetime.now(timezone.utc)
+            checkpoint.finished_at = None
+            session.commit()
+
+        criteria = scope_filter(scope, model)
+        remaining = session.query(func.count(Job.id)).filter(criteria, Job.id > checkpoint.last_id).scalar()
+        report(resumed=resuming, remaining_jobs=remaining, processed=checkpoint.processed_count, updated=checkpoint.updated_count)
+
+        while True:
+            rows = (
+                session.query(Job.id, Job.job_title)
+                .filter(criteria, Job.id > checkpoint.last_id)
+                .order_by(Job.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            classifications = classify_job_titles(job_title for _, job_title in rows)
+            changes = [
+                {"id": job_id, "job_function": classifications[job_title], "classified_by": model}
+                for job_id, job_title in rows
+                if classifications.get(job_title)
+            ]
+            if changes:
+                session.execute(update(Job), changes)
+                bump_table_version(session, "jobs")
+
+            checkpoint.last_id = rows[-1].id
+            checkpoint.processed_count += len(rows)
+            checkpoint.updated_count += len(changes)
+            session.commit()
+            report(processed=checkpoint.processed_count, updated=checkpoint.updated_count, last_id=checkpoint.last_id)
+
+        checkpoint.finished_at = datetime.now(timezone.utc)
+        session.commit()
+        print(f"Reclassified {checkpoint.updated_count} out of {checkpoint.processed_count} jobs")
+        return {
+            "message": f"Successfully reclassified {checkpoint.updated_count} out of {checkpoint.processed_count} jobs",
+            "scope": scope,
+            "model": model,
+            "resumed": resuming,
+            "total_jobs": checkpoint.processed_count,
+            "reclassified_count": checkpoint.updated_count
+        }
+    except Exception as e:
+        session.rollback()
+        print(f"Error during reclassification: {str(e)}")
+        raise
+    finally:
+        session.close()
@@ -0,0 +1,110 @@
+# backend/app/services/task_runner.py
+
+import threading
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+ACTIVE_STATUSES = ("pending", "running")
+
+class TaskConflictError(Exception):
+    """Raised when an exclusive task of the same group is already active"""
+
+    def __init__(self, task: Dict[str, Any]):
+        super().__init__(f"Task {task['id']} ({task['kind']}) is already {task['status']}")
+        self.task = task
+
+class TaskRunner:
+    """
+    Runs long operations (sync, cleanup, reclassify) on a small thread pool
+    so request handlers can return a task id immediately. Tasks sharing an
+    `exclusive` group never overlap. Task functions receive a `report`
+    callback for progress counts; finished tasks are kept for inspection
+    up to `history` entries.
+    """
+
+    def __init__(self, max_workers: int = 2, history: int = 100):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-runner")
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.history = history
+
+    def submit(self, kind: str, func: Callable[..., Any], *args, exclusive: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            if exclusive:
+                for task in self._tasks.values():
+                    if task["exclusive"] == exclusive and task["status"] in ACTIVE_STATUSES:
+                        raise TaskConflictError(deepcopy(task))
+
+            task = {
+                "id": uuid.uuid4().hex,
+                "kind": kind,
+                "exclusive": exclusive,
+                "status": "pending",
+                "progress": {},
+                "result": None,
+                "error": None,
+                "created_at": datetime.now(timezone.utc),
+                "started_at": None,
+                "finished_at": None,
+            }
+            self._tasks[task["id"]] = task
+            self._trim()
+            snapshot = deepcopy(task)
+
+        future = self._executor.submit(self._run, task, func, args, kwargs)
+        future.add_done_callback(lambda future: self._mark_cancelled(task, future))
+        return snapshot
+
+    def _mark_cancelled(self, task: Dict[str, Any], future: Future):
+        """Queued tasks dropped by shutdown() never run; record that rather than leave them pending"""
+        if future.cancelled():
+            with self._lock:
+                task["status"] = "cancelled"
+                task["finished_at"] = datetime.now(timezone.utc)
+
+    def _trim(self):
+        """Drop the oldest finished tasks beyond the history limit"""
+        excess = len(self._tasks) - self.history
+        for task_id in [t["id"] for t in self._tasks.values() if t["status"] not in ACTIVE_STATUSES]:
+            if excess <= 0:
+                break
+            del self._tasks[task_id]
+            excess -= 1
+
+    def _run(self, task: Dict[str, Any], func: Callable[..., Any], args, kwargs):
+        def report(**counts):
+            with self._lock:
+                task["progress"].update(counts)
+
+        with self._lock:
+            task["status"] = "running"
+            task["started_at"] = datetime.now(timezone.utc)
+        try:
+            result = func(*args, report=report, **kwargs)
+            with self._lock:
+                task["result"] = result
+                task["status"] = "succeeded"
+        except Exception as e:
+            print(f"\nTask {task['id']} ({task['kind']}) failed: {str(e)}")
+            print(traceback.format_exc())
+            with self._lock:
+                task["error"] = str(e)
+                task["status"] = "failed"
+        finally:
+            with self._lock:
+                task["finished_at"] = datetime.now(timezone.utc)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return deepcopy(task) if task else None
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+task_runner = TaskRunner()
@@ -1,101 +1,243 @@
 import requests
-import bleach
-import markdown
+from requests.adapters import HTTPAdapter
+import hashlib
+import json
+import math
+import random
+import threading
 import time
-from datetime import datetime
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func, update
 from ..models.job_model import Job
+from ..models.sync_state_model import SyncState
 from ..core.database import get_db_session
 from ..core.config import settings
-from ..utils.location_utils import get_coordinates_from_zip as get_coordinates
-from ..utils.html_utils import sanitize_html
-from ..utils.job_classifier import classify_job_function
-import re
-from pgeocode import Nominatim
-import pandas as pd
+from ..core.metrics import track_external
+from ..utils.html_utils import description_hash, description_snippet, render_description
+from ..utils.job_classifier import classify_job_function, classify_job_titles
+from ..utils.job_fingerprint import fingerprint, hamming_distance
+from ..utils.location_utils import geocode_addresses, get_coordinates_from_address, parse_city_state
+from ..utils.rate_limiter import RateLimiter
+from ..utils.table_versions import bump_table_version
 
 # Use settings directly - remove load_dotenv() call
 THEIRSTACK_API_URL = settings.THEIRSTACK_API_URL
 THEIRSTACK_API_KEY = settings.THEIRSTACK_API_KEY
 
+SYNC_SOURCE = "theirstack"
+SYNC_MODES = ("incremental", "full")
+
+# TheirStack postings older than this are outside the search window
+SYNC_WINDOW_DAYS = 30
+
+# Statuses worth retrying; anything else is treated as a hard failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+class TheirStackFetchError(Exception):
+    """A TheirStack page could not be fetched, so the listing is incomplete"""
+
+class TheirStackFetcher:
+    """
+    Fetches TheirStack search pages over one keep-alive session, several
+    pages at a time, under a shared rate limit, with jittered exponential
+    backoff on timeouts, connection errors, 429s and 5xxs.
+    """
+
+    def __init__(
+        self,
+        api_url: str = None,
+        api_key: str = None,
+        concurrency: int = None,
+        rate_per_second: float = None,
+        max_retries: int = None,
+        backoff_base: float = None,
+        backoff_max: float = 30.0
+    ):
+        self.api_url = api_url or THEIRSTACK_API_URL
+        self.api_key = api_key if api_key is not None else THEIRSTACK_API_KEY
+        self.concurrency = max(1, concurrency or settings.THEIRSTACK_CONCURRENCY)
+        self.max_retries = max(1, max_retries or settings.THEIRSTACK_MAX_RETRIES)
+        self.backoff_base = backoff_base if backoff_base is not None else settings.THEIRSTACK_BACKOFF_BASE_SECONDS
+        self.backoff_max = backoff_max
+        self.rate_limiter = RateLimiter(
+            rate_per_second if rate_per_second is not None else settings.THEIRSTACK_RATE_LIMIT_PER_SECOND
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+    def build_payload(self, page: int, limit: int, filters: Dict[str, Any] = None) -> Dict[str, Any]:
+        data = {
+            "page": page,
+            "limit": limit,
+            "posted_at_max_age_days": SYNC_WINDOW_DAYS,
+            "job_title_pattern_or": ["roofing", "roofer"],
+            "job_country_code_or": ["US"],
+            "include_total_results": False,
+            "blur_company_data": False
+        }
+        data.update(filters or {})
+        return data
+
+    def _backoff(self, attempt: int, retry_after: str = None) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when given"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def fetch_page(self, page: int, limit: int, filters: Dict[str, Any] = None) -> List[Dict[Any, Any]]:
+        """
+        Fetch one page. Raises TheirStackFetchError on a non-retryable
+        status or once retries are exhausted, so a failure is never
+        mistaken for the end of the listing.
+        """
+        payload = self.build_payload(page, limit, filters)
+        for attempt in range(self.max_retries):
+            retry_after = None
+            try:
+                self.rate_limiter.wait()
+                with track_external("theirstack") as call:
+                    response = self.session.post(self.api_url, json=payload, timeout=30)
+                    if response.status_code != 200:
+                        call.fail()
+                if response.status_code == 200:
+                    jobs = response.json().get('data', [])
+                    print(f"Received {len(jobs)} jobs for page {page}")
+                    return jobs
+                print(f"Error response for page {page} ({response.status_code}): {response.text[:500]}")
+                error = f"status {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUSES:
+                    raise TheirStackFetchError(f"Page {page} failed with {error}")
+                retry_after = response.headers.get("Retry-After")
+            except requests.exceptions.RequestException as e:
+                print(f"\nRequest for page {page} failed: {str(e)}")
+                error = str(e)
+            
+            if attempt < self.max_retries - 1:
+                delay = self._backoff(attempt, retry_after)
+                print(f"Retrying page {page} in {delay:.1f} seconds...")
+                time.sleep(delay)
+        
+        print(f"Max retries reached for page {page}")
+        raise TheirStackFetchError(f"Page {page} failed after {self.max_retries} attempts: {error}")
+
+    def fetch_jobs(self, max_jobs: int, page_size: int, filters: Dict[str, Any] = None) -> Tuple[List[Dict[Any, Any]], bool]:
+        """
+        Fetch up to max_jobs postings, keeping up to `concurrency` pages in
+        flight. Stops scheduling new pages as soon as one comes back short,
+        and drops anything after the first short page. Returns (postings,
+        complete); complete is True when a short page ended the listing
+        before max_jobs. Raises TheirStackFetchError if any page fails (or
+        there is no API key) rather than returning a partial listing.
+        """
+        if not self.api_key:
+            raise TheirStackFetchError("TheirStack API key not found")
+        
+        total_pages = max(1, math.ceil(max_jobs / page_size))
+        results: Dict[int, List[Dict[Any, Any]]] = {}
+        last_page = total_pages - 1  # Lowered when a short page shows up
+        next_page = 0
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            in_flight = {}
+            while in_flight or next_page <= last_page:
+                while next_page <= last_page and len(in_flight) < self.concurrency:
+                    future = executor.submit(self.fetch_page, next_page, page_size, filters)
+                    in_flight[future] = next_page
+                    next_page += 1
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = in_flight.pop(future)
+                    try:
+                        jobs = future.result()
+                    except TheirStackFetchError:
+                        for pending in in_flight:
+                            pending.cancel()
+                        raise
+                    results[page] = jobs
+                    if len(jobs) < page_size:
+                        last_page = min(last_page, page)
+        
+        all_jobs = []
+        for page in range(last_page + 1):
+            all_jobs.extend(results[page])
+        complete = len(results[last_page]) < page_size and len(all_jobs) <= max_jobs
+        print(f"Fetched {len(all_jobs)} jobs in {last_page + 1} pages ({'complete' if complete else 'capped'})")
+        return all_jobs[:max_jobs], complete
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+def get_fetcher() -> TheirStackFetcher:
+    """Process-wide fetcher, so the keep-alive connections are shared"""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = TheirStackFetcher()
+        return _fetcher
+
 def fetch_roofing_jobs(page: int = 0, limit: int = 5) -> List[Dict[Any, Any]]:
-    """Fetch jobs from TheirStack API"""
-    print(f"\nAPI Key present: {bool(THEIRSTACK_API_KEY)}")
-    print(f"API Key value: {THEIRSTACK_API_KEY[:5]}..." if THEIRSTACK_API_KEY else "No API Key")
-    
+    """Fetch one page of jobs from TheirStack API"""
     if not THEIRSTACK_API_KEY:
         print("TheirStack API key not found, skipping job fetch")
         return []
     
     print(f"\nFetching jobs from TheirStack (page {page}, limit {limit})")
-    
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {THEIRSTACK_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    data = {
-        "page": page,
-        "limit": limit,
-        "posted_at_max_age_days": 30,
-        "job_title_pattern_or": ["roofing", "roofer"],
-        "job_country_code_or": ["US"],
-        "include_total_results": False,
-        "blur_company_data": False
-    }
-    
-    max_retries = 3
-    retry_delay = 2  # seconds
-    
-    for attempt in range(max_retries):
-        try:
-            print(f"\nMaking API request to {THEIRSTACK_API_URL}")
-            print(f"Headers: {headers}")
-            print(f"Data: {data}")
-            
-            response = requests.post(
-                THEIRSTACK_API_URL,
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            print(f"\nResponse status: {response.status_code}")
-            print(f"\nFull response text: {response.text}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"\nRaw API response data: {data}")
-                jobs = data.get('data', [])
-                print(f"Received {len(jobs)} jobs")
-                print(f"First job title: {jobs[0]['job_title'] if jobs else 'No jobs'}")
-                return jobs
-            else:
-                print(f"Error response: {response.text}")
-                
-        except requests.exceptions.Timeout:
-            print("\nRequest timed out")
-            if attempt < max_retries - 1:
-                print(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                print("Max retries reached")
-                return []
-                
-        except requests.exceptions.RequestException as e:
-            print(f"\nRequest failed: {str(e)}")
-            if attempt < max_retries - 1:
-                print(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                print("Max retries reached")
-                return []
-    
-    return []
+    try:
+        return get_fetcher().fetch_page(page, limit)
+    except TheirStackFetchError as e:
+        print(f"Error fetching jobs: {str(e)}")
+        return []
 
-def map_job_data(job_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Map TheirStack job data to our schema"""
+def theirstack_coordinates(job_data: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """The posting's own latitude/longitude, if TheirStack sent usable ones"""
+    try:
+        if job_data.get("latitude") and job_data.get("longitude"):
+            return float(job_data["latitude"]), float(job_data["longitude"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+def geocoding_address(job_data: Dict[str, Any]) -> Optional[str]:
+    """
+    The "City, ST, USA" address map_job_data would geocode for this
+    posting, or None if it needs no lookup (TheirStack coordinates, or no
+    parseable city and state)
+    """
+    if theirstack_coordinates(job_data):
+        return None
+    city, state = parse_city_state(job_data.get("long_location"))
+    if not city or not state or len(state) != 2:
+        return None
+    return f"{city}, {state}, USA"
+
+def map_job_data(
+    job_data: Dict[str, Any],
+    known_description_hash: str = None,
+    geocoded: Dict[str, Optional[Tuple[float, float]]] = None
+) -> Dict[str, Any]:
+    """
+    Map TheirStack job data to our schema. When the raw description hashes
+    to known_description_hash (the stored row's), rendering is skipped and
+    "description" is left out so the stored HTML is kept.
+    
+    Coordinates come from the posting itself when TheirStack has them,
+    else from `geocoded` (address -> coordinates, from a batch lookup),
+    else from a geocoding call for this job alone.
+    """
     try:
         print(f"\nMapping job: {job_data.get('job_title')}")
         
@@ -104,82 +246,57 @@ def map_job_data(job_data: Dict[str, Any]) -> Dict[str, Any]:
         print(f"Raw location: {location}")
         
         # Parse city and state from long_location (e.g., "New Orleans, LA 70163")
-        city = None
-        state = None
-        latitude = None
-        longitude = None
-        
-        if location and "," in location:
-            parts = [part.strip() for part in location.split(",")]
-            if len(parts) == 2:
-                city = parts[0]
-                # Split the second part to separate state from ZIP if present
-                state_parts = parts[1].strip().split()
-                if state_parts:
-                    state = state_parts[0]  # Take just the state code
-                    if len(state) == 2:  # Validate state code
-                        print(f"Successfully parsed - City: {city}, State: {state}")
-                        
-                        # Get coordinates using Google Geocoding API
-                        try:
-                            from ..utils.location_utils import get_coordinates_from_address
-                            address = f"{city}, {state}, USA"
-                            coords = get_coordinates_from_address(address)
-                            
-                            if coords:
-                                latitude, longitude = coords
-                                print(f"✓ Got coordinates: ({latitude}, {longitude})")
-                            else:
-                                print("✗ No coordinates found from geocoding service")
-                                # Try using the coordinates from TheirStack if available
-                                if job_data.get("latitude") and job_data.get("longitude"):
-                                    latitude = float(job_data["latitude"])
-                                    longitude = float(job_data["longitude"])
-                                    print(f"✓ Using TheirStack coordinates: ({latitude}, {longitude})")
-                        except Exception as e:
-                            print(f"✗ Error getting coordinates: {str(e)}")
-                            # Fallback to TheirStack coordinates
-                            if job_data.get("latitude") and job_data.get("longitude"):
-                                latitude = float(job_data["latitude"])
-                                longitude = float(job_data["longitude"])
-                                print(f"✓ Using TheirStack coordinates as fallback: ({latitude}, {longitude})")
-                    else:
-                        print(f"✗ Invalid state code format: {state}")
-            else:
-                print("✗ Could not parse city and state from location")
+        city, state = parse_city_state(location)
+        if state:
+            print(f"Parsed - City: {city}, State: {state}")
         else:
-            print("✗ Location string does not contain city and state")
-        
-        # Get the description and clean up the markdown
-        description = job_data.get("description", "")
-        description = description.replace("\\-", "-")
-        description = description.replace("\\&", "&")
-        description = description.replace("\\.", ".")
-        
-        # Convert markdown to HTML
-        html_description = markdown.markdown(
-            description,
-            extensions=['extra', 'nl2br']
-        )
+            print("✗ Could not parse city and state from location")
         
-        # Sanitize the HTML
-        sanitized_description = sanitize_html(html_description)
+        coords = theirstack_coordinates(job_data)
+        address = geocoding_address(job_data)
+        if coords:
+            print(f"✓ Using TheirStack coordinates: ({coords[0]}, {coords[1]})")
+        elif address:
+            if geocoded is not None and address in geocoded:
+                coords = geocoded[address]
+            else:
+                try:
+                    coords = get_coordinates_from_address(address)
+                except Exception as e:
+                    print(f"✗ Error getting coordinates: {str(e)}")
+            if coords:
+                print(f"✓ Got coordinates: ({coords[0]}, {coords[1]})")
+            else:
+                print("✗ No coordinates found from geocoding service")
+        elif state:
+            print(f"✗ Invalid state code format: {state}")
+        latitude, longitude = coords or (None, None)
+        
+        # Render the markdown description to sanitized HTML unless the
+        # stored row already has this exact description
+        raw_description = job_data.get("description") or ""
+        content_hash = description_hash(raw_description)
         
         # Map the rest of the data
         mapped_data = {
             "external_id": str(job_data.get("id")),
             "job_title": job_data.get("job_title"),
-            "description": sanitized_description,
+            "description_hash": content_hash,
             "location": location,
             "city": city,
             "state": state,
             "latitude": latitude,
             "longitude": longitude,
             "application_link": job_data.get("source_url"),
-            "posted_date": datetime.fromisoformat(job_data.get("date_posted")),
+            "posted_date": parse_posted_date(job_data.get("date_posted")),
             "is_active": True,
             "job_function": classify_job_function(job_data.get("job_title"))
         }
+        mapped_data["classified_by"] = settings.OPENAI_CLASSIFIER_MODEL if mapped_data["job_function"] else None
+        
+        if content_hash != known_description_hash:
+            mapped_data["description"] = render_description(raw_description, content_hash)
+            mapped_data["snippet"] = description_snippet(mapped_data["description"])
         
         print(f"Successfully mapped job data")
         return mapped_data
@@ -188,57 +305,309 @@ def map_job_data(job_data: Dict[str, Any]) -> Dict[str, Any]:
         print(f"Error mapping job data: {str(e)}")
         raise
 
-def sync_jobs():
-    """Fetch jobs from TheirStack and sync to our database"""
+# Fields of a TheirStack posting that feed map_job_data; a change in any
+# of them means the stored row needs to be re-mapped
+SOURCE_HASH_FIELDS = ("job_title", "description", "long_location", "date_posted", "source_url", "latitude", "longitude")
+
+UPSERT_CHUNK_SIZE = 500
+
+# Enrichment columns a transient classifier or geocoding failure leaves
+# None; updating a stored row keeps its value rather than erasing it
+KEEP_STORED_IF_NONE = ("job_function", "classified_by", "latitude", "longitude")
+
+# Bind parameter limits per statement (older SQLite builds cap at 999)
+MAX_BIND_PARAMS = {"postgresql": 32767, "sqlite": 999}
+
+def compute_source_hash(job_data: Dict[str, Any]) -> str:
+    """Stable hash of the posting fields we store"""
+    fields = [job_data.get(field) for field in SOURCE_HASH_FIELDS]
+    return hashlib.sha256(json.dumps(fields, default=str).encode()).hexdigest()
+
+def upsert_jobs(session, rows: List[Dict[str, Any]]) -> int:
+    """
+    INSERT ... ON CONFLICT (external_id) DO UPDATE for mapped job rows, in
+    chunks. Works on PostgreSQL and SQLite. Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+    
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Bulk upsert is not supported on {dialect}")
+    
+    # A multi-row VALUES needs the same columns in every row, and rows that
+    # kept their stored description don't carry one
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    
+    for columns, group in groups.items():
+        chunk_size = max(1, min(UPSERT_CHUNK_SIZE, MAX_BIND_PARAMS[dialect] // len(columns)))
+        for start in range(0, len(group), chunk_size):
+            stmt = insert(Job).values(group[start:start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["external_id"],
+                set_={
+                    column: (
+                        func.coalesce(stmt.excluded[column], Job.__table__.c[column])
+                        if column in KEEP_STORED_IF_NONE else stmt.excluded[column]
+                    )
+                    for column in columns if column != "external_id"
+                }
+            )
+            session.execute(stmt)
+    return len(rows)
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (date-only strings, SQLite columns) as UTC"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def parse_posted_date(value: str) -> datetime:
+    """TheirStack date_posted ("2025-01-31" or ISO timestamp) as an aware datetime"""
+    return as_utc(datetime.fromisoformat(value))
+
+def get_sync_state(session, source: str = SYNC_SOURCE) -> SyncState:
+    state = session.get(SyncState, source)
+    if state is None:
+        state = SyncState(source=source)
+        session.add(state)
+    return state
+
+def deactivate_jobs(session, external_ids: List[str]) -> int:
+    """Mark TheirStack jobs inactive in chunks; returns rows updated"""
+    updated = 0
+    for start in range(0, len(external_ids), UPSERT_CHUNK_SIZE):
+        chunk = external_ids[start:start + UPSERT_CHUNK_SIZE]
+        updated += session.query(Job).filter(Job.external_id.in_(chunk)).update(
+            {Job.is_active: False}, synchronize_session=False
+        )
+    return updated
+
+def find_duplicates(session, fingerprints: Dict[str, Tuple[str, str]], stored_ids) -> Dict[str, str]:
+    """
+    Map external_id -> external_id of the posting it repeats, for incoming
+    postings whose fingerprint key matches an active stored job or an
+    earlier incoming posting, with descriptions within
+    DEDUPE_SIMHASH_MAX_DISTANCE bits. Postings already stored under their
+    own external_id (stored_ids) are kept, never collapsed.
+    """
+    max_distance = settings.DEDUPE_SIMHASH_MAX_DISTANCE
+    keys = sorted({key for key, _ in fingerprints.values()})
+    kept: Dict[str, List[Tuple[str, int]]] = {}
+    for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+        for external_id, key, simhash in (
+            session.query(Job.external_id, Job.fingerprint, Job.description_simhash)
+            .filter(Job.fingerprint.in_(keys[start:start + UPSERT_CHUNK_SIZE]), Job.is_active.is_(True))
+            .all()
+        ):
+            kept.setdefault(key, []).append((external_id, int(simhash or "0", 16)))
+    
+    duplicates = {}
+    # Stored postings first, so an existing row stays the copy that is kept
+    for external_id, (key, simhash) in sorted(fingerprints.items(), key=lambda item: item[0] not in stored_ids):
+        value = int(simhash, 16)
+        if external_id not in stored_ids:
+            original = next(
+                (other for other, other_value in kept.get(key, ())
+                 if other != external_id and hamming_distance(value, other_value) <= max_distance),
+                None
+            )
+            if original is not None:
+                duplicates[external_id] = original
+                continue
+        kept.setdefault(key, []).append((external_id, value))
+    return duplicates
+
+def sync_jobs(mode: str = "incremental", report: Callable[..., None] = None):
+    """
+    Fetch jobs from TheirStack and sync to our database.
+
+    incremental: only postings on or after the watermark's day are fetched
+        (oldest first, so a capped fetch never skips anything and the next
+        run picks up where it stopped), and jobs that have aged out of the
+        SYNC_WINDOW_DAYS window are marked inactive.
+    full: the whole window is fetched and, if the listing came back
+        complete (under SYNC_MAX_JOBS), every active TheirStack job that is
+        no longer listed is marked inactive.
+    A failed fetch raises before anything is written. Nothing is deleted
+    in either mode. `report` receives progress counts.
+    """
+    report = report or (lambda **counts: None)
+    if mode not in SYNC_MODES:
+        raise ValueError(f"Unknown sync mode: {mode}")
+    
     session = next(get_db_session())
     try:
-        print("\nStarting job sync...")
-        
-        # Fetch multiple pages until we get enough jobs
-        all_jobs_data = []
-        page = 0
-        while len(all_jobs_data) < 15:  # Changed from 75 to 15
-            jobs_data = fetch_roofing_jobs(page=page, limit=15)  # Changed limit from 25 to 15
-            if not jobs_data:  # If we get no jobs, break
-                break
-            all_jobs_data.extend(jobs_data)
-            page += 1
-            print(f"\nFetched page {page}, total jobs so far: {len(all_jobs_data)}")
+        print(f"\nStarting {mode} job sync...")
+        state = get_sync_state(session)
+        
+        filters = {}
+        if mode == "incremental":
+            # Oldest first, including the first run (no watermark yet), so a
+            # capped fetch never leaves older postings behind the watermark
+            filters["order_by"] = [{"desc": False, "field": "date_posted"}]
+            if state.watermark:
+                filters["posted_at_gte"] = state.watermark.date().isoformat()
+                print(f"Fetching postings since {filters['posted_at_gte']}")
+        
+        # Fetch pages concurrently until we have enough jobs or run out
+        all_jobs_data, complete = get_fetcher().fetch_jobs(
+            max_jobs=settings.SYNC_MAX_JOBS,
+            page_size=settings.THEIRSTACK_PAGE_SIZE,
+            filters=filters
+        )
         
         print(f"\nFetched total of {len(all_jobs_data)} jobs from TheirStack")
+        report(fetched=len(all_jobs_data))
         
-        synced_count = 0
+        # Pages can overlap; keep the last copy of each posting
+        incoming = {}
         for job_data in all_jobs_data:
+            if job_data.get("id") is not None:
+                incoming[str(job_data["id"])] = job_data
+        
+        # Resolve every external_id up front (a few chunked queries) and skip
+        # unchanged jobs before any geocoding, classification or rendering
+        existing = {}
+        incoming_ids = list(incoming)
+        for start in range(0, len(incoming_ids), UPSERT_CHUNK_SIZE):
+            for external_id, source_hash, is_active, known_description_hash, job_id, known_fingerprint in (
+                session.query(Job.external_id, Job.source_hash, Job.is_active, Job.description_hash, Job.id, Job.fingerprint)
+                .filter(Job.external_id.in_(incoming_ids[start:start + UPSERT_CHUNK_SIZE]))
+                .all()
+            ):
+                existing[external_id] = (source_hash, is_active, known_description_hash, job_id, known_fingerprint)
+        
+        # Collapse reposts and syndicated copies of a posting onto the one
+        # already stored (or the first one fetched), so they are never
+        # geocoded, classified or rendered
+        fingerprints = {external_id: fingerprint(job_data) for external_id, job_data in incoming.items()}
+        duplicates = find_duplicates(session, fingerprints, existing)
+        
+        pending = {}
+        reactivate = []
+        refingerprint = []
+        for external_id, job_data in incoming.items():
+            if external_id in duplicates:
+                continue
+            source_hash = compute_source_hash(job_data)
+            known_hash, is_active, _, job_id, known_fingerprint = existing.get(external_id, (None,) * 5)
+            if known_hash != source_hash:
+                pending[external_id] = (job_data, source_hash)
+                continue
+            if not is_active:
+                reactivate.append(external_id)
+            if known_fingerprint is None:
+                # Stored before fingerprinting; fill it in without re-mapping
+                key, simhash = fingerprints[external_id]
+                refingerprint.append({"id": job_id, "fingerprint": key, "description_simhash": simhash})
+        
+        new_count = sum(1 for external_id in pending if external_id not in existing)
+        unchanged_count = len(incoming) - len(pending) - len(duplicates)
+        print(f"New: {new_count}, changed: {len(pending) - new_count}, unchanged: {unchanged_count}, duplicates: {len(duplicates)}")
+        report(new=new_count, changed=len(pending) - new_count, unchanged=unchanged_count, duplicates=len(duplicates))
+        
+        # Classify every distinct title up front in batched requests; the
+        # per-job lookups in map_job_data are then cache hits
+        classify_job_titles(job_data.get("job_title") for job_data, _ in pending.values())
+        
+        # Geocode each distinct city once, concurrently, for the postings
+        # TheirStack sent no coordinates for
+        geocoded = geocode_addresses(geocoding_address(job_data) for job_data, _ in pending.values())
+        print(f"Geocoded {len(geocoded)} distinct addresses")
+        
+        rows = []
+        errors = 0
+        for external_id, (job_data, source_hash) in pending.items():
             try:
-                mapped_data = map_job_data(job_data)
-                print(f"\nProcessing job: {mapped_data['job_title']}")
-                
-                existing_job = session.query(Job).filter_by(
-                    external_id=mapped_data["external_id"]
-                ).first()
-                
-                if not existing_job:
-                    print(f"\nProcessing job: {mapped_data['job_title']}")
-                    new_job = Job(**mapped_data)
-                    session.add(new_job)
-                    synced_count += 1
-                else:
-                    print(f"Job already exists: {mapped_data['job_title']}")
+                mapped_data = map_job_data(
+                    job_data,
+                    known_description_hash=existing.get(external_id, (None,) * 5)[2],
+                    geocoded=geocoded
+                )
+                mapped_data["source_hash"] = source_hash
+                mapped_data["fingerprint"], mapped_data["description_simhash"] = fingerprints[external_id]
+                rows.append(mapped_data)
             except Exception as e:
                 print(f"Error processing job: {str(e)}")
+                errors += 1
                 continue
+            finally:
+                report(mapped=len(rows), errors=errors)
         
-        print("\nCommitting changes to database...")
-        session.commit()
+        print("\nWriting changes to database...")
+        synced_count = upsert_jobs(session, rows)
+        if refingerprint:
+            session.execute(update(Job), refingerprint)
+        
+        # Postings past the window stay retired even if TheirStack still lists them
+        cutoff = datetime.now(timezone.utc) - timedelta(days=SYNC_WINDOW_DAYS)
+        reactivated_count = 0
+        for start in range(0, len(reactivate), UPSERT_CHUNK_SIZE):
+            reactivated_count += session.query(Job).filter(
+                Job.external_id.in_(reactivate[start:start + UPSERT_CHUNK_SIZE]),
+                Job.posted_date >= cutoff
+            ).update({Job.is_active: True}, synchronize_session=False)
+        
+        # Reconcile: retire postings instead of deleting them
+        deactivated_count = 0
+        if mode == "full" and complete:
+            # Only a complete listing proves a posting is gone
+            active_ids = {
+                external_id for (external_id,) in
+                session.query(Job.external_id)
+                .filter(Job.external_id.isnot(None), Job.is_active.is_(True))
+                .all()
+            }
+            # A stored job whose repost was collapsed onto it is still listed
+            listed = set(incoming) | set(duplicates.values())
+            deactivated_count = deactivate_jobs(session, sorted(active_ids - listed))
+        elif mode == "full":
+            print("Fetch hit SYNC_MAX_JOBS; skipping vanished-posting reconciliation")
         
-        # Verify the jobs were saved
-        final_count = session.query(Job).count()
-        print(f"\nFinal job count in database: {final_count}")
+        deactivated_count += session.query(Job).filter(
+            Job.external_id.isnot(None),
+            Job.is_active.is_(True),
+            Job.posted_date < cutoff
+        ).update({Job.is_active: False}, synchronize_session=False)
+        
+        # Advance the watermark to the newest posting actually ingested. An
+        # incremental fetch is oldest first, so even a capped one covers
+        # everything before its newest day; a capped full fetch is newest
+        # first and leaves a gap, so it doesn't move the watermark.
+        posted_dates = []
+        for job_data in incoming.values():
+            try:
+                posted_dates.append(parse_posted_date(job_data["date_posted"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        if posted_dates and (mode == "incremental" or complete):
+            newest = max(posted_dates)
+            if mode == "full" or state.watermark is None or newest > as_utc(state.watermark):
+                state.watermark = newest
+            elif not complete and newest.date() == as_utc(state.watermark).date():
+                # Every posting fetched is on the watermark day, so the next
+                # run would fetch the same ones again
+                print(f"Warning: more than SYNC_MAX_JOBS ({settings.SYNC_MAX_JOBS}) postings on {newest.date()}; raise it to get past them")
+        
+        state.last_mode = mode
+        state.last_synced_count = synced_count
+        state.last_deactivated_count = deactivated_count
+        state.last_run_at = datetime.now(timezone.utc)
+        if synced_count or reactivated_count or deactivated_count:
+            bump_table_version(session, "jobs")
+        session.commit()
         
+        print(f"\nSynced {synced_count} jobs, deactivated {deactivated_count}")
+        report(synced=synced_count, deactivated=deactivated_count)
         return synced_count
     except Exception as e:
         print(f"\nError during sync: {str(e)}")
         session.rollback()
         raise e
     finally:
-        session.close() 
\ No newline at end of file
+        session.close()
@@ -0,0 +1,199 @@
+# backend/app/utils/geocode_cache.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.geocode_cache_model import GeocodeCacheEntry
+
+logger = logging.getLogger(__name__)
+
+Coordinates = Optional[Tuple[float, float]]
+
+# Sentinel for "not cached", since None is a valid (negative) cached value
+_MISSING = object()
+
+# Keys per query when preloading a batch
+PRELOAD_CHUNK_SIZE = 500
+
+def normalize_key(kind: str, value: str) -> str:
+    """Build the cache key for a lookup, e.g. ("address", " Austin,  TX, USA") -> "address:austin, tx, usa" """
+    return f"{kind}:{' '.join(value.split()).lower()}"
+
+class GeocodeCache:
+    """
+    Two-level cache for geocoding results: a bounded in-process LRU in front
+    of the geocode_cache table. Coordinates are cached forever; "no result"
+    answers are cached for negative_ttl seconds so typos don't hit Google
+    on every request but new addresses eventually resolve.
+    """
+
+    def __init__(self, max_size: int, negative_ttl: int):
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[str, Tuple[Coordinates, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "errors": 0,
+        }
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _get_memory(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            coords, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return coords
+
+    def _put_memory(self, key: str, coords: Coordinates, expires_at: Optional[float]):
+        with self._lock:
+            self._entries[key] = (coords, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _decode(entry: GeocodeCacheEntry):
+        """(coords, expires_at) for a stored entry, or (_MISSING, None) if it has expired"""
+        expires_at = None
+        if entry.expires_at is not None:
+            expires = entry.expires_at
+            if expires.tzinfo is None:  # SQLite drops the timezone
+                expires = expires.replace(tzinfo=timezone.utc)
+            expires_at = expires.timestamp()
+            if expires_at <= time.time():
+                return _MISSING, None
+        if entry.latitude is None or entry.longitude is None:
+            return None, expires_at
+        return (entry.latitude, entry.longitude), expires_at
+
+    def _get_db(self, key: str):
+        try:
+            with SessionLocal() as session:
+                entry = session.get(GeocodeCacheEntry, key)
+                if entry is None:
+                    return _MISSING, None
+                return self._decode(entry)
+        except Exception as e:
+            logger.warning(f"Geocode cache read failed for {key}: {str(e)}")
+            return _MISSING, None
+
+    def preload(self, keys: List[str]) -> Set[str]:
+        """
+        Copy the stored entries for keys into memory with one query per
+        PRELOAD_CHUNK_SIZE keys, so a batch of lookups doesn't read the
+        table one key at a time. Returns the keys that are cached nowhere;
+        their lookups can pass check_db=False.
+        """
+        with self._lock:
+            missing = [key for key in dict.fromkeys(keys) if key not in self._entries]
+        try:
+            with SessionLocal() as session:
+                for start in range(0, len(missing), PRELOAD_CHUNK_SIZE):
+                    chunk = missing[start:start + PRELOAD_CHUNK_SIZE]
+                    for entry in session.query(GeocodeCacheEntry).filter(GeocodeCacheEntry.key.in_(chunk)):
+                        coords, expires_at = self._decode(entry)
+                        if coords is not _MISSING:
+                            self._put_memory(entry.key, coords, expires_at)
+        except Exception as e:
+            logger.warning(f"Geocode cache preload failed: {str(e)}")
+            return set()
+        with self._lock:
+            return {key for key in missing if key not in self._entries}
+
+    def _put_db(self, key: str, coords: Coordinates, expires_at: Optional[float]):
+        self.put_many([(key, coords, expires_at)])
+
+    def put_many(self, entries: List[Tuple[str, Coordinates, Optional[float]]]):
+        """Store (key, coords, expires_at) entries in the table in one transaction"""
+        if not entries:
+            return
+        try:
+            with SessionLocal() as session:
+                for key, coords, expires_at in entries:
+                    session.merge(GeocodeCacheEntry(
+                        key=key,
+                        latitude=coords[0] if coords else None,
+                        longitude=coords[1] if coords else None,
+                        expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc) if expires_at else None
+                    ))
+                session.commit()
+        except Exception as e:
+            # Another worker may have cached the same key first; either way
+            # the in-process entries are still good
+            logger.warning(f"Geocode cache write failed for {', '.join(key for key, _, _ in entries[:3])}: {str(e)}")
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Tuple[Coordinates, bool]],
+        check_db: bool = True,
+        pending_writes: List = None
+    ) -> Coordinates:
+        """
+        Return cached coordinates for key, calling fetch() on a miss.
+        fetch returns (coords, cacheable); transient failures should return
+        cacheable=False so they are retried on the next lookup.
+        
+        For batches: check_db=False skips the table read for keys preload()
+        has just found missing, and a pending_writes list collects new
+        entries for one put_many() instead of a commit per lookup.
+        """
+        coords = self._get_memory(key)
+        if coords is not _MISSING:
+            self._count("negative_hits" if coords is None else "memory_hits")
+            return coords
+
+        coords, expires_at = self._get_db(key) if check_db else (_MISSING, None)
+        if coords is not _MISSING:
+            self._count("negative_hits" if coords is None else "db_hits")
+            self._put_memory(key, coords, expires_at)
+            return coords
+
+        self._count("misses")
+        coords, cacheable = fetch()
+        if not cacheable:
+            self._count("errors")
+            return coords
+
+        expires_at = None if coords else time.time() + self.negative_ttl
+        self._put_memory(key, coords, expires_at)
+        if pending_writes is not None:
+            pending_writes.append((key, coords, expires_at))
+        else:
+            self._put_db(key, coords, expires_at)
+        return coords
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["negative_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop the in-process entries (the table is left alone)"""
+        with self._lock:
+            self._entries.clear()
+
+geocode_cache = GeocodeCache(
+    max_size=settings.GEOCODE_CACHE_SIZE,
+    negative_ttl=settings.GEOCODE_NEGATIVE_TTL_SECONDS
+)
@@ -1,7 +1,13 @@
 import bleach
+import hashlib
+import html
+import markdown
+import re
+import threading
+from collections import OrderedDict
 
 ALLOWED_TAGS = [
-    'p', 'br', 'strong', 'b', 'i', 'em', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 
+    'p', 'br', 'strong', 'b', 'i', 'em', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4',
     'h5', 'h6', 'a', 'span', 'div', 'blockquote', 'pre', 'code'
 ]
 
@@ -11,11 +17,74 @@ ALLOWED_ATTRIBUTES = {
     'span': ['class'],
 }
 
+# Rendered descriptions kept in memory, keyed by description_hash
+RENDER_CACHE_SIZE = 2048
+
+# Characters of plain text kept in Job.snippet for list views
+SNIPPET_LENGTH = 150
+
+# Markdown and bleach.Cleaner instances are not thread-safe, so each
+# thread builds its own once and reuses it
+_local = threading.local()
+
+_render_cache: "OrderedDict[str, str]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+def _get_cleaner() -> bleach.Cleaner:
+    if not hasattr(_local, "cleaner"):
+        _local.cleaner = bleach.Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            strip=True
+        )
+    return _local.cleaner
+
+def _get_markdown() -> markdown.Markdown:
+    if not hasattr(_local, "markdown"):
+        _local.markdown = markdown.Markdown(extensions=['extra', 'nl2br'])
+    return _local.markdown
+
 def sanitize_html(html_content: str) -> str:
     """Sanitize HTML content to prevent XSS attacks"""
-    return bleach.clean(
-        html_content,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        strip=True
-    ) 
\ No newline at end of file
+    return _get_cleaner().clean(html_content)
+
+def description_hash(raw_description: str) -> str:
+    """Hash of a raw (markdown) description, stored on Job.description_hash"""
+    return hashlib.sha256((raw_description or "").encode("utf-8")).hexdigest()
+
+def render_description(raw_description: str, content_hash: str = None) -> str:
+    """
+    Convert a TheirStack markdown description to sanitized HTML. Results are
+    cached by content hash, so reposted or unchanged descriptions are only
+    rendered once per process.
+    """
+    content_hash = content_hash or description_hash(raw_description)
+    with _render_cache_lock:
+        cached = _render_cache.get(content_hash)
+        if cached is not None:
+            _render_cache.move_to_end(content_hash)
+            return cached
+
+    # Clean up the escaped markdown TheirStack sends
+    description = (raw_description or "").replace("\\-", "-").replace("\\&", "&").replace("\\.", ".")
+
+    md = _get_markdown()
+    try:
+        html_description = md.convert(description)
+    finally:
+        md.reset()
+    sanitized = sanitize_html(html_description)
+
+    with _render_cache_lock:
+        _render_cache[content_hash] = sanitized
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return sanitized
+
+def description_snippet(description_html: str, length: int = SNIPPET_LENGTH) -> str:
+    """Plain-text preview of a description, as shown on job cards"""
+    text = html.unescape(re.sub(r"<[^>]*>", " ", description_html or ""))
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rstrip() + "..."
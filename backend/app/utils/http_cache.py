@@ -0,0 +1,81 @@
+# backend/app/utils/http_cache.py
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Tuple
+from fastapi import Request, Response
+from ..core.config import settings
+
+def cache_control() -> str:
+    return (
+        f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+        f"s-maxage={settings.HTTP_CACHE_S_MAXAGE}, "
+        f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Weak comparison: a CDN may hand back our tag with or without W/
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have whole-second precision
+    return since is not None and last_modified.replace(microsecond=0) <= since
+
+class ConditionalGet:
+    """
+    Validators for a response derived from one table. The ETag covers the
+    table version (from get_table_version) plus whatever identifies the
+    representation (path and query), so it can be computed before doing
+    any database or serialization work.
+    """
+
+    def __init__(self, request: Request, table_name: str, version: Optional[Tuple[int, Optional[datetime]]], *parts):
+        self.request = request
+        self.etag = None
+        self.last_modified = None
+        # Table version the validators were built from (None if unknown)
+        self.version = None
+        if version is None:
+            return
+        number, updated_at = version
+        self.version = number
+        identity = "|".join(str(part) for part in (request.url.path, sorted(request.query_params.multi_items()), *parts))
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16]
+        self.etag = f'W/"{table_name}-{number}-{digest}"'
+        self.last_modified = updated_at
+
+    @property
+    def headers(self) -> dict:
+        headers = {"Cache-Control": cache_control()}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def not_modified(self) -> Optional[Response]:
+        """A 304 response if the client's copy is current, else None"""
+        if self.etag is None:
+            return None
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+            fresh = _etag_matches(if_none_match, self.etag)
+        else:
+            if_modified_since = self.request.headers.get("if-modified-since")
+            fresh = bool(if_modified_since and self.last_modified and _not_modified_since(if_modified_since, self.last_modified))
+        if fresh:
+            return Response(status_code=304, headers=self.headers)
+        return None
+
+    def apply(self, response: Response):
+        """Attach the validators and Cache-Control to a full response"""
+        response.headers.update(self.headers)
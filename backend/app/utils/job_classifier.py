@@ -1,54 +1,176 @@
-import os
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 from openai import OpenAI
 from ..core.config import settings
+from ..core.metrics import track_external
+from ..core.database import SessionLocal
+from ..models.job_title_classification_model import JobTitleClassification
+from .rate_limiter import RateLimiter
 
-def classify_job_function(job_title: str) -> str | None:
+VALID_FUNCTIONS = {"sales", "labor", "production", "management"}
+
+SYSTEM_PROMPT = (
+    "You are a job title classifier for the roofing industry. "
+    "Classify each job title into one of these categories: "
+    "SALES, LABOR, PRODUCTION, MANAGEMENT. "
+    "You will receive a JSON object mapping ids to job titles. "
+    "Respond with a JSON object mapping the same ids to the category name in all caps."
+)
+
+# Title segments that advertise the posting rather than describe the role,
+# e.g. "Roofer - Immediate Hire" or "Roofer | $25/hr"
+NOISE_SEGMENT = re.compile(
+    r"\b(hiring|hire|immediate(ly)?|urgent(ly)?|now|asap|apply|today|bonus|"
+    r"pay|paid|weekly|daily|per hour|hourly|/hr|full[ -]?time|part[ -]?time|"
+    r"no experience|will train|up to|starting at)\b|\$|\d+k\b",
+    re.IGNORECASE
+)
+SEGMENT_SEPARATORS = re.compile(r"\s+[-–—|/]\s+|[|!]|\s*[–—]\s*")
+
+_client = None
+_client_lock = threading.Lock()
+
+# Shared by every thread that calls OpenAI
+_rate_limiter = RateLimiter(settings.CLASSIFIER_RATE_LIMIT_PER_SECOND)
+
+# normalized title -> job function, for the current model only
+_memo: Dict[str, str] = {}
+_memo_lock = threading.Lock()
+
+def _get_client() -> OpenAI:
+    """Shared OpenAI client, so connections are reused across calls"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        return _client
+
+def normalize_title(job_title: str) -> str:
     """
-    Classifies a job title into predefined categories using OpenAI's API.
-    Returns None if classification fails.
+    Reduce a job title to the part that determines its function, so that
+    "Roofer", "ROOFER" and "Roofer - Immediate Hire" share one cache entry.
     """
-    api_key = settings.OPENAI_API_KEY
-    if not api_key:
-        print("OPENAI_API_KEY not found in settings")
-        return None
+    title = re.sub(r"\([^)]*\)|\[[^\]]*\]", " ", job_title or "")
+    segments = [s for s in SEGMENT_SEPARATORS.split(title) if s and s.strip()]
+    kept = [s for s in segments if not NOISE_SEGMENT.search(s)] or segments[:1]
+    title = " ".join(kept).lower()
+    title = re.sub(r"[^a-z0-9&+ ]+", " ", title)
+    return " ".join(title.split())
 
+def _load_cached(keys: List[str], model: str) -> Dict[str, str]:
+    """Fill the in-process memo from the job_title_classifications table"""
+    found = {}
+    if not keys:
+        return found
     try:
-        # Initialize the client with the API key
-        client = OpenAI(api_key=api_key)
-        
-        print(f"Classifying job title: {job_title}")  # Debug log
-        
-        # Create the chat completion using the new API syntax
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        with SessionLocal() as session:
+            rows = session.query(JobTitleClassification).filter(
+                JobTitleClassification.normalized_title.in_(keys),
+                JobTitleClassification.model == model
+            ).all()
+            found = {row.normalized_title: row.job_function for row in rows}
+    except Exception as e:
+        print(f"Error reading cached classifications: {str(e)}")
+    with _memo_lock:
+        _memo.update(found)
+    return found
+
+def _store(results: Dict[str, str], model: str):
+    with _memo_lock:
+        _memo.update(results)
+    try:
+        with SessionLocal() as session:
+            for key, job_function in results.items():
+                session.merge(JobTitleClassification(
+                    normalized_title=key,
+                    job_function=job_function,
+                    model=model
+                ))
+            session.commit()
+    except Exception as e:
+        print(f"Error saving classifications: {str(e)}")
+
+def _classify_batch(titles: List[str], model: str) -> Dict[str, str]:
+    """Classify up to CLASSIFIER_BATCH_SIZE normalized titles in one request"""
+    payload = {str(i): title for i, title in enumerate(titles)}
+    _rate_limiter.wait()
+    with track_external("openai"):
+        response = _get_client().chat.completions.create(
+            model=model,
             messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a job title classifier for the roofing industry. "
-                        "Classify the job title into one of these categories: "
-                        "SALES, LABOR, PRODUCTION, MANAGEMENT. "
-                        "Return only the category name in all caps."
-                    )
-                },
-                {
-                    "role": "user",
-                    "content": f"Classify this job title: {job_title}"
-                }
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(payload)}
             ],
-            max_tokens=10,
+            response_format={"type": "json_object"},
+            max_tokens=10 * len(titles) + 20,
             temperature=0
         )
+    answers = json.loads(response.choices[0].message.content)
+
+    results = {}
+    for i, title in enumerate(titles):
+        classification = str(answers.get(str(i), "")).strip().lower()
+        if classification in VALID_FUNCTIONS:
+            results[title] = classification
+        else:
+            print(f"Unexpected classification for '{title}': {classification!r}")
+    return results
+
+def classify_job_titles(job_titles: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Classify many job titles at once. Titles are normalized and looked up in
+    the in-process memo and the job_title_classifications table; only the
+    remaining distinct titles are sent to OpenAI, CLASSIFIER_BATCH_SIZE per
+    request and up to CLASSIFIER_CONCURRENCY requests at a time.
+    Returns {original title: function or None}.
+    """
+    job_titles = [t for t in job_titles if t]
+    keys = {title: normalize_title(title) for title in job_titles}
+    model = settings.OPENAI_CLASSIFIER_MODEL
+
+    with _memo_lock:
+        known = {key: _memo[key] for key in set(keys.values()) if key in _memo}
+    missing = sorted(set(keys.values()) - set(known))
+    known.update(_load_cached(missing, model))
+    missing = [key for key in missing if key not in known]
+
+    if missing and not settings.OPENAI_API_KEY:
+        print("OPENAI_API_KEY not found in settings")
+    elif missing:
+        batch_size = max(1, settings.CLASSIFIER_BATCH_SIZE)
+        batches = [missing[start:start + batch_size] for start in range(0, len(missing), batch_size)]
+        print(f"Classifying {len(missing)} distinct job titles in {len(batches)} batches of up to {batch_size}")
         
-        classification = response.choices[0].message.content.strip()
-        print(f"Classification result: {classification}")  # Debug log
-        # Convert to lowercase to match the enum values
-        classification = classification.lower()
-        print(f"Converted to lowercase: {classification}")  # Debug log
-        return classification
-    
-    except Exception as e:
-        print(f"Error classifying job title:")
-        print(f"Error message: {str(e)}")
-        print(f"Error type: {type(e)}")
+        def classify(batch: List[str]) -> Dict[str, str]:
+            try:
+                results = _classify_batch(batch, model)
+            except Exception as e:
+                print(f"Error classifying job titles:")
+                print(f"Error message: {str(e)}")
+                print(f"Error type: {type(e)}")
+                return {}
+            _store(results, model)
+            return results
+        
+        workers = max(1, min(settings.CLASSIFIER_CONCURRENCY, len(batches)))
+        if workers == 1:
+            for batch in batches:
+                known.update(classify(batch))
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="classifier") as executor:
+                for results in executor.map(classify, batches):
+                    known.update(results)
+
+    return {title: known.get(key) for title, key in keys.items()}
+
+def classify_job_function(job_title: str) -> str | None:
+    """
+    Classifies a job title into predefined categories using OpenAI's API.
+    Returns None if classification fails.
+    """
+    if not job_title:
         return None
+    return classify_job_titles([job_title]).get(job_title)
@@ -0,0 +1,58 @@
+# backend/app/utils/job_fingerprint.py
+
+import hashlib
+import re
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from .location_utils import parse_city_state
+
+# Words per description shingle fed to SimHash
+SHINGLE_SIZE = 3
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Bit i of a 64-bit hash, most significant first
+_BIT_MASKS = np.uint64(1) << np.arange(63, -1, -1, dtype=np.uint64)
+
+def _normalize(value: Optional[str]) -> str:
+    return " ".join(_WORD.findall((value or "").lower()))
+
+def company_name(job_data: Dict[str, Any]) -> Optional[str]:
+    """Company name from a TheirStack posting (plain field or company_object)"""
+    return job_data.get("company") or (job_data.get("company_object") or {}).get("name")
+
+def posting_key(job_title: str, company: str, city: str, state: str) -> str:
+    """
+    Hash of the normalized title, company and city/state. Reposts and
+    syndicated copies of one job share it; their descriptions are then
+    compared by SimHash.
+    """
+    parts = [_normalize(job_title), _normalize(company), _normalize(city), _normalize(state)]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of the word shingles of text (markdown or HTML markup
+    is ignored). Small edits flip only a few bits, so near-identical
+    descriptions sit within a small Hamming distance of each other.
+    """
+    words = _WORD.findall((text or "").lower())
+    if not words:
+        return 0
+    shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))}
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big") for shingle in shingles],
+        dtype=np.uint64
+    )
+    # Each shingle votes +1/-1 per bit; the majority sets the bit
+    votes = ((hashes[:, None] & _BIT_MASKS) != 0).sum(axis=0) * 2 - len(hashes)
+    return int(sum(1 << (63 - bit) for bit in np.flatnonzero(votes > 0)))
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+def fingerprint(job_data: Dict[str, Any]) -> Tuple[str, str]:
+    """(posting_key, description SimHash as 16 hex digits) for a TheirStack posting"""
+    city, state = parse_city_state(job_data.get("long_location"))
+    key = posting_key(job_data.get("job_title"), company_name(job_data), city, state)
+    return key, f"{simhash(job_data.get('description')):016x}"
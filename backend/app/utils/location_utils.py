@@ -1,96 +1,149 @@
-from typing import Optional, Tuple
-from math import radians, sin, cos, sqrt, atan2
+from typing import Dict, Iterable, Optional, Tuple, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from math import radians, degrees, sin, cos, sqrt, atan2, asin
 import logging
+import threading
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from ..core.config import settings
+from ..core.metrics import track_external
+from .geocode_cache import geocode_cache, normalize_key
+from .zip_centroids import zip_centroids
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_coordinates_from_zip(zip_code: str) -> Optional[Tuple[float, float]]:
-    """Get latitude and longitude from a ZIP code using Google Geocoding API."""
+EARTH_RADIUS_MILES = 3959.87433
+
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# Google statuses that mean "this input has no location", as opposed to
+# quota or server problems that are worth retrying later
+DEFINITIVE_GEOCODE_STATUSES = {"OK", "ZERO_RESULTS"}
+
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session() -> requests.Session:
+    """Shared keep-alive session, pooled for GEOCODE_CONCURRENCY threads"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max(1, settings.GEOCODE_CONCURRENCY)))
+        return _session
+
+def _google_geocode(params: dict, label: str) -> Tuple[Optional[Tuple[float, float]], bool]:
+    """
+    Call the Google Geocoding API. Returns (coords, cacheable) where
+    cacheable is False for transient failures that shouldn't be cached.
+    """
+    # Verify API key is not empty
+    if not settings.GOOGLE_MAPS_API_KEY:
+        logger.error("Google Maps API key is not set")
+        return None, False
+    
     try:
-        logger.info(f"Looking up ZIP: {zip_code}")
-        
-        # Build the Google Geocoding API URL
-        base_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        params = {
-            "address": zip_code,
-            "components": "country:US|postal_code:" + zip_code,
-            "key": settings.GOOGLE_MAPS_API_KEY
-        }
-        
-        # Make the API request
-        response = requests.get(base_url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] == "OK" and data["results"]:
-            location = data["results"][0]["geometry"]["location"]
-            lat, lon = location["lat"], location["lng"]
-            logger.info(f"Found coordinates for ZIP {zip_code}: ({lat}, {lon})")
-            return (float(lat), float(lon))
-        
-        logger.error(f"No location found for ZIP code: {zip_code}")
-        return None
-        
+        with track_external("google_geocoding") as call:
+            response = _get_session().get(
+                GEOCODE_URL,
+                params={**params, "key": settings.GOOGLE_MAPS_API_KEY},
+                timeout=settings.GEOCODE_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+            data = response.json()
+            if data.get("status") not in DEFINITIVE_GEOCODE_STATUSES:
+                call.fail()
     except Exception as e:
-        logger.error(f"Error looking up ZIP {zip_code}: {str(e)}")
-        return None
+        logger.error(f"Error looking up {label}: {str(e)}")
+        return None, False
+    
+    status = data.get("status")
+    if data.get("error_message"):
+        logger.error(f"Google API Error: {data.get('error_message')}")
+    
+    if status == "OK" and data.get("results"):
+        location = data["results"][0]["geometry"]["location"]
+        lat, lon = location["lat"], location["lng"]
+        logger.info(f"Found coordinates for {label}: ({lat}, {lon})")
+        return (float(lat), float(lon)), True
+    
+    logger.error(f"No location found for {label} (status: {status})")
+    return None, status in DEFINITIVE_GEOCODE_STATUSES
+
+def get_coordinates_from_zip(zip_code: str) -> Optional[Tuple[float, float]]:
+    """
+    Get latitude and longitude from a ZIP code: the offline ZIP centroid
+    table first, then the geocode cache and Google Geocoding API for ZIPs
+    the table doesn't have.
+    """
+    zip_code = zip_code.strip()
+    coords = zip_centroids.lookup(zip_code)
+    if coords:
+        return coords
+    return geocode_cache.get_or_fetch(
+        normalize_key("zip", zip_code),
+        lambda: _google_geocode(
+            {"address": zip_code, "components": "country:US|postal_code:" + zip_code},
+            f"ZIP {zip_code}"
+        )
+    )
+
+def get_coordinates_from_address(address: str, **cache_options) -> Optional[Tuple[float, float]]:
+    """
+    Get latitude and longitude from an address string, via the geocode cache then Google Geocoding API.
+    cache_options are passed to GeocodeCache.get_or_fetch.
+    """
+    return geocode_cache.get_or_fetch(
+        normalize_key("address", address),
+        lambda: _google_geocode(
+            {"address": address, "components": "country:US"},
+            f"address {address}"
+        ),
+        **cache_options
+    )
+
+def parse_city_state(location: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """City and state code from a long_location like "New Orleans, LA 70163" """
+    parts = [part.strip() for part in (location or "").split(",")]
+    if len(parts) != 2:
+        return None, None
+    state_parts = parts[1].split()
+    return parts[0], (state_parts[0] if state_parts else None)
 
-def get_coordinates_from_address(address: str) -> Optional[Tuple[float, float]]:
-    """Get latitude and longitude from an address string using Google Geocoding API."""
+def geocode_addresses(addresses: Iterable[str]) -> Dict[str, Optional[Tuple[float, float]]]:
+    """
+    Geocode many addresses at once: each distinct address is looked up
+    once, cached ones are read from the geocode cache in one query, the
+    rest go to Google up to GEOCODE_CONCURRENCY at a time, and the new
+    answers are cached in one transaction at the end.
+    """
+    distinct = list(dict.fromkeys(address for address in addresses if address))
+    if not distinct:
+        return {}
+    uncached = geocode_cache.preload([normalize_key("address", address) for address in distinct])
+    pending_writes = []
+    
+    def lookup(address: str) -> Optional[Tuple[float, float]]:
+        return get_coordinates_from_address(
+            address,
+            check_db=normalize_key("address", address) not in uncached,
+            pending_writes=pending_writes
+        )
+    
+    workers = min(max(1, settings.GEOCODE_CONCURRENCY), len(distinct))
     try:
-        logger.info(f"Looking up address: {address}")
-        
-        # Verify API key is not empty
-        if not settings.GOOGLE_MAPS_API_KEY:
-            logger.error("Google Maps API key is not set")
-            return None
-        
-        # Build the Google Geocoding API URL
-        base_url = "https://maps.googleapis.com/maps/api/geocode/json"
-        params = {
-            "address": address,
-            "components": "country:US",
-            "key": settings.GOOGLE_MAPS_API_KEY
-        }
-        
-        # Debug info
-        logger.info(f"Using Google Maps API Key: {settings.GOOGLE_MAPS_API_KEY[:10]}...")
-        
-        # Make the API request
-        response = requests.get(base_url, params=params)
-        
-        # Log the full URL for debugging (with key partially redacted)
-        debug_url = response.url.replace(settings.GOOGLE_MAPS_API_KEY, settings.GOOGLE_MAPS_API_KEY[:10] + "...")
-        logger.info(f"Request URL: {debug_url}")
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Debug response
-        logger.info(f"Google API Response Status: {data.get('status')}")
-        if data.get('error_message'):
-            logger.error(f"Google API Error: {data.get('error_message')}")
-        logger.info(f"Full Response: {data}")
-        
-        if data["status"] == "OK" and data["results"]:
-            location = data["results"][0]["geometry"]["location"]
-            lat, lon = location["lat"], location["lng"]
-            logger.info(f"Found coordinates for address {address}: ({lat}, {lon})")
-            return (float(lat), float(lon))
-        
-        logger.error(f"No location found for address: {address}")
-        return None
-        
-    except Exception as e:
-        logger.error(f"Error looking up address {address}: {str(e)}")
-        return None
+        if workers == 1:
+            return {address: lookup(address) for address in distinct}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geocode") as executor:
+            return dict(zip(distinct, executor.map(lookup, distinct)))
+    finally:
+        geocode_cache.put_many(pending_writes)
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate distance between two points in miles using Haversine formula"""
-    R = 3959.87433  # Earth's radius in miles
+    R = EARTH_RADIUS_MILES
 
     lat1, lon1 = radians(lat1), radians(lon1)
     lat2, lon2 = radians(lat2), radians(lon2)
@@ -104,6 +157,34 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     distance = R * c
     return distance
 
+def bounding_box(lat: float, lon: float, radius_miles: float) -> Tuple[float, float, float, float]:
+    """
+    Return (min_lat, max_lat, min_lon, max_lon) enclosing every point within
+    radius_miles of (lat, lon). Used as a cheap, index-friendly SQL prefilter
+    before the exact haversine check.
+    """
+    angular_radius = radius_miles / EARTH_RADIUS_MILES
+    lat_delta = degrees(angular_radius)
+    min_lat = max(lat - lat_delta, -90.0)
+    max_lat = min(lat + lat_delta, 90.0)
+
+    # Near the poles (or for huge radii) the box spans every longitude
+    cos_lat = cos(radians(lat))
+    if min_lat <= -90.0 or max_lat >= 90.0 or sin(angular_radius) >= cos_lat:
+        return min_lat, max_lat, -180.0, 180.0
+
+    lon_delta = degrees(asin(sin(angular_radius) / cos_lat))
+    return min_lat, max_lat, max(lon - lon_delta, -180.0), min(lon + lon_delta, 180.0)
+
+def haversine_distances(lat: float, lon: float, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """Vectorized haversine: distances in miles from (lat, lon) to each (lats[i], lons[i])"""
+    lat1, lon1 = radians(lat), radians(lon)
+    lat2 = np.radians(np.asarray(lats, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lons, dtype=np.float64))
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
 def is_within_radius(job_zip: str, search_zip: str, radius_miles: float = 150.0) -> bool:
     """Check if a job's location is within the specified radius of the search location."""
     distance = calculate_distance(job_zip, search_zip)
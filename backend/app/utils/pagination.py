@@ -0,0 +1,39 @@
+# backend/app/utils/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode(cursor: str) -> dict:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    return json.loads(raw)
+
+def encode_cursor(posted_date: Optional[datetime], job_id: int) -> str:
+    """Opaque cursor pointing just past the given (posted_date, id) row"""
+    return _encode({"p": posted_date.isoformat() if posted_date else None, "i": job_id})
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Inverse of encode_cursor. Raises ValueError for malformed cursors."""
+    try:
+        payload = _decode(cursor)
+        posted_date = datetime.fromisoformat(payload["p"]) if payload["p"] else None
+        return posted_date, int(payload["i"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def encode_rank_cursor(rank: float, job_id: int) -> str:
+    """Opaque cursor pointing just past the given (rank, id) search result"""
+    return _encode({"r": rank, "i": job_id})
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """Inverse of encode_rank_cursor. Raises ValueError for malformed cursors."""
+    try:
+        payload = _decode(cursor)
+        return float(payload["r"]), int(payload["i"])
+    except Exception:
+        raise ValueError("Invalid cursor")
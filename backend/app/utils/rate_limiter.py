@@ -0,0 +1,22 @@
+# backend/app/utils/rate_limiter.py
+
+import threading
+import time
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart, across threads"""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
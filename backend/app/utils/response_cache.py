@@ -0,0 +1,115 @@
+# backend/app/utils/response_cache.py
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from ..core.config import settings
+from .table_versions import on_table_change
+
+class ResponseCache:
+    """
+    Bounded TTL + LRU cache of serialized response bodies. Keys carry the
+    version of the table the response was built from, so a write anywhere
+    makes old entries unreachable; writes committed by this process also
+    clear the cache outright. Concurrent misses on one key are coalesced
+    into a single computation.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, float]]" = OrderedDict()
+        # key -> future for the computation in progress (event loop only)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Bumped by clear(), so results computed before an invalidation
+        # are not stored after it
+        self._generation = 0
+        # clear() runs from worker threads when they commit writes
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    async def get_or_compute(self, key: Hashable, version: Optional[int], compute: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        Cached body for (key, version), awaiting compute() on a miss.
+        version None (table version unknown) bypasses the cache.
+        """
+        if version is None:
+            return await compute()
+        request_key, key = key, (version, key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = asyncio.get_running_loop().create_future()
+                generation = self._generation
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            try:
+                # shield: a cancelled follower must not cancel the shared result
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                # The leader was cancelled (its client went away), not this
+                # request: start over, leading a new computation or joining one
+                if flight.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.get_or_compute(request_key, version, compute)
+                raise
+
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # Followers re-raise it; don't log it as unretrieved
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if not flight.cancelled() and flight.exception() is None and generation == self._generation:
+                    self._entries[key] = (flight.result(), time.monotonic() + self.ttl)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                        self._stats["evictions"] += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = round((stats["hits"] + stats["coalesced"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+# GET /jobs pages and /jobs/search/location results
+listing_cache = ResponseCache(
+    max_size=settings.RESPONSE_CACHE_SIZE,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+on_table_change("jobs", listing_cache.clear)
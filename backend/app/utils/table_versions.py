@@ -0,0 +1,81 @@
+# backend/app/utils/table_versions.py
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.table_version_model import TableVersion
+
+# table name -> (version, updated_at, expires_at); lets most requests learn
+# the current version without touching the database
+_versions: Dict[str, Tuple[int, Optional[datetime], float]] = {}
+_versions_lock = threading.Lock()
+
+# table name -> callbacks run after a write to it commits in this process
+_listeners: Dict[str, List[Callable[[], None]]] = {}
+
+def on_table_change(table_name: str, callback: Callable[[], None]):
+    """Call callback() whenever this process commits a write to table_name"""
+    _listeners.setdefault(table_name, []).append(callback)
+
+def _forget(table_name: str):
+    with _versions_lock:
+        _versions.pop(table_name, None)
+
+def _changed(table_name: str):
+    _forget(table_name)
+    for callback in _listeners.get(table_name, []):
+        try:
+            callback()
+        except Exception as e:
+            print(f"Error in change listener for {table_name}: {str(e)}")
+
+def bump_table_version(session: Session, table_name: str):
+    """
+    Mark table_name as changed. Runs in the caller's transaction, so the new
+    version becomes visible exactly when the write it describes commits.
+    """
+    now = datetime.now(timezone.utc)
+    updated = session.query(TableVersion).filter(TableVersion.table_name == table_name).update(
+        {TableVersion.version: TableVersion.version + 1, TableVersion.updated_at: now},
+        synchronize_session=False
+    )
+    if not updated:
+        session.add(TableVersion(table_name=table_name, version=1, updated_at=now))
+    # Drop our memoized copy once the write is committed (or abandoned)
+    event.listen(session, "after_commit", lambda s: _changed(table_name), once=True)
+    event.listen(session, "after_rollback", lambda s: _forget(table_name), once=True)
+
+async def get_table_version(table_name: str) -> Optional[Tuple[int, Optional[datetime]]]:
+    """
+    (version, last modified) of table_name, or None if it can't be read.
+    Reads are memoized for TABLE_VERSION_CACHE_SECONDS, which bounds how
+    long another process's write can go unnoticed; writes made by this
+    process are seen at once.
+    """
+    now = time.monotonic()
+    with _versions_lock:
+        cached = _versions.get(table_name)
+    if cached is not None and cached[2] > now:
+        return cached[0], cached[1]
+
+    try:
+        async with AsyncSessionLocal() as session:
+            row = (await session.execute(
+                select(TableVersion.version, TableVersion.updated_at).where(TableVersion.table_name == table_name)
+            )).first()
+    except Exception as e:
+        print(f"Error reading version of {table_name}: {str(e)}")
+        return None
+    # No row yet means the table has not been written since versioning began
+    version, updated_at = row if row else (0, None)
+    if updated_at is not None and updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+
+    with _versions_lock:
+        _versions[table_name] = (version, updated_at, now + settings.TABLE_VERSION_CACHE_SECONDS)
+    return version, updated_at
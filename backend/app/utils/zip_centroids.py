@@ -0,0 +1,146 @@
+# backend/app/utils/zip_centroids.py
+
+import csv
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# One row per possible 5-digit ZIP, so a lookup is an array index
+TABLE_SIZE = 100000
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "zip_centroids.npy"
+
+def table_path() -> Path:
+    """
+    The table file: $ZIP_CENTROIDS_PATH, else DEFAULT_PATH. Not a setting,
+    so the image build can run build_table() without the app's API keys
+    and database URL.
+    """
+    return Path(os.environ.get("ZIP_CENTROIDS_PATH") or DEFAULT_PATH)
+
+def _zip_index(zip_code: str) -> Optional[int]:
+    """Row for "78701" or "78701-1234", None for anything else"""
+    zip_code = zip_code.strip()
+    if len(zip_code) == 10 and zip_code[5] == "-" and zip_code[6:].isdigit():
+        zip_code = zip_code[:5]
+    if len(zip_code) != 5 or not zip_code.isdigit():
+        return None
+    return int(zip_code)
+
+def build_table(output: Path = None, source: str = None) -> int:
+    """
+    Write the ZIP -> (latitude, longitude) table as a float32 .npy array of
+    TABLE_SIZE rows, NaN where there is no ZIP. `source` is a GeoNames
+    postal code file (tab-separated, like US.txt from
+    download.geonames.org/export/zip/); without it the same data is loaded
+    through pgeocode, which downloads it once. Returns the ZIPs written.
+    """
+    output = Path(output or table_path())
+    table = np.full((TABLE_SIZE, 2), np.nan, dtype=np.float32)
+    if source:
+        with open(source, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f, delimiter="\t"):
+                index = _zip_index(row[1]) if len(row) > 10 else None
+                if index is not None and row[9] and row[10]:
+                    table[index] = (float(row[9]), float(row[10]))
+    else:
+        import pgeocode
+        frame = pgeocode.Nominatim("us").query_postal_code([f"{n:05d}" for n in range(TABLE_SIZE)])
+        table[:, 0] = frame["latitude"].to_numpy(dtype=np.float32)
+        table[:, 1] = frame["longitude"].to_numpy(dtype=np.float32)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Replace atomically; other workers may have the old file mapped
+    temporary = output.with_suffix(f".{os.getpid()}.tmp.npy")
+    np.save(temporary, table)
+    os.replace(temporary, output)
+    return int(np.count_nonzero(~np.isnan(table[:, 0])))
+
+class ZipCentroids:
+    """
+    Offline ZIP -> centroid lookups from the table built by build_table().
+    The file is memory-mapped on first use, so every worker process
+    shares one copy through the page cache and a lookup is one array read.
+    The Docker image builds the table (app/scripts/build_zip_centroids.py).
+    A missing table disables lookups (callers fall back to Google) and,
+    with ZIP_CENTROIDS_AUTO_BUILD, starts building it in the background.
+    """
+
+    def __init__(self):
+        self._table: Optional[np.ndarray] = None
+        self._loaded = False
+        self._building = False
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def _load(self) -> Optional[np.ndarray]:
+        if self._loaded:
+            return self._table
+        with self._lock:
+            if self._loaded:
+                return self._table
+            path = table_path()
+            try:
+                table = np.load(path, mmap_mode="r")
+                if table.shape != (TABLE_SIZE, 2):
+                    raise ValueError(f"unexpected shape {table.shape}")
+                self._table = table
+                logger.info(f"Loaded ZIP centroid table from {path}")
+            except FileNotFoundError:
+                logger.warning(f"ZIP centroid table {path} not found; ZIP lookups will use Google")
+                from ..core.config import settings
+                if settings.ZIP_CENTROIDS_AUTO_BUILD and not self._building:
+                    self._building = True
+                    threading.Thread(target=self._build, daemon=True).start()
+            except Exception as e:
+                logger.error(f"Could not load ZIP centroid table {path}: {str(e)}")
+            self._loaded = True
+            return self._table
+
+    def _build(self):
+        try:
+            count = build_table()
+            logger.info(f"Built ZIP centroid table with {count} ZIPs")
+            self.reload()
+        except Exception as e:
+            logger.error(f"Could not build ZIP centroid table: {str(e)}")
+        finally:
+            self._building = False
+
+    def reload(self):
+        """Map the table file again on next use (after it was rebuilt)"""
+        with self._lock:
+            self._table = None
+            self._loaded = False
+
+    def lookup(self, zip_code: str) -> Optional[Tuple[float, float]]:
+        """(latitude, longitude) for a ZIP, or None if the table has no entry"""
+        table = self._load()
+        index = _zip_index(zip_code or "")
+        if table is None or index is None:
+            return None
+        latitude, longitude = table[index]
+        if np.isnan(latitude):
+            with self._lock:
+                self._stats["misses"] += 1
+            return None
+        with self._lock:
+            self._stats["hits"] += 1
+        return round(float(latitude), 5), round(float(longitude), 5)
+
+    def stats(self) -> Dict[str, float]:
+        table = self._load()
+        with self._lock:
+            stats = dict(self._stats)
+        stats["loaded"] = table is not None
+        stats["path"] = str(table_path())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+zip_centroids = ZipCentroids()
@@ -0,0 +1,62 @@
+# backend/benchmarks/compare.py
+
+"""
+Compare two benchmark result files route by route.
+
+    python -m benchmarks.compare results/base.json results/head.json --threshold 10
+
+Exits with status 1 if any route's p50 or p95 regressed by more than
+--threshold percent, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+# Metrics where a higher value is worse
+GATED = ("p50_ms", "p95_ms")
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before * 100
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(f"{baseline.get('git_commit')} -> {candidate.get('git_commit')}")
+    if baseline.get("config") != candidate.get("config"):
+        print(f"Warning: configs differ\n  {baseline.get('config')}\n  {candidate.get('config')}")
+
+    regressions = []
+    # In run order
+    for route in dict.fromkeys([*candidate["routes"], *baseline["routes"]]):
+        before = baseline["routes"].get(route)
+        after = candidate["routes"].get(route)
+        if before is None or after is None:
+            print(f"{route:<44} only in {'candidate' if before is None else 'baseline'}")
+            continue
+        cells = []
+        for metric in METRICS:
+            delta = change(before.get(metric), after.get(metric))
+            cells.append(f"{metric} {after.get(metric)} ({delta:+.1f}%)" if delta is not None else f"{metric} {after.get(metric)}")
+            if metric in GATED and delta is not None and delta > args.threshold:
+                regressions.append(f"{route} {metric} {delta:+.1f}%")
+        print(f"{route:<44} " + "  ".join(cells))
+
+    if regressions:
+        print("\nRegressions over {:g}%:\n  ".format(args.threshold) + "\n  ".join(regressions))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
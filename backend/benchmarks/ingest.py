@@ -0,0 +1,294 @@
+# backend/benchmarks/ingest.py
+
+"""
+Offline ingest benchmark.
+
+Runs sync_jobs (TheirStack fetch -> dedupe -> classify -> geocode ->
+map, with rendering -> DB write) for N synthetic postings, with the
+providers answered by benchmarks/replay.py, and reports time per stage,
+provider call counts and rows/sec.
+
+    cd backend
+    python -m benchmarks.ingest --postings 2000
+    python -m benchmarks.ingest --postings 2000 --latency theirstack=0.5,google_geocoding=0.08,openai=1.2
+    python -m benchmarks.ingest --live --record fixtures.json      # real keys, saves the answers
+    python -m benchmarks.ingest --fixtures fixtures.json           # replays them, no network
+
+Each run uses a fresh SQLite database unless --database-url is given.
+--runs 2 repeats the sync against the same database, which measures the
+unchanged-posting path.
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds per request when --latency is not given; roughly what the real
+# services take from a typical host
+DEFAULT_LATENCY = {"theirstack": 0.4, "google_geocoding": 0.06, "openai": 0.9}
+
+TITLE_BASES = [
+    "Roofer", "Roofing Laborer", "Roofing Foreman", "Roofing Sales Representative",
+    "Commercial Roofing Estimator", "Roofing Project Manager", "Production Coordinator",
+    "Shingle Installer", "Metal Roofing Installer", "Roofing Superintendent",
+    "Roof Inspector", "Gutter Installer", "Roofing Crew Lead", "Storm Damage Sales Consultant",
+]
+TITLE_SUFFIXES = ["", "", "", " - Immediate Hire", " | $25/hr", " (Full Time)", " II", " - Residential", " - Commercial"]
+STATES = ["TX", "FL", "GA", "NC", "TN", "AZ", "CO", "IL", "LA", "OK", "AL", "SC"]
+WORDS = (
+    "roof shingle metal crew safety harness ladder install repair inspect estimate customer "
+    "residential commercial storm damage insurance claim flashing gutter underlayment decking "
+    "vent ridge valley warranty schedule team lead travel truck license bonus training"
+).split()
+
+def synthetic_postings(count: int, random_seed: int = 42, duplicate_rate: float = 0.05) -> List[Dict[str, Any]]:
+    """
+    TheirStack-shaped postings, newest first, dated within the sync window.
+    About duplicate_rate of them are syndicated copies of an earlier posting
+    (new id, same title/company/place, lightly edited description).
+    """
+    rng = random.Random(random_seed)
+    now = datetime.now(timezone.utc)
+    cities = [(f"City{n}", STATES[n % len(STATES)], f"{70000 + n * 37 % 29999:05d}") for n in range(250)]
+    postings = []
+    for n in range(count):
+        if postings and rng.random() < duplicate_rate:
+            copy = dict(rng.choice(postings))
+            copy["id"] = 10_000_000 + n
+            copy["description"] = copy["description"].replace(" the ", " our ", 1) + "\n\nApply today."
+            copy["source_url"] = f"https://boards.example.com/{n}"
+            postings.append(copy)
+            continue
+        city, state, postal_code = rng.choice(cities)
+        paragraphs = [
+            " ".join(rng.choices(WORDS, k=rng.randint(40, 90))).capitalize() + "."
+            for _ in range(rng.randint(3, 6))
+        ]
+        bullets = "\n".join(f"- {' '.join(rng.choices(WORDS, k=rng.randint(3, 7)))}" for _ in range(rng.randint(3, 8)))
+        postings.append({
+            "id": 1_000_000 + n,
+            "job_title": rng.choice(TITLE_BASES) + rng.choice(TITLE_SUFFIXES),
+            "company": f"Synthetic Roofing {rng.randint(1, max(1, count // 10))}",
+            "description": f"## About the role\n\n{paragraphs[0]}\n\n**Requirements**\n\n{bullets}\n\n" + "\n\n".join(paragraphs[1:]),
+            "long_location": f"{city}, {state} {postal_code}",
+            "date_posted": (now - timedelta(minutes=rng.randint(0, 60 * 24 * 25))).date().isoformat(),
+            "source_url": f"https://jobs.example.com/{n}",
+            "latitude": None,
+            "longitude": None,
+        })
+    postings.sort(key=lambda posting: posting["date_posted"], reverse=True)
+    return postings
+
+class StageTimer:
+    """Calls and cumulative seconds per pipeline stage (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    entry = self.stages.setdefault(stage, {"calls": 0, "seconds": 0.0})
+                    entry["calls"] += 1
+                    entry["seconds"] += elapsed
+        return timed
+
+    def patch(self, stack: ExitStack, stage: str, owner, name: str):
+        from unittest import mock
+        stack.enter_context(mock.patch.object(owner, name, self.wrap(stage, getattr(owner, name))))
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: {"calls": entry["calls"], "seconds": round(entry["seconds"], 3)} for stage, entry in self.stages.items()}
+
+# (stage, module path, attribute); geocode_lookup calls run inside geocode
+# on several threads, and map covers render
+STAGES = [
+    ("fetch", "app.services.theirstack_api", "TheirStackFetcher.fetch_jobs"),
+    ("dedupe", "app.services.theirstack_api", "find_duplicates"),
+    ("classify", "app.services.theirstack_api", "classify_job_titles"),
+    ("geocode", "app.services.theirstack_api", "geocode_addresses"),
+    ("geocode_lookup", "app.utils.location_utils", "get_coordinates_from_address"),
+    ("map", "app.services.theirstack_api", "map_job_data"),
+    ("render", "app.services.theirstack_api", "render_description"),
+    ("write", "app.services.theirstack_api", "upsert_jobs"),
+]
+
+def parse_latency(value: str) -> Dict[str, float]:
+    """--latency value: svc=seconds overrides per service, a bare number sets every service"""
+    latency = dict(DEFAULT_LATENCY)
+    for item in (value or "").split(","):
+        if not item.strip():
+            continue
+        if "=" not in item:
+            latency = dict.fromkeys(latency, float(item))
+            continue
+        service, seconds = item.split("=")
+        latency[service.strip()] = float(seconds)
+    return latency
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--postings", type=int, default=1000, help="Synthetic postings served by TheirStack")
+    parser.add_argument("--duplicates", type=float, default=0.05, help="Share of postings that are syndicated copies")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--page-size", type=int, default=100, help="THEIRSTACK_PAGE_SIZE for the run")
+    parser.add_argument("--latency", default="", help="Per-request seconds, e.g. theirstack=0.4,google_geocoding=0.06,openai=0.9, or one number for every service (0 for none)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Latency jitter as a fraction of --latency")
+    parser.add_argument("--no-rate-limits", action="store_true", help="Lift the TheirStack and OpenAI request rate limits")
+    parser.add_argument("--fixtures", help="Replay recorded answers from this file instead of synthesizing them")
+    parser.add_argument("--live", action="store_true", help="Call the real providers (needs API keys in the environment)")
+    parser.add_argument("--record", help="Save every answer served to this fixtures file")
+    parser.add_argument("--database-url", help="Database to sync into (default: a fresh SQLite file)")
+    parser.add_argument("--runs", type=int, default=1, help="Syncs to run back to back against the same database")
+    parser.add_argument("--output", help="Write the results as JSON here")
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's own output")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{workdir.name}/ingest.sqlite"
+
+    from .run import app_environment
+    os.environ.update(app_environment(database_url, response_cache=True))
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from app.core.config import settings
+    from app.core.database import init_db
+    from app.services import theirstack_api
+    from .replay import Cassette, ReplayLayer, SyntheticProviders
+
+    fixtures = Cassette.load(args.fixtures) if args.fixtures else None
+    if fixtures is not None and fixtures.meta:
+        # Replay has to ask for the same pages that were recorded
+        args.postings = fixtures.meta.get("postings", args.postings)
+        args.page_size = fixtures.meta.get("page_size", args.page_size)
+
+    settings.SYNC_MAX_JOBS = args.postings
+    settings.THEIRSTACK_PAGE_SIZE = args.page_size
+    if args.no_rate_limits:
+        from app.utils import job_classifier
+        settings.THEIRSTACK_RATE_LIMIT_PER_SECOND = 0
+        job_classifier._rate_limiter.interval = 0.0
+    # Fetcher settings are read when it is built
+    theirstack_api._fetcher = None
+
+    if args.live:
+        source = None
+    elif fixtures is not None:
+        source = fixtures
+    else:
+        source = SyntheticProviders(synthetic_postings(args.postings, args.seed, args.duplicates))
+    recorder = Cassette(meta={"postings": args.postings, "page_size": args.page_size}) if args.record else None
+    layer = ReplayLayer(source, parse_latency(args.latency), args.jitter, recorder, args.seed)
+
+    quiet = open(os.devnull, "w") if not args.verbose else None
+    if args.verbose:
+        init_db()
+    else:
+        for name in ("app", "httpx"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        _quietly(quiet, init_db)
+
+    runs = []
+    with layer.installed():
+        for run in range(1, args.runs + 1):
+            timer = StageTimer()
+            before = layer.stats()
+            counts: Dict[str, int] = {}
+            with ExitStack() as stack:
+                for stage, module_path, attribute in STAGES:
+                    owner = importlib.import_module(module_path)
+                    *path, name = attribute.split(".")
+                    for part in path:
+                        owner = getattr(owner, part)
+                    timer.patch(stack, stage, owner, name)
+                started = time.perf_counter()
+                sync = lambda: theirstack_api.sync_jobs("full", report=lambda **progress: counts.update(progress))
+                synced = sync() if args.verbose else _quietly(quiet, sync)
+                elapsed = time.perf_counter() - started
+            after = layer.stats()
+            providers = {
+                service: {metric: round(after[service][metric] - before[service][metric], 3) for metric in after[service]}
+                for service in after
+            }
+            runs.append({
+                "run": run,
+                "seconds": round(elapsed, 3),
+                "synced": synced,
+                "rows_per_second": round(synced / elapsed, 1) if elapsed else None,
+                "postings_per_second": round(counts.get("fetched", 0) / elapsed, 1) if elapsed else None,
+                "counts": counts,
+                "stages": timer.report(),
+                "providers": providers,
+            })
+            print_run(runs[-1])
+
+    if recorder is not None:
+        recorder.save(args.record)
+        print(f"\nRecorded {len(recorder.entries)} answers to {args.record}")
+
+    if args.output:
+        from .run import git_commit
+        result = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": database_url.split(":", 1)[0].split("+", 1)[0],
+            "config": {
+                "postings": args.postings,
+                "duplicates": args.duplicates,
+                "seed": args.seed,
+                "page_size": args.page_size,
+                "latency": layer.latency if source is not None else None,
+                "jitter": args.jitter,
+                "rate_limits": not args.no_rate_limits,
+                "source": "live" if args.live else ("fixtures" if fixtures is not None else "synthetic"),
+            },
+            "runs": runs,
+        }
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(result, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+    workdir.cleanup()
+
+def _quietly(devnull, function: Callable):
+    """Run function with the pipeline's prints discarded"""
+    from contextlib import redirect_stdout
+    with redirect_stdout(devnull):
+        return function()
+
+def print_run(run: Dict[str, Any]):
+    print(f"\nRun {run['run']}: synced {run['synced']} rows in {run['seconds']:.2f}s ({run['rows_per_second']} rows/s)")
+    counts = run["counts"]
+    print("  " + ", ".join(f"{name} {counts[name]}" for name in ("fetched", "new", "changed", "unchanged", "duplicates", "errors") if name in counts))
+    for stage, entry in run["stages"].items():
+        share = entry["seconds"] / run["seconds"] * 100 if run["seconds"] else 0
+        print(f"  {stage:<10} {entry['calls']:>7} calls {entry['seconds']:>9.3f}s  ({share:5.1f}% of wall, summed over threads)")
+    for service, entry in run["providers"].items():
+        print(f"  {service:<18} {int(entry['calls']):>6} calls {entry['seconds']:>9.3f}s  misses {int(entry['misses'])}")
+
+if __name__ == "__main__":
+    main()
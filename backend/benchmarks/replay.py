@@ -0,0 +1,274 @@
+# backend/benchmarks/replay.py
+
+"""
+Record/replay layer for the ingest pipeline's providers: TheirStack and
+Google Geocoding (both called through requests) and OpenAI (called
+through the SDK's httpx client).
+
+Requests are intercepted at the transport, so the app code runs
+unchanged, and answered from one of:
+
+- a fixtures file recorded earlier (Cassette),
+- a synthetic generator (SyntheticProviders), or
+- the live APIs (record mode, needs real keys).
+
+Every answered request can be recorded to a fixtures file, and each
+service can be given an artificial latency to stand in for the network.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+SERVICES = ("theirstack", "google_geocoding", "openai")
+
+# status, body
+Answer = Tuple[int, str]
+
+def service_for(url: str) -> Optional[str]:
+    host = urlsplit(url).hostname or ""
+    if host.endswith("theirstack.com"):
+        return "theirstack"
+    if host == "maps.googleapis.com":
+        return "google_geocoding"
+    if host == "api.openai.com":
+        return "openai"
+    return None
+
+def request_key(service: str, url: str, body: Optional[bytes]) -> str:
+    """What identifies a request for replay (API keys and ids left out)"""
+    if service == "google_geocoding":
+        params = sorted((name, value) for name, value in parse_qsl(urlsplit(url).query) if name != "key")
+        return json.dumps(params)
+    payload = json.loads(body or b"{}")
+    if service == "openai":
+        payload = {"model": payload.get("model"), "input": payload.get("messages", [{}])[-1].get("content")}
+    return json.dumps(payload, sort_keys=True)
+
+class Cassette:
+    """Recorded answers keyed by (service, request_key), stored as JSON"""
+
+    def __init__(self, entries: Dict[Tuple[str, str], Answer] = None, meta: Dict[str, Any] = None):
+        self.entries = dict(entries or {})
+        self.meta = dict(meta or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            {(entry["service"], entry["key"]): (entry["status"], entry["body"]) for entry in data["entries"]},
+            data.get("meta")
+        )
+
+    def save(self, path: str):
+        with self._lock:
+            entries = [
+                {"service": service, "key": key, "status": status, "body": body}
+                for (service, key), (status, body) in self.entries.items()
+            ]
+        with open(path, "w") as f:
+            json.dump({"meta": self.meta, "entries": entries}, f)
+
+    def get(self, service: str, key: str) -> Optional[Answer]:
+        with self._lock:
+            return self.entries.get((service, key))
+
+    def put(self, service: str, key: str, answer: Answer):
+        with self._lock:
+            self.entries[(service, key)] = answer
+
+# Keywords -> category the synthetic classifier answers with, first match wins
+CLASSIFIER_RULES = (
+    (re.compile(r"sales|estimator|account|consultant", re.I), "SALES"),
+    (re.compile(r"manager|foreman|supervisor|superintendent|director", re.I), "MANAGEMENT"),
+    (re.compile(r"production|coordinator|scheduler", re.I), "PRODUCTION"),
+)
+
+class SyntheticProviders:
+    """
+    Plausible answers generated from the request: TheirStack pages are
+    slices of `postings`, addresses geocode to a stable point derived from
+    their hash, and titles are classified by keyword.
+    """
+
+    def __init__(self, postings: List[Dict[str, Any]]):
+        self.postings = postings
+
+    def __call__(self, service: str, url: str, body: Optional[bytes]) -> Answer:
+        return getattr(self, service)(url, body)
+
+    def theirstack(self, url: str, body: Optional[bytes]) -> Answer:
+        payload = json.loads(body)
+        postings = self.postings
+        if payload.get("posted_at_gte"):
+            postings = [posting for posting in postings if posting["date_posted"] >= payload["posted_at_gte"]]
+        start = payload["page"] * payload["limit"]
+        return 200, json.dumps({"data": postings[start:start + payload["limit"]]})
+
+    def google_geocoding(self, url: str, body: Optional[bytes]) -> Answer:
+        address = dict(parse_qsl(urlsplit(url).query)).get("address", "")
+        digest = int(hashlib.sha1(address.lower().encode("utf-8")).hexdigest()[:8], 16)
+        location = {"lat": 25 + (digest % 2300) / 100, "lng": -124 + (digest // 2300 % 5500) / 100}
+        return 200, json.dumps({"status": "OK", "results": [{"geometry": {"location": location}}]})
+
+    def openai(self, url: str, body: Optional[bytes]) -> Answer:
+        payload = json.loads(body)
+        titles = json.loads(payload["messages"][-1]["content"])
+        answers = {
+            key: next((category for pattern, category in CLASSIFIER_RULES if pattern.search(title)), "LABOR")
+            for key, title in titles.items()
+        }
+        return 200, json.dumps({
+            "id": "chatcmpl-replay",
+            "object": "chat.completion",
+            "created": 0,
+            "model": payload.get("model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(answers)},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        })
+
+class ReplayLayer:
+    """
+    Answers intercepted provider requests from `source` (a Cassette, a
+    callable like SyntheticProviders, or None for the live APIs), sleeping
+    `latency[service]` seconds (+/- `jitter` as a fraction) per request
+    when not live. Answers are recorded to `recorder` if given.
+    """
+
+    def __init__(
+        self,
+        source=None,
+        latency: Dict[str, float] = None,
+        jitter: float = 0.0,
+        recorder: Cassette = None,
+        random_seed: int = 0
+    ):
+        self.source = source
+        self.latency = dict(latency or {})
+        self.jitter = jitter
+        self.recorder = recorder
+        self._random = random.Random(random_seed)
+        self._lock = threading.Lock()
+        self.calls = {service: 0 for service in SERVICES}
+        self.misses = {service: 0 for service in SERVICES}
+        self.seconds = {service: 0.0 for service in SERVICES}
+
+    def _delay(self, service: str) -> float:
+        delay = self.latency.get(service, 0.0)
+        if delay and self.jitter:
+            with self._lock:
+                delay *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+    def answer(self, service: str, url: str, body: Optional[bytes], live: Callable[[], Answer]) -> Answer:
+        started = time.perf_counter()
+        key = request_key(service, url, body)
+        if self.source is None:
+            answer = live()
+        else:
+            time.sleep(self._delay(service))
+            if isinstance(self.source, Cassette):
+                answer = self.source.get(service, key)
+                if answer is None:
+                    with self._lock:
+                        self.misses[service] += 1
+                    answer = (404, json.dumps({"error": f"No recorded {service} response for this request"}))
+            else:
+                answer = self.source(service, url, body)
+        if self.recorder is not None and answer[0] == 200:
+            self.recorder.put(service, key, answer)
+        with self._lock:
+            self.calls[service] += 1
+            self.seconds[service] += time.perf_counter() - started
+        return answer
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                service: {
+                    "calls": self.calls[service],
+                    "misses": self.misses[service],
+                    "seconds": round(self.seconds[service], 3),
+                }
+                for service in SERVICES
+            }
+
+    @contextmanager
+    def installed(self) -> Iterator["ReplayLayer"]:
+        """Route provider traffic through this layer for the duration"""
+        from unittest import mock
+        from app.utils import job_classifier
+
+        original_get_adapter = requests.Session.get_adapter
+        layer = self
+
+        class Adapter(BaseAdapter):
+            def __init__(self, session, url):
+                super().__init__()
+                self.session = session
+                self.url = url
+
+            def send(self, request, **kwargs):
+                def live():
+                    response = original_get_adapter(self.session, self.url).send(request, **kwargs)
+                    return response.status_code, response.text
+                body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+                status, text = layer.answer(service_for(request.url), request.url, body, live)
+                response = requests.Response()
+                response.status_code = status
+                response._content = text.encode("utf-8")
+                response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+                response.encoding = "utf-8"
+                response.url = request.url
+                response.request = request
+                return response
+
+            def close(self):
+                pass
+
+        def get_adapter(session, url):
+            if service_for(url) is None:
+                return original_get_adapter(session, url)
+            return Adapter(session, url)
+
+        class Transport(httpx.BaseTransport):
+            def __init__(self):
+                self.live_transport = httpx.HTTPTransport()
+
+            def handle_request(self, request: httpx.Request) -> httpx.Response:
+                def live():
+                    response = self.live_transport.handle_request(request)
+                    response.read()
+                    return response.status_code, response.text
+                status, text = layer.answer("openai", str(request.url), request.read(), live)
+                return httpx.Response(status, headers={"Content-Type": "application/json"}, content=text.encode("utf-8"))
+
+            def close(self):
+                self.live_transport.close()
+
+        from openai import OpenAI
+        from app.core.config import settings
+        client = OpenAI(api_key=settings.OPENAI_API_KEY, http_client=httpx.Client(transport=Transport()), max_retries=0)
+        with mock.patch.object(requests.Session, "get_adapter", get_adapter), \
+                mock.patch.object(job_classifier, "_client", client):
+            try:
+                yield self
+            finally:
+                client.close()
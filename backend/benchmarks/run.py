@@ -0,0 +1,304 @@
+# backend/benchmarks/run.py
+
+"""
+Endpoint benchmarks.
+
+Seeds a database with synthetic companies and jobs, boots app.main:app
+under uvicorn against it, and drives each route with concurrent requests.
+Reports p50/p95/p99 latency and throughput per route and saves the
+results as JSON, so runs on two commits can be compared with
+benchmarks/compare.py.
+
+    cd backend
+    python -m benchmarks.run --jobs 10000
+    python -m benchmarks.run --jobs 1000000 --requests 500 --concurrency 16
+    python -m benchmarks.compare results/base.json results/head.json
+
+By default the database is a SQLite file under benchmarks/data/, seeded
+once per (jobs, companies, seed) and reused afterwards. --database-url
+points the run at any database the app accepts instead, e.g. Postgres in
+a container; it is seeded if it has no benchmark jobs yet.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+API = "/api/v1/jobs"
+
+class Scenario(NamedTuple):
+    name: str
+    # rng -> (method, path, JSON body or None)
+    build: Callable[[random.Random], Tuple[str, str, Optional[dict]]]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=10000, help="Synthetic jobs to seed")
+    parser.add_argument("--companies", type=int, default=500, help="Synthetic companies to seed")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and requests")
+    parser.add_argument("--database-url", help="Database to benchmark against (default: a SQLite file under benchmarks/data/)")
+    parser.add_argument("--reseed", action="store_true", help="Delete and re-seed the default SQLite database")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per route")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per route before measuring")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--offsets", default="0,100,1000,10000,100000", help="GET /jobs skip values (those past --jobs are dropped)")
+    parser.add_argument("--radii", default="10,25,50,100", help="search/location radii in miles")
+    parser.add_argument("--response-cache", action="store_true", help="Leave the in-process listing cache on (off by default, so every request does the work)")
+    parser.add_argument("--output", help="Results JSON path (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--verbose", action="store_true", help="Echo the server's output")
+    return parser.parse_args(argv)
+
+def git_commit() -> Optional[str]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BACKEND_DIR, capture_output=True, text=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def app_environment(database_url: str, response_cache: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": database_url,
+        "DB_ECHO": "false",
+        # init_db already ran while seeding
+        "FAST_STARTUP": "true",
+        # Never download the ZIP table mid-run; ZIPs it lacks use the seeded geocode cache
+        "ZIP_CENTROIDS_AUTO_BUILD": "false",
+    })
+    # Required settings; never used, since no route under test calls out
+    for key in ("THEIRSTACK_API_KEY", "OPENAI_API_KEY", "STRIPE_SECRET_KEY", "GOOGLE_MAPS_API_KEY"):
+        env.setdefault(key, "benchmark")
+    if not response_cache:
+        env["RESPONSE_CACHE_SIZE"] = "0"
+    return env
+
+def prepare_database(args) -> Tuple[str, Dict]:
+    """Database URL and ZIP table, seeding the database if needed"""
+    database_url = args.database_url
+    if database_url is None:
+        path = BENCHMARKS_DIR / "data" / f"bench-{args.jobs}-{args.companies}-{args.seed}.sqlite"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if args.reseed and path.exists():
+            path.unlink()
+        database_url = f"sqlite:///{path}"
+
+    # The app reads its settings at import time
+    os.environ.update(app_environment(database_url, args.response_cache))
+    sys.path.insert(0, str(BACKEND_DIR))
+    from sqlalchemy import func
+    from app.core.database import SessionLocal, init_db
+    from app.models.job_model import Job
+    from .seed import seed, zip_codes
+
+    init_db()
+    with SessionLocal() as session:
+        seeded = session.query(func.count(Job.id)).filter(Job.external_id.like("bench-%")).scalar()
+    if seeded == 0:
+        print(f"Seeding {args.jobs} jobs and {args.companies} companies...")
+        started = time.perf_counter()
+        seed(args.jobs, args.companies, args.seed)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s")
+    elif seeded != args.jobs:
+        raise SystemExit(f"Database already has {seeded} benchmark jobs, not {args.jobs}; use a fresh database or --reseed")
+    else:
+        print(f"Reusing {seeded} seeded jobs")
+    return database_url, zip_codes(args.seed)
+
+def scenarios(args, zips: Dict) -> List[Scenario]:
+    zip_list = sorted(zips)
+    result = []
+    for offset in (int(value) for value in args.offsets.split(",") if value.strip()):
+        if offset < args.jobs:
+            result.append(Scenario(
+                f"GET /jobs?skip={offset}",
+                lambda rng, offset=offset: ("GET", f"{API}/?skip={offset}&limit=25", None)
+            ))
+    result.append(Scenario(
+        "GET /jobs/{id}",
+        lambda rng: ("GET", f"{API}/{rng.randint(1, args.jobs)}", None)
+    ))
+    for radius in (float(value) for value in args.radii.split(",") if value.strip()):
+        result.append(Scenario(
+            f"GET /jobs/search/location?radius={radius:g}",
+            lambda rng, radius=radius: ("GET", f"{API}/search/location?zip_code={rng.choice(zip_list)}&radius={radius:g}", None)
+        ))
+    # Last: every write invalidates the caches the reads above might use
+    result.append(Scenario(
+        "POST /jobs",
+        lambda rng: ("POST", f"{API}/", {
+            "job_title": "Benchmark Roofer",
+            "description": "Install and repair **residential** roofs.\n\n- Two years experience\n- Own tools",
+            "location": "Benchmark",
+            "postal_code": rng.choice(zip_list),
+        })
+    ))
+    return result
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    import numpy as np
+    values = np.asarray(latencies, dtype=np.float64)
+    if not values.size:
+        return {"requests": 0, "errors": errors}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "requests": int(values.size),
+        "errors": errors,
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "mean_ms": round(float(values.mean()), 2),
+        "min_ms": round(float(values.min()), 2),
+        "max_ms": round(float(values.max()), 2),
+        "throughput_rps": round(values.size / elapsed, 1) if elapsed else None,
+    }
+
+async def drive(client, scenario: Scenario, count: int, concurrency: int, rng: random.Random) -> Tuple[List[float], int, float]:
+    """Send count requests, concurrency at a time; (latencies in ms, errors, wall seconds)"""
+    latencies = []
+    errors = 0
+    remaining = iter(range(count))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            method, path, body = scenario.build(rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+async def run_scenarios(base_url: str, args, zips: Dict) -> Dict[str, Dict]:
+    import httpx
+    # The app configures INFO logging, which would log every request
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    rng = random.Random(args.seed)
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        for scenario in scenarios(args, zips):
+            if args.warmup:
+                await drive(client, scenario, args.warmup, args.concurrency, rng)
+            latencies, errors, elapsed = await drive(client, scenario, args.requests, args.concurrency, rng)
+            results[scenario.name] = summarize(latencies, errors, elapsed)
+            print_row(scenario.name, results[scenario.name])
+    return results
+
+def print_row(name: str, stats: Dict):
+    if not stats["requests"]:
+        print(f"{name:<44} all {stats['errors']} requests failed")
+        return
+    print(
+        f"{name:<44} p50 {stats['p50_ms']:>8.2f}  p95 {stats['p95_ms']:>8.2f}  p99 {stats['p99_ms']:>8.2f} ms"
+        f"  {stats['throughput_rps']:>8.1f} req/s  errors {stats['errors']}"
+    )
+
+def start_server(database_url: str, args, port: int, log) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", "1", "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=app_environment(database_url, args.response_cache),
+        stdout=None if args.verbose else log,
+        stderr=subprocess.STDOUT if not args.verbose else None,
+    )
+
+def wait_until_ready(process: subprocess.Popen, base_url: str, timeout: float = 60):
+    import httpx
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server not ready after {timeout}s")
+
+def main(argv=None):
+    args = parse_args(argv)
+    database_url, zips = prepare_database(args)
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryFile(mode="w+") as log:
+        process = start_server(database_url, args, port, log)
+        try:
+            wait_until_ready(process, base_url)
+            print(f"\nServer up on {base_url}; {args.requests} requests per route, concurrency {args.concurrency}\n")
+            routes = asyncio.run(run_scenarios(base_url, args, zips))
+        except Exception:
+            if not args.verbose:
+                log.seek(0)
+                print(log.read()[-4000:], file=sys.stderr)
+            raise
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    commit = git_commit()
+    result = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": database_url.split(":", 1)[0].split("+", 1)[0],
+        "config": {
+            "jobs": args.jobs,
+            "companies": args.companies,
+            "seed": args.seed,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "response_cache": args.response_cache,
+        },
+        "routes": routes,
+    }
+    output = Path(args.output) if args.output else (
+        BENCHMARKS_DIR / "results" / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+if __name__ == "__main__":
+    main()
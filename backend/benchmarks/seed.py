@@ -0,0 +1,141 @@
+# backend/benchmarks/seed.py
+
+"""
+Synthetic data for the benchmarks: companies, jobs spread around a few
+metro areas, and geocode cache entries for every ZIP the jobs use, so
+location searches and POST /jobs never call Google.
+
+Imports the app, so DATABASE_URL and the API key settings must be in the
+environment first (run.py takes care of that).
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+# Rows per INSERT batch
+SEED_BATCH_SIZE = 5000
+
+# (ZIP prefix, city, state, latitude, longitude)
+METROS = [
+    ("787", "Austin", "TX", 30.2672, -97.7431),
+    ("770", "Houston", "TX", 29.7604, -95.3698),
+    ("752", "Dallas", "TX", 32.7767, -96.7970),
+    ("303", "Atlanta", "GA", 33.7490, -84.3880),
+    ("328", "Orlando", "FL", 28.5383, -81.3792),
+    ("331", "Miami", "FL", 25.7617, -80.1918),
+    ("850", "Phoenix", "AZ", 33.4484, -112.0740),
+    ("802", "Denver", "CO", 39.7392, -104.9903),
+    ("606", "Chicago", "IL", 41.8781, -87.6298),
+    ("282", "Charlotte", "NC", 35.2271, -80.8431),
+    ("372", "Nashville", "TN", 36.1627, -86.7816),
+    ("701", "New Orleans", "LA", 29.9511, -90.0715),
+]
+
+# ZIPs generated per metro, each a small offset from the metro center
+ZIPS_PER_METRO = 40
+
+TITLES = [
+    "Roofer", "Roofing Foreman", "Roofing Sales Representative", "Roof Inspector",
+    "Commercial Roofing Estimator", "Roofing Project Manager", "Shingle Installer",
+    "Metal Roofing Installer", "Roofing Laborer", "Production Manager",
+]
+EMPLOYMENT_TYPES = ["full_time", "part_time", "contract", None]
+REMOTE_TYPES = ["onsite", "hybrid", None]
+
+WORDS = (
+    "roof shingle metal crew safety harness ladder install repair inspect estimate "
+    "customer residential commercial storm damage insurance claim flashing gutter "
+    "underlayment tear-off decking vent ridge valley warranty schedule team lead"
+).split()
+
+def zip_codes(random_seed: int) -> Dict[str, Tuple[str, str, float, float]]:
+    """ZIP -> (city, state, latitude, longitude), about 0-50 miles from each metro center"""
+    rng = random.Random(random_seed)
+    zips = {}
+    for prefix, city, state, latitude, longitude in METROS:
+        for n in range(ZIPS_PER_METRO):
+            zips[f"{prefix}{n:02d}"] = (
+                city, state,
+                round(latitude + rng.uniform(-0.7, 0.7), 4),
+                round(longitude + rng.uniform(-0.7, 0.7), 4),
+            )
+    return zips
+
+def _description(rng: random.Random) -> Tuple[str, str]:
+    """(HTML description, plain-text snippet)"""
+    paragraphs = [" ".join(rng.choices(WORDS, k=rng.randint(30, 80))).capitalize() + "." for _ in range(rng.randint(2, 5))]
+    html = "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+    return html, " ".join(paragraphs)[:150]
+
+def _job_rows(rng: random.Random, count: int, start: int, companies: int, zips: Dict) -> List[dict]:
+    from app.models.job_model import JobFunction
+    functions = list(JobFunction) + [None]
+    now = datetime.now(timezone.utc)
+    zip_list = list(zips)
+    rows = []
+    for n in range(start, start + count):
+        postal_code = rng.choice(zip_list)
+        city, state, latitude, longitude = zips[postal_code]
+        description, snippet = _description(rng)
+        rows.append({
+            "external_id": f"bench-{n}",
+            "company_id": rng.randint(1, companies) if companies else None,
+            "job_title": rng.choice(TITLES),
+            "description": description,
+            "snippet": snippet,
+            "location": f"{city}, {state} {postal_code}",
+            "city": city,
+            "state": state,
+            "postal_code": postal_code,
+            "latitude": latitude + rng.uniform(-0.05, 0.05),
+            "longitude": longitude + rng.uniform(-0.05, 0.05),
+            "salary_range": f"${rng.randint(15, 40)}-${rng.randint(41, 80)}/hr",
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "remote_type": rng.choice(REMOTE_TYPES),
+            "job_function": rng.choice(functions),
+            "posted_date": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+            "is_active": rng.random() < 0.9,
+            "application_link": f"https://example.com/jobs/{n}",
+        })
+    return rows
+
+def seed(jobs: int, companies: int, random_seed: int = 42) -> Dict[str, Tuple[str, str, float, float]]:
+    """
+    Create the schema and insert `companies` companies and `jobs` jobs.
+    Returns the ZIP table (also written to the geocode cache).
+    """
+    from sqlalchemy import insert
+    from app.core.database import SessionLocal, get_engine, init_db
+    from app.models.company_model import Company
+    from app.models.geocode_cache_model import GeocodeCacheEntry
+    from app.models.job_model import Job
+    from app.utils.table_versions import bump_table_version
+
+    rng = random.Random(random_seed)
+    init_db()
+    engine = get_engine()
+    zips = zip_codes(random_seed)
+
+    with engine.begin() as connection:
+        connection.execute(insert(GeocodeCacheEntry), [
+            {"key": f"zip:{postal_code}", "latitude": latitude, "longitude": longitude}
+            for postal_code, (_, _, latitude, longitude) in zips.items()
+        ])
+        if companies:
+            connection.execute(insert(Company), [
+                {"name": f"Bench Roofing {n}", "website": f"https://roofing{n}.example.com", "is_active": True}
+                for n in range(1, companies + 1)
+            ])
+
+    for start in range(0, jobs, SEED_BATCH_SIZE):
+        with engine.begin() as connection:
+            connection.execute(insert(Job), _job_rows(rng, min(SEED_BATCH_SIZE, jobs - start), start, companies, zips))
+        print(f"Seeded {min(start + SEED_BATCH_SIZE, jobs)}/{jobs} jobs", end="\r", flush=True)
+    print()
+
+    # Give the jobs table a version so conditional GETs and caches engage
+    with SessionLocal() as session:
+        bump_table_version(session, "jobs")
+        session.commit()
+    return zips
@@ -0,0 +1,22 @@
+# backend/tests/conftest.py
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Settings are read when app.core.config is imported, so point the app at
+# a scratch SQLite database and dummy API keys before any test imports it
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.sqlite"
+for key in ("THEIRSTACK_API_KEY", "OPENAI_API_KEY", "STRIPE_SECRET_KEY", "GOOGLE_MAPS_API_KEY"):
+    os.environ[key] = "test-key"
+os.environ["DB_ECHO"] = "false"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema once for the whole run"""
+    from app.core.database import init_db
+    init_db()
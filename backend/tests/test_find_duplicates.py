@@ -0,0 +1,87 @@
+# backend/tests/test_find_duplicates.py
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.job_model import Job
+from app.services.theirstack_api import find_duplicates
+from app.utils.job_fingerprint import fingerprint, hamming_distance
+
+DESCRIPTION = (
+    "We are hiring an experienced commercial roofer to install and repair flat and "
+    "pitched roofs across the metro area. You will read blueprints, lead a small crew, "
+    "follow OSHA safety standards, and work with project managers to keep jobs on "
+    "schedule. Three years of roofing experience, a valid driver license, and the "
+    "ability to lift sixty pounds are required. We offer weekly pay, health insurance, "
+    "paid time off, and a company truck for crew leads."
+)
+
+def posting(description: str = DESCRIPTION, **fields):
+    return {
+        "job_title": "Commercial Roofer",
+        "company": "Acme Roofing",
+        "long_location": "Austin, TX",
+        "description": description,
+        **fields
+    }
+
+REPOST = posting(DESCRIPTION.replace("weekly pay", "biweekly pay") + " Apply today!")
+UNRELATED = posting(
+    "Join our office team as a receptionist. Answer phones, greet visitors, schedule "
+    "estimates for customers, and keep the front desk organized. Microsoft Office "
+    "experience preferred; bilingual candidates are encouraged to apply."
+)
+
+@pytest.fixture
+def session():
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        session.commit()
+        yield session
+
+def store(session, external_id: str, job_data: dict, is_active: bool = True):
+    key, simhash = fingerprint(job_data)
+    session.add(Job(
+        external_id=external_id, job_title=job_data["job_title"], is_active=is_active,
+        fingerprint=key, description_simhash=simhash
+    ))
+    session.commit()
+
+def test_fingerprints_of_a_repost_are_close():
+    (key, simhash), (repost_key, repost_simhash) = fingerprint(posting()), fingerprint(REPOST)
+    assert key == repost_key
+    assert hamming_distance(int(simhash, 16), int(repost_simhash, 16)) <= 8
+    assert fingerprint(posting(job_title="Roofing Estimator"))[0] != key
+
+def test_incoming_repost_collapses_onto_first_posting(session):
+    fingerprints = {"ts-a": fingerprint(posting()), "ts-b": fingerprint(REPOST)}
+    assert find_duplicates(session, fingerprints, stored_ids=set()) == {"ts-b": "ts-a"}
+
+def test_different_description_under_same_key_is_kept(session):
+    fingerprints = {"ts-a": fingerprint(posting()), "ts-b": fingerprint(UNRELATED)}
+    assert fingerprints["ts-a"][0] == fingerprints["ts-b"][0]
+    assert find_duplicates(session, fingerprints, stored_ids=set()) == {}
+
+def test_different_key_is_kept(session):
+    fingerprints = {"ts-a": fingerprint(posting()), "ts-b": fingerprint(posting(long_location="Dallas, TX"))}
+    assert find_duplicates(session, fingerprints, stored_ids=set()) == {}
+
+def test_active_stored_job_is_the_original(session):
+    store(session, "ts-old", posting())
+    fingerprints = {"ts-new": fingerprint(REPOST)}
+    assert find_duplicates(session, fingerprints, stored_ids=set()) == {"ts-new": "ts-old"}
+
+def test_inactive_stored_job_is_ignored(session):
+    store(session, "ts-old", posting(), is_active=False)
+    fingerprints = {"ts-new": fingerprint(REPOST)}
+    assert find_duplicates(session, fingerprints, stored_ids=set()) == {}
+
+def test_stored_posting_is_never_collapsed(session):
+    store(session, "ts-old", posting())
+    store(session, "ts-stored", REPOST)
+    # ts-stored is in the batch under its own id: it stays, and the new
+    # copy of it collapses onto a kept posting rather than removing it
+    fingerprints = {"ts-new": fingerprint(REPOST), "ts-stored": fingerprint(REPOST)}
+    duplicates = find_duplicates(session, fingerprints, stored_ids={"ts-stored"})
+    assert "ts-stored" not in duplicates
+    assert duplicates["ts-new"] in {"ts-old", "ts-stored"}
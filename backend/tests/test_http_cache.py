@@ -0,0 +1,66 @@
+# backend/tests/test_http_cache.py
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.main import app
+from app.models.job_model import Job
+from app.utils.table_versions import bump_table_version
+
+@pytest.fixture
+def client():
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        bump_table_version(session, "jobs")
+        session.commit()
+    with TestClient(app) as client:
+        yield client
+
+def add_job(title: str):
+    with SessionLocal() as session:
+        session.add(Job(job_title=title, is_active=True))
+        bump_table_version(session, "jobs")
+        session.commit()
+
+def titles(response):
+    return [job["job_title"] for job in response.json()["items"]]
+
+def test_unchanged_listing_revalidates_with_304(client):
+    add_job("Roofer")
+    first = client.get("/api/v1/jobs/")
+    assert first.status_code == 200
+    assert "max-age" in first.headers["cache-control"]
+
+    again = client.get("/api/v1/jobs/", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == first.headers["etag"]
+
+    # A CDN may strip the weak prefix; the tag still matches
+    strong = client.get("/api/v1/jobs/", headers={"If-None-Match": first.headers["etag"].removeprefix("W/")})
+    assert strong.status_code == 304
+
+def test_if_modified_since_revalidates_with_304(client):
+    add_job("Roofer")
+    first = client.get("/api/v1/jobs/")
+    again = client.get("/api/v1/jobs/", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert again.status_code == 304
+
+def test_write_invalidates_validators_and_cached_pages(client):
+    add_job("Roofer")
+    first = client.get("/api/v1/jobs/")
+    assert titles(first) == ["Roofer"]
+
+    add_job("Estimator")
+    after = client.get("/api/v1/jobs/", headers={"If-None-Match": first.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["etag"] != first.headers["etag"]
+    assert sorted(titles(after)) == ["Estimator", "Roofer"]
+
+def test_etag_is_per_query(client):
+    add_job("Roofer")
+    one = client.get("/api/v1/jobs/", params={"limit": 1})
+    two = client.get("/api/v1/jobs/", params={"limit": 2})
+    assert one.headers["etag"] != two.headers["etag"]
+    assert client.get("/api/v1/jobs/", params={"limit": 2}, headers={"If-None-Match": one.headers["etag"]}).status_code == 200
@@ -0,0 +1,91 @@
+# backend/tests/test_job_listing.py
+
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.api import job_API
+from app.core.database import SessionLocal, init_db
+from app.main import app
+from app.models.job_model import Job
+from app.utils.table_versions import bump_table_version
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+def replace_jobs(jobs=(), sql_rows=0, undated_rows=0):
+    """
+    Swap the jobs table for `jobs`, plus `sql_rows` rows dated by the
+    database itself and `undated_rows` with a NULL posted_date
+    """
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        session.add_all(jobs)
+        for i in range(sql_rows):
+            session.execute(text("INSERT INTO jobs (job_title, is_active) VALUES (:title, 1)"), {"title": f"sql {i}"})
+        for i in range(undated_rows):
+            session.execute(
+                text("INSERT INTO jobs (job_title, is_active, posted_date) VALUES (:title, 1, NULL)"),
+                {"title": f"undated {i}"}
+            )
+        bump_table_version(session, "jobs")
+        session.commit()
+
+def all_ids():
+    with SessionLocal() as session:
+        return [job_id for (job_id,) in session.query(Job.id)]
+
+def page_through(client, limit):
+    """Job ids in the order cursor paging returns them"""
+    ids, cursor = [], None
+    # A cursor that revisits rows could page forever; give up well past the end
+    for _ in range(len(all_ids()) + 2):
+        params = {"limit": limit, "include_total": False}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/v1/jobs/", params=params).json()
+        ids += [job["id"] for job in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            return ids
+    pytest.fail(f"Cursor paging had not finished after {len(ids)} items")
+
+def test_cursor_paging_visits_each_job_once(client):
+    tie = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+    replace_jobs(
+        [Job(job_title=f"tie {i}", is_active=True, posted_date=tie) for i in range(10)]
+        + [Job(job_title=f"dated {i}", is_active=True, posted_date=datetime(2025, 1, 1 + i, tzinfo=timezone.utc)) for i in range(10)],
+        sql_rows=10
+    )
+    # Rows dated by SQLite's CURRENT_TIMESTAMP share one second and have
+    # no microseconds until init_db normalizes them
+    init_db()
+    with mock.patch.object(job_API, "get_coordinates", return_value=(30.27, -97.74)):
+        for i in range(5):
+            response = client.post("/api/v1/jobs/", json={
+                "job_title": f"posted {i}", "description": "Roofer", "location": "Austin, TX", "postal_code": "78701"
+            })
+            assert response.status_code == 200
+
+    ids = page_through(client, limit=4)
+    assert len(ids) == len(set(ids))
+    assert sorted(ids) == sorted(all_ids())
+    assert ids == page_through(client, limit=100)
+
+def test_cursor_paging_reaches_undated_jobs(client):
+    replace_jobs(
+        [Job(job_title=f"dated {i}", is_active=True, posted_date=datetime(2025, 1, 1 + i, tzinfo=timezone.utc)) for i in range(5)],
+        undated_rows=4
+    )
+    with SessionLocal() as session:
+        undated = sorted((job_id for (job_id,) in session.query(Job.id).filter(Job.posted_date.is_(None))), reverse=True)
+
+    ids = page_through(client, limit=3)
+    assert len(ids) == 9 and len(set(ids)) == 9
+    # Undated jobs come last, newest id first
+    assert ids[5:] == undated
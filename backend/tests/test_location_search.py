@@ -0,0 +1,71 @@
+# backend/tests/test_location_search.py
+
+from unittest import mock
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import job_API
+from app.core.database import SessionLocal
+from app.main import app
+from app.models.job_model import Job
+from app.utils.location_utils import bounding_box, haversine_distances
+from app.utils.table_versions import bump_table_version
+
+# (latitude, longitude, radius in miles): mid-latitude, far north, near the
+# pole (the box spans every longitude), and a radius wider than the US
+ORIGINS = [(30.27, -97.74, 25), (61.22, -149.9, 150), (89.5, 10.0, 100), (39.0, -98.0, 1500)]
+
+@pytest.mark.parametrize("lat, lon, radius", ORIGINS)
+def test_bounding_box_keeps_every_point_within_radius(lat, lon, radius):
+    rng = np.random.default_rng(7)
+    # Points scattered to roughly twice the radius around the origin
+    spread = 2 * radius / 69.0
+    lats = np.clip(lat + rng.uniform(-spread, spread, 20000), -90, 90)
+    lons = np.clip(lon + rng.uniform(-spread, spread, 20000) / max(np.cos(np.radians(lat)), 0.05), -180, 180)
+
+    exact = haversine_distances(lat, lon, lats, lons) <= radius
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius)
+    in_box = (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+
+    assert exact.any() and not in_box.all()
+    # The prefilter may pass extra points, but never drops one in range
+    assert not (exact & ~in_box).any()
+
+def test_haversine_distances_match_known_distance():
+    # Austin to Dallas, about 182 miles
+    distance = haversine_distances(30.2672, -97.7431, [32.7767], [-96.7970])[0]
+    assert distance == pytest.approx(182, abs=2)
+
+def test_location_search_matches_exact_radius_nearest_first():
+    origin = (30.27, -97.74)
+    rng = np.random.default_rng(11)
+    lats = origin[0] + rng.uniform(-1, 1, 200)
+    lons = origin[1] + rng.uniform(-1, 1, 200)
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        session.add_all([
+            Job(job_title=f"Roofer {i}", is_active=True, latitude=float(lats[i]), longitude=float(lons[i]))
+            for i in range(200)
+        ])
+        # Retired and ungeocoded postings are never returned
+        session.add(Job(job_title="Retired", is_active=False, latitude=origin[0], longitude=origin[1]))
+        session.add(Job(job_title="Ungeocoded", is_active=True))
+        bump_table_version(session, "jobs")
+        session.commit()
+        jobs = session.query(Job.id, Job.latitude, Job.longitude).filter(Job.is_active.is_(True), Job.latitude.isnot(None)).all()
+
+    distances = haversine_distances(*origin, [job.latitude for job in jobs], [job.longitude for job in jobs])
+    expected = [jobs[i].id for i in np.argsort(distances, kind="stable") if distances[i] <= 30]
+    assert len(expected) > 20
+
+    with TestClient(app) as client, \
+            mock.patch.object(job_API.zip_centroids, "lookup", return_value=origin):
+        found = []
+        for skip in range(0, len(expected) + 10, 10):
+            response = client.get("/api/v1/jobs/search/location", params={"zip_code": "78701", "radius": 30, "skip": skip, "limit": 10})
+            assert response.status_code == 200
+            found += [job["id"] for job in response.json()]
+
+    assert found == expected
@@ -0,0 +1,98 @@
+# backend/tests/test_reclassify.py
+
+from unittest import mock
+
+import pytest
+
+from app.core.database import SessionLocal
+from app.models.job_model import Job
+from app.models.task_checkpoint_model import TaskCheckpoint
+from app.services import reclassify
+from app.services.reclassify import RECLASSIFY_TASK, reclassify_jobs
+from app.utils.table_versions import bump_table_version
+
+@pytest.fixture
+def job_ids():
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        session.query(TaskCheckpoint).delete()
+        jobs = [Job(job_title=f"Title {i}", is_active=True) for i in range(10)]
+        session.add_all(jobs)
+        bump_table_version(session, "jobs")
+        session.commit()
+        ids = sorted(job.id for job in jobs)
+    with mock.patch.object(reclassify.settings, "RECLASSIFY_CHUNK_SIZE", 3):
+        yield ids
+
+class FakeClassifier:
+    """Classifies every title as Operations, failing on the fail_on-th call"""
+
+    def __init__(self, fail_on: int = None):
+        self.fail_on = fail_on
+        self.titles = []
+        self.calls = 0
+
+    def __call__(self, titles):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise RuntimeError("classifier unavailable")
+        titles = list(titles)
+        self.titles.extend(titles)
+        return {title: "Operations" for title in titles}
+
+def run(classifier, **kwargs):
+    with mock.patch.object(reclassify, "classify_job_titles", classifier):
+        return reclassify_jobs(**kwargs)
+
+def checkpoint():
+    with SessionLocal() as session:
+        return session.get(TaskCheckpoint, RECLASSIFY_TASK)
+
+def classified_ids():
+    with SessionLocal() as session:
+        return sorted(job_id for job_id, in session.query(Job.id).filter(Job.job_function.isnot(None)))
+
+def test_interrupted_run_resumes_after_last_chunk(job_ids):
+    with pytest.raises(RuntimeError):
+        run(FakeClassifier(fail_on=3), scope="all")
+
+    saved = checkpoint()
+    assert saved.last_id == job_ids[5]
+    assert (saved.processed_count, saved.updated_count) == (6, 6)
+    assert saved.finished_at is None
+    assert classified_ids() == job_ids[:6]
+
+    classifier = FakeClassifier()
+    result = run(classifier, scope="all")
+    assert classifier.titles == ["Title 6", "Title 7", "Title 8", "Title 9"]
+    assert result["resumed"] is True
+    assert (result["total_jobs"], result["reclassified_count"]) == (10, 10)
+    assert classified_ids() == job_ids
+    assert checkpoint().finished_at is not None
+
+def test_restart_ignores_checkpoint(job_ids):
+    with pytest.raises(RuntimeError):
+        run(FakeClassifier(fail_on=2), scope="all")
+
+    classifier = FakeClassifier()
+    result = run(classifier, scope="all", restart=True)
+    assert len(classifier.titles) == 10
+    assert result["resumed"] is False
+    assert result["total_jobs"] == 10
+
+def test_different_scope_starts_over(job_ids):
+    with pytest.raises(RuntimeError):
+        run(FakeClassifier(fail_on=2), scope="all")
+
+    classifier = FakeClassifier()
+    result = run(classifier, scope="unclassified")
+    assert result["resumed"] is False
+    # Only the jobs the interrupted run did not reach are still unclassified
+    assert classifier.titles == [f"Title {i}" for i in range(3, 10)]
+
+def test_finished_run_is_not_resumed(job_ids):
+    run(FakeClassifier(), scope="all")
+    classifier = FakeClassifier()
+    result = run(classifier, scope="all")
+    assert result["resumed"] is False
+    assert len(classifier.titles) == 10
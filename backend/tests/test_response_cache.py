@@ -0,0 +1,139 @@
+# backend/tests/test_response_cache.py
+
+import asyncio
+
+import pytest
+
+from app.utils.response_cache import ResponseCache
+
+def counting_compute(calls, value=b"body", started=None, release=None):
+    async def compute():
+        calls.append(1)
+        if started is not None:
+            started.set()
+        if release is not None:
+            await release.wait()
+        return value
+    return compute
+
+def test_concurrent_misses_compute_once():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        calls, release = [], asyncio.Event()
+        compute = counting_compute(calls, release=release)
+        tasks = [asyncio.create_task(cache.get_or_compute("page", 1, compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        return cache, calls, results
+
+    cache, calls, results = asyncio.run(scenario())
+    assert results == [b"body"] * 5
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["size"]) == (1, 4, 1)
+
+def test_hit_after_compute_and_new_version_misses():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        calls = []
+        compute = counting_compute(calls)
+        await cache.get_or_compute("page", 1, compute)
+        await cache.get_or_compute("page", 1, compute)
+        await cache.get_or_compute("page", 2, compute)
+        return cache, calls
+
+    cache, calls = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+
+def test_cancelled_leader_hands_off_to_follower():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        calls, started, release = [], asyncio.Event(), asyncio.Event()
+        compute = counting_compute(calls, started=started, release=release)
+        leader = asyncio.create_task(cache.get_or_compute("page", 1, compute))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_compute("page", 1, compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return cache, calls, await follower
+
+    cache, calls, result = asyncio.run(scenario())
+    assert result == b"body"
+    # The follower took over and ran the computation itself
+    assert len(calls) == 2
+    assert cache.stats()["size"] == 1
+
+def test_cancelled_follower_leaves_leader_running():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        calls, started, release = [], asyncio.Event(), asyncio.Event()
+        compute = counting_compute(calls, started=started, release=release)
+        leader = asyncio.create_task(cache.get_or_compute("page", 1, compute))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_compute("page", 1, compute))
+        await asyncio.sleep(0)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        release.set()
+        return calls, await leader
+
+    calls, result = asyncio.run(scenario())
+    assert result == b"body"
+    assert len(calls) == 1
+
+def test_leader_error_reaches_followers_and_is_not_cached():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(cache.get_or_compute("page", 1, failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return cache, results
+
+    cache, results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert cache.stats()["size"] == 0
+
+def test_clear_during_compute_drops_the_stale_result():
+    async def scenario():
+        cache = ResponseCache(max_size=8, ttl=60)
+        calls, started, release = [], asyncio.Event(), asyncio.Event()
+        compute = counting_compute(calls, started=started, release=release)
+        task = asyncio.create_task(cache.get_or_compute("page", 1, compute))
+        await started.wait()
+        cache.clear()
+        release.set()
+        return cache, await task
+
+    cache, result = asyncio.run(scenario())
+    assert result == b"body"
+    assert cache.stats()["size"] == 0
+
+def test_lru_eviction_and_unknown_version_bypass():
+    async def scenario():
+        cache = ResponseCache(max_size=2, ttl=60)
+        calls = []
+        compute = counting_compute(calls)
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, 1, compute)
+        await cache.get_or_compute("x", None, compute)
+        await cache.get_or_compute("x", None, compute)
+        return cache, calls
+
+    cache, calls = asyncio.run(scenario())
+    stats = cache.stats()
+    assert (stats["size"], stats["evictions"]) == (2, 1)
+    assert len(calls) == 5
@@ -0,0 +1,135 @@
+# backend/tests/test_theirstack_sync.py
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+import requests
+
+from app.core.config import settings
+from app.core.database import SessionLocal, init_db
+from app.models.job_model import Job, JobFunction
+from app.models.sync_state_model import SyncState
+from app.services import theirstack_api
+from app.utils.job_fingerprint import fingerprint
+
+STORED_IDS = {"ts-1", "ts-2", "ts-3"}
+
+@pytest.fixture
+def stored_jobs():
+    """Three active TheirStack jobs, and nothing else, in the jobs table"""
+    init_db()
+    with SessionLocal() as session:
+        session.query(Job).delete()
+        session.add_all([
+            Job(external_id=external_id, job_title="Roofer", is_active=True, posted_date=datetime.now(timezone.utc))
+            for external_id in sorted(STORED_IDS)
+        ])
+        session.commit()
+
+def active_ids():
+    with SessionLocal() as session:
+        return {external_id for (external_id,) in session.query(Job.external_id).filter(Job.is_active.is_(True))}
+
+def run_full_sync(status: int, body: dict, api_key: str = "test-key"):
+    """sync_jobs("full") against a TheirStack that answers every page with (status, body)"""
+    fetcher = theirstack_api.TheirStackFetcher(api_key=api_key, max_retries=2, backoff_base=0, rate_per_second=0)
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode()
+    with mock.patch.object(theirstack_api, "get_fetcher", return_value=fetcher), \
+            mock.patch.object(fetcher.session, "post", return_value=response):
+        return theirstack_api.sync_jobs(mode="full")
+
+@pytest.mark.parametrize("status", [401, 429, 503])
+def test_failed_fetch_leaves_jobs_active(stored_jobs, status):
+    with pytest.raises(theirstack_api.TheirStackFetchError):
+        run_full_sync(status, {"error": "unavailable"})
+    assert active_ids() == STORED_IDS
+
+def test_missing_api_key_leaves_jobs_active(stored_jobs):
+    with pytest.raises(theirstack_api.TheirStackFetchError):
+        run_full_sync(200, {"data": []}, api_key="")
+    assert active_ids() == STORED_IDS
+
+def test_complete_empty_listing_retires_jobs(stored_jobs):
+    run_full_sync(200, {"data": []})
+    assert active_ids() == set()
+
+def test_job_listed_only_as_a_repost_stays_active(stored_jobs):
+    posting = {
+        "id": "ts-repost",
+        "job_title": "Roofer",
+        "company": "Acme Roofing",
+        "description": "Install and repair residential roofs across the metro area.",
+        "long_location": "Austin, TX 78701",
+        "date_posted": datetime.now(timezone.utc).date().isoformat(),
+    }
+    key, simhash = fingerprint(posting)
+    with SessionLocal() as session:
+        session.query(Job).filter(Job.external_id == "ts-1").update({Job.fingerprint: key, Job.description_simhash: simhash})
+        session.commit()
+    run_full_sync(200, {"data": [posting]})
+    assert active_ids() == {"ts-1"}
+
+class FakeTheirStack:
+    """Answers search requests from `postings` like TheirStack: posted_at_gte, date order, paging"""
+
+    def __init__(self, postings):
+        self.postings = postings
+
+    def __call__(self, url, **kwargs):
+        payload = kwargs["json"]
+        postings = [p for p in self.postings if p["date_posted"] >= payload.get("posted_at_gte", "")]
+        ascending = any(not order["desc"] for order in payload.get("order_by", []))
+        postings.sort(key=lambda p: p["date_posted"], reverse=not ascending)
+        start = payload["page"] * payload["limit"]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"data": postings[start:start + payload["limit"]]}).encode()
+        return response
+
+def test_capped_incremental_syncs_catch_up_from_the_first_run(stored_jobs):
+    today = datetime.now(timezone.utc).date()
+    postings = [
+        {
+            "id": f"p{i}",
+            "job_title": f"Roofer {i}",
+            "company": f"Company {i}",
+            "description": f"Posting number {i}",
+            "long_location": "Austin, TX 78701",
+            "latitude": 30.27,
+            "longitude": -97.74,
+            "date_posted": (today - timedelta(days=9 - i)).isoformat(),
+        }
+        for i in range(10)
+    ]
+    fetcher = theirstack_api.TheirStackFetcher(max_retries=1, rate_per_second=0)
+    with SessionLocal() as session:
+        session.query(SyncState).delete()
+        session.commit()
+    with mock.patch.object(theirstack_api, "get_fetcher", return_value=fetcher), \
+            mock.patch.object(fetcher.session, "post", FakeTheirStack(postings)), \
+            mock.patch.object(theirstack_api, "classify_job_titles", lambda titles: {}), \
+            mock.patch.object(theirstack_api, "classify_job_function", lambda title: None), \
+            mock.patch.object(settings, "SYNC_MAX_JOBS", 4), \
+            mock.patch.object(settings, "THEIRSTACK_PAGE_SIZE", 2):
+        for _ in range(3):
+            theirstack_api.sync_jobs(mode="incremental")
+    assert active_ids() >= {f"p{i}" for i in range(10)}
+
+def test_update_keeps_enrichment_a_failed_lookup_left_empty(stored_jobs):
+    with SessionLocal() as session:
+        session.query(Job).filter(Job.external_id == "ts-1").update({
+            Job.job_function: JobFunction.LABOR, Job.classified_by: "gpt", Job.latitude: 30.27, Job.longitude: -97.74
+        })
+        session.commit()
+        theirstack_api.upsert_jobs(session, [{
+            "external_id": "ts-1", "job_title": "Roofer (updated)",
+            "job_function": None, "classified_by": None, "latitude": None, "longitude": None
+        }])
+        session.commit()
+        job = session.query(Job).filter(Job.external_id == "ts-1").one()
+        assert job.job_title == "Roofer (updated)"
+        assert (job.job_function, job.classified_by, job.latitude, job.longitude) == (JobFunction.LABOR, "gpt", 30.27, -97.74)
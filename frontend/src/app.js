@@ -56,6 +56,9 @@ const App = () => {
     const [page, setPage] = useState(0);
     const [hasMore, setHasMore] = useState(true);
     const JOBS_PER_PAGE = 25;
+    const LOCATION_RESULTS_PER_PAGE = 100;
+    // { zipCode, radius, page, hasMore } while ZIP search results are shown
+    const [locationSearch, setLocationSearch] = useState(null);
 
     const fetchJobs = useCallback(async (pageToFetch = 0) => {
         setIsLoading(true);
@@ -96,13 +99,45 @@ const App = () => {
         fetchJobs(0);
     }, [fetchJobs]);
 
+    const fetchJobsNear = useCallback(async ({ zipCode, radius }, pageToFetch = 0) => {
+        setIsLoading(true);
+        try {
+            // Results come a page at a time, nearest first
+            const skip = pageToFetch * LOCATION_RESULTS_PER_PAGE;
+            const response = await fetch(
+                `${process.env.REACT_APP_API_URL}/api/v1/jobs/search/location?zip_code=${zipCode}&radius=${radius}&skip=${skip}&limit=${LOCATION_RESULTS_PER_PAGE}`
+            );
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const data = await response.json();
+            setFilteredJobs(prevJobs => (pageToFetch === 0 ? data : [...prevJobs, ...data]));
+            setLocationSearch({ zipCode, radius, page: pageToFetch, hasMore: data.length === LOCATION_RESULTS_PER_PAGE });
+            setError(null);
+        } catch (error) {
+            console.error('Error searching jobs:', error);
+            setError(error.message);
+            setFilteredJobs([]);
+            setLocationSearch(null);
+        } finally {
+            setIsLoading(false);
+        }
+    }, []);
+
     const handleLoadMore = useCallback(() => {
-        if (!isLoading && hasMore) {
+        if (isLoading) {
+            return;
+        }
+        if (locationSearch) {
+            if (locationSearch.hasMore) {
+                fetchJobsNear(locationSearch, locationSearch.page + 1);
+            }
+        } else if (hasMore) {
             const nextPage = page + 1;
             setPage(nextPage);
             fetchJobs(nextPage);
         }
-    }, [fetchJobs, isLoading, hasMore, page]);
+    }, [fetchJobs, fetchJobsNear, isLoading, hasMore, page, locationSearch]);
 
     const handleFilterChange = (jobFunction) => {
         if (!jobFunction) {
@@ -113,35 +148,29 @@ const App = () => {
         }
     };
 
-    const handleLocationChange = async (locationFilter) => {
-        setIsLoading(true);
-        try {
-            if (!locationFilter) {
-                setFilteredJobs(jobs);
-                setError(null);
-            } else {
-                const { zipCode, radius } = locationFilter;
-                const response = await fetch(
-                    `${process.env.REACT_APP_API_URL}/api/v1/jobs/search/location?zip_code=${zipCode}&radius=${radius}`
-                );
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status}`);
-                }
-                const data = await response.json();
-                setFilteredJobs(data);
-                setError(null);
-            }
-        } catch (error) {
-            console.error('Error searching jobs:', error);
-            setError(error.message);
-            setFilteredJobs([]);
-        } finally {
-            setIsLoading(false);
+    const handleLocationChange = (locationFilter) => {
+        if (!locationFilter) {
+            setLocationSearch(null);
+            setFilteredJobs(jobs);
+            setError(null);
+        } else {
+            fetchJobsNear(locationFilter, 0);
         }
     };
 
-    const handleJobClick = (job) => {
+    const handleJobClick = async (job) => {
+        // List items are summaries; show one right away, then the full job
         setSelectedJob(job);
+        try {
+            const response = await fetch(`${process.env.REACT_APP_API_URL}/api/v1/jobs/${job.id}`);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const fullJob = await response.json();
+            setSelectedJob(current => (current && current.id === job.id ? { ...current, ...fullJob } : current));
+        } catch (error) {
+            console.error('Error fetching job details:', error);
+        }
     };
 
     const handleCloseModal = () => {
@@ -165,7 +194,7 @@ const App = () => {
                                 handleJobClick={handleJobClick}
                                 error={error}
                                 isLoading={isLoading}
-                                hasMore={hasMore}
+                                hasMore={locationSearch ? locationSearch.hasMore : hasMore}
                                 onLoadMore={handleLoadMore}
                             />
                         } 
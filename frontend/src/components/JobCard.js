@@ -9,8 +9,10 @@ const JobCard = ({ job, onClick }) => {
     return tmp.textContent || tmp.innerText || '';
   };
 
-  // Get a preview of the description (first 150 chars, without HTML tags)
+  // Get a preview of the description (first 150 chars, without HTML tags).
+  // List endpoints send a precomputed snippet instead of the description.
   const getDescriptionPreview = () => {
+    if (job.snippet !== undefined && job.snippet !== null) return job.snippet;
     const plainText = stripHtml(job.description || '');
     return plainText.substring(0, 150) + (plainText.length > 150 ? '...' : '');
   };